@@ -2,6 +2,7 @@
 Django settings for StarWars_ToDo project.
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -70,6 +71,97 @@ DATABASES = {
 }
 
 
+# Caches
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'swapi': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.swapi_cache',
+        'TIMEOUT': None,
+    },
+}
+
+
+# SWAPI server; override with the SWAPI_BASE environment variable,
+# e.g. to point at `python manage.py fake_swapi`
+SWAPI_BASE = os.environ.get('SWAPI_BASE', 'https://www.swapi.tech/api')
+
+
+# SWAPI data cache
+# None keeps a separate in-memory cache in every worker process.
+# Set to a CACHES alias (e.g. 'swapi') to share one warmed catalog across workers.
+SWAPI_CACHE_ALIAS = None
+SWAPI_CACHE_TTL = 3600
+
+# Serve expired SWAPI data for up to SWAPI_MAX_STALENESS seconds while it is
+# refreshed in the background; older data is refetched before responding.
+SWAPI_STALE_WHILE_REVALIDATE = True
+SWAPI_MAX_STALENESS = 3600
+
+# After SWAPI_BREAKER_FAILURE_THRESHOLD consecutive failed requests an endpoint
+# is skipped (fallback names are used) for SWAPI_BREAKER_COOLDOWN seconds.
+SWAPI_BREAKER_FAILURE_THRESHOLD = 5
+SWAPI_BREAKER_COOLDOWN = 30
+
+# Keep-alive connections to SWAPI: per-host pools for up to
+# SWAPI_POOL_CONNECTIONS hosts, each keeping SWAPI_POOL_MAXSIZE connections.
+SWAPI_POOL_CONNECTIONS = 10
+SWAPI_POOL_MAXSIZE = 10
+
+# Timeouts and retries of SWAPI requests. Timeouts, 429 and 5xx responses are
+# retried with exponential backoff and jitter; other 4xx responses are not.
+# One /api/tasks/ request spends at most SWAPI_REQUEST_DEADLINE seconds upstream.
+SWAPI_CONNECT_TIMEOUT = 3.05
+SWAPI_READ_TIMEOUT = 10
+SWAPI_MAX_RETRIES = 3
+SWAPI_RETRY_BACKOFF = 0.25
+SWAPI_RETRY_BACKOFF_MAX = 4.0
+SWAPI_REQUEST_DEADLINE = 8
+
+# Name pools sample 50 items per endpoint (at most SWAPI_MAX_CRAWL_PAGES pages)
+# unless SWAPI_CRAWL_FULL_CATALOG is set. Crawls request up to
+# SWAPI_MAX_PAGE_SIZE items per page. With SWAPI_PARALLEL_CRAWL, pages after
+# the first are fetched by up to SWAPI_CRAWL_WORKERS threads.
+SWAPI_CRAWL_FULL_CATALOG = False
+SWAPI_MAX_CRAWL_PAGES = 3
+SWAPI_MAX_PAGE_SIZE = 100
+SWAPI_PARALLEL_CRAWL = False
+SWAPI_CRAWL_WORKERS = 4
+
+# Keep this many default (5-mission) responses pre-generated per worker process
+# and refill in the background below MISSION_BUFFER_LOW_WATER; 0 disables it.
+MISSION_BUFFER_SIZE = 0
+MISSION_BUFFER_LOW_WATER = None
+
+# Encoded seeded /api/tasks/ responses kept per worker process (0 disables).
+# Entries are dropped when the name pools change.
+MISSIONS_RESPONSE_CACHE_MAX_ENTRIES = 256
+MISSIONS_RESPONSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Extra mission themes for /api/tasks/?theme=, next to the built-in ones.
+# Each theme is a list of templates ({character}, {planet}, {starship},
+# {vehicle} placeholders) or {"template": ..., "weight": ...} objects;
+# MISSION_THEME_FILES are JSON files mapping theme names to such lists.
+MISSION_THEMES = {}
+MISSION_THEME_FILES = []
+
+# Offline catalog snapshot written by `python manage.py swapi_sync`.
+# With SWAPI_OFFLINE = True, random names come from the snapshot only.
+SWAPI_SNAPSHOT_PATH = BASE_DIR / 'swapi_snapshot.jsonl'
+SWAPI_OFFLINE = False
+
+# Load the name pools in a background thread when a server process starts,
+# so /healthz/ready can hold traffic until the worker is warm. Falls back to
+# SWAPI_SNAPSHOT_PATH (if present) when SWAPI cannot be crawled, and retries
+# every SWAPI_WARMUP_RETRY_INTERVAL seconds until every pool is loaded.
+SWAPI_WARMUP = False
+SWAPI_WARMUP_RETRY_INTERVAL = 30
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -0,0 +1,29 @@
+"""
+Production settings for API workers.
+
+Select with DJANGO_SETTINGS_MODULE=StarWars_ToDo.settings_production.
+Development-only apps (django_extensions) and the admin are left out, so
+workers import less at boot; the HTTP client is imported on first use.
+"""
+
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .settings import *  # noqa: F401,F403
+
+DEBUG = False
+
+# Never fall back to the development key committed in settings.py
+SECRET_KEY = os.environ.get('DJANGO_SECRET_KEY')
+if not SECRET_KEY:
+    raise ImproperlyConfigured("Set DJANGO_SECRET_KEY to use the production settings")
+
+ALLOWED_HOSTS = [host for host in os.environ.get('DJANGO_ALLOWED_HOSTS', '').split(',') if host]
+
+DEVELOPMENT_APPS = ('django.contrib.admin', 'django_extensions')
+
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in DEVELOPMENT_APPS]  # noqa: F405
+
+# Load the name pools before the worker reports ready at /healthz/ready
+SWAPI_WARMUP = True
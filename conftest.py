@@ -0,0 +1,9 @@
+import os
+
+import django
+from django.test.utils import setup_test_environment
+
+# Configure Django once so tests can use views, caches and management commands
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'StarWars_ToDo.settings')
+django.setup()
+setup_test_environment()
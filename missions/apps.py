@@ -4,3 +4,19 @@ from django.apps import AppConfig
 class MissionsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'missions'
+
+    def ready(self):
+        import sys
+        from django.conf import settings
+        from . import swapi, mission_buffer, serializers, warmup, themes
+        from . import task_generator  # noqa: F401 (registers the built-in themes)
+
+        swapi.configure_from_settings(settings)
+        mission_buffer.configure_from_settings(settings)
+        serializers.configure_from_settings(settings)
+        warmup.configure_from_settings(settings)
+        themes.configure_from_settings(settings)
+
+        # Only processes serving requests warm up, not migrate, tests, etc.
+        if warmup.WARMUP_ENABLED and warmup.should_warm_up(sys.argv):
+            warmup.start()
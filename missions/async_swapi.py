@@ -0,0 +1,135 @@
+import asyncio
+import logging
+
+from . import swapi
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+async def fetch_from_swapi_async(endpoint, page=1, *, limit=None):
+    """
+    Fetch one page from SWAPI without blocking the event loop.
+
+    The request runs fetch_from_swapi on a worker thread, so it shares the
+    process-wide keep-alive session, cache, retries and circuit breakers
+    with the synchronous client whichever event loop awaits it.
+
+    Args:
+        endpoint (str): API endpoint (people, planets, etc.)
+        page (int): Page number to fetch
+        limit (int): Page size (default: swapi.PAGE_SIZE)
+
+    Returns:
+        dict: API response data or None if failed
+    """
+    return await asyncio.to_thread(swapi.fetch_from_swapi, endpoint, page, limit=limit)
+
+
+async def get_all_items_async(endpoint, max_items=50, max_pages=None):
+    """
+    Get multiple items from an endpoint, fetching its pages concurrently.
+
+    Args:
+        endpoint (str): API endpoint
+        max_items (int): Maximum number of items to collect, or None for
+            the entire catalog
+        max_pages (int): Maximum number of pages to fetch (default:
+            MAX_CRAWL_PAGES, or no limit for the entire catalog)
+
+    Returns:
+        list: List of items or empty list if failed
+    """
+    if swapi.OFFLINE_MODE:
+        return swapi.get_all_items_from_endpoint(endpoint, max_items)
+
+    if max_pages is None:
+        max_pages = swapi.default_max_pages(max_items)
+
+    cache_key = swapi.items_cache_key(endpoint, max_items, max_pages)
+
+    cached = swapi.get_cached(
+        cache_key,
+        lambda: swapi._crawl_endpoint(endpoint, max_items, True, cache_key, keep_stale=True, max_pages=max_pages)
+    )
+    if cached is not None:
+        return cached
+
+    # Only one crawl per endpoint and limit is in flight on this loop
+    return await swapi.FLIGHTS.do_async(
+        cache_key,
+        lambda: _crawl_endpoint_async(endpoint, max_items, max_pages, cache_key),
+        timeout=swapi.resilience.remaining_time(),
+        default=[]
+    )
+
+
+async def _crawl_endpoint_async(endpoint, max_items, max_pages, cache_key):
+    limit = swapi.plan_page_size(max_items)
+    all_items = []
+
+    with swapi.crawl_stats(endpoint, limit) as stats:
+        first = await fetch_from_swapi_async(endpoint, 1, limit=limit)
+
+        if first and first.get('results'):
+            swapi.record_page()
+            all_items.extend(first['results'])
+            pages = swapi.plan_remaining_pages(first, max_items, max_pages)
+
+            if pages is None:
+                # No total reported: follow 'next' links one page at a time
+                page = 1
+                while first.get('next') and (max_pages is None or page < max_pages):
+                    page += 1
+                    data = await fetch_from_swapi_async(endpoint, page, limit=limit)
+                    if not data or not data.get('results'):
+                        break
+                    swapi.record_page()
+                    all_items.extend(data['results'])
+                    if not data.get('next') or (max_items is not None and len(all_items) >= max_items):
+                        break
+            else:
+                results = await asyncio.gather(*(fetch_from_swapi_async(endpoint, page, limit=limit) for page in pages))
+                for data in results:
+                    if not data or not data.get('results'):
+                        break
+                    swapi.record_page()
+                    all_items.extend(data['results'])
+
+        all_items = all_items[:max_items]
+        stats.items = len(all_items)
+
+    swapi.cache_crawl(cache_key, all_items)
+    return all_items
+
+
+async def load_name_pools_async(entity_types=None):
+    """
+    Make sure the name pools are built, crawling stale ones concurrently.
+
+    Pools are built from the crawled items without further network access,
+    so the event loop is never blocked by a synchronous crawl.
+
+    Args:
+        entity_types (list): Entity types to load (default: all)
+
+    Returns:
+        dict: Mapping of entity type to its name pool
+    """
+    entity_types = list(entity_types or swapi.ENTITY_ENDPOINTS)
+    pools = {entity_type: swapi.get_fresh_name_pool(entity_type) for entity_type in entity_types}
+    stale = [entity_type for entity_type, pool in pools.items() if pool is None]
+
+    if stale:
+        results = await asyncio.gather(
+            *(get_all_items_async(swapi.ENTITY_ENDPOINTS[entity_type], swapi.catalog_max_items())
+              for entity_type in stale),
+            return_exceptions=True
+        )
+        for entity_type, result in zip(stale, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting {entity_type} names: {result}")
+                result = []
+            pools[entity_type] = swapi.update_name_pool(entity_type, result)
+
+    return pools
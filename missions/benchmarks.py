@@ -0,0 +1,195 @@
+import time
+import statistics
+import logging
+
+from . import swapi
+from .fake_swapi import FakeSwapiServer
+from .task_generator import generate_tasks, iter_task_chunks, classify_many, get_task_difficulty
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def _percentiles(samples):
+    """Summarize latency samples (seconds) as milliseconds."""
+    ordered = sorted(samples)
+
+    def at(fraction):
+        return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)] * 1000
+
+    return {
+        'samples': len(ordered),
+        'mean_ms': statistics.fmean(ordered) * 1000,
+        'p50_ms': at(0.50),
+        'p95_ms': at(0.95),
+        'p99_ms': at(0.99),
+        'max_ms': ordered[-1] * 1000
+    }
+
+
+def bench_cold_crawl(parallel):
+    """
+    Time building all name pools from an empty cache.
+
+    Args:
+        parallel (bool): Use the parallel page crawl
+
+    Returns:
+        dict: Crawl time
+    """
+    swapi.clear_cache()
+    original = swapi.PARALLEL_CRAWL
+    swapi.PARALLEL_CRAWL = parallel
+
+    try:
+        start = time.perf_counter()
+        for entity_type in swapi.ENTITY_ENDPOINTS:
+            swapi.get_name_pool(entity_type)
+        elapsed = time.perf_counter() - start
+    finally:
+        swapi.PARALLEL_CRAWL = original
+
+    return {'parallel': parallel, 'seconds': elapsed}
+
+
+def bench_generate_tasks(iterations):
+    """
+    Measure warm-cache generate_tasks throughput.
+
+    Args:
+        iterations (int): Number of generate_tasks() calls
+
+    Returns:
+        dict: Calls and missions per second
+    """
+    generate_tasks()  # Warm the pools
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        generate_tasks()
+    elapsed = time.perf_counter() - start
+
+    return {
+        'iterations': iterations,
+        'seconds': elapsed,
+        'calls_per_second': iterations / elapsed,
+        'missions_per_second': iterations * 5 / elapsed
+    }
+
+
+def bench_bulk_generation(count):
+    """
+    Measure bulk generation throughput.
+
+    Args:
+        count (int): Number of missions to generate
+
+    Returns:
+        dict: Missions per second
+    """
+    start = time.perf_counter()
+    generated = sum(len(chunk) for chunk in iter_task_chunks(count, seed=0))
+    elapsed = time.perf_counter() - start
+
+    return {
+        'count': generated,
+        'seconds': elapsed,
+        'missions_per_second': generated / elapsed
+    }
+
+
+def bench_classification(count):
+    """
+    Measure difficulty classification throughput, without and with memoization.
+
+    Args:
+        count (int): Number of missions to classify
+
+    Returns:
+        dict: Missions per second for a cold and a warm memo cache
+    """
+    texts = [task for chunk in iter_task_chunks(count, seed=0) for task in chunk]
+    results = {'count': count}
+
+    for label in ('cold', 'warm'):
+        if label == 'cold':
+            get_task_difficulty.cache_clear()
+        start = time.perf_counter()
+        classify_many(texts)
+        elapsed = time.perf_counter() - start
+        results[f'{label}_seconds'] = elapsed
+        results[f'{label}_missions_per_second'] = count / elapsed
+
+    return results
+
+
+def bench_api_latency(requests_count):
+    """
+    Measure end-to-end /api/tasks/ latency through the Django test client.
+
+    Args:
+        requests_count (int): Number of requests
+
+    Returns:
+        dict: Latency percentiles
+    """
+    from django.test import Client
+    from django.test.utils import override_settings
+
+    client = Client()
+    samples = []
+
+    with override_settings(ALLOWED_HOSTS=['testserver']):
+        client.get('/api/tasks/')  # Warm the pools
+
+        for _ in range(requests_count):
+            start = time.perf_counter()
+            response = client.get('/api/tasks/')
+            samples.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                raise RuntimeError(f"/api/tasks/ returned {response.status_code}")
+
+    return _percentiles(samples)
+
+
+def run_benchmarks(latency=0.02, pages=9, iterations=1000, bulk_sizes=(10_000, 1_000_000),
+                   classify_count=100_000, api_requests=200):
+    """
+    Run the full benchmark suite against a local stand-in SWAPI server.
+
+    Args:
+        latency (float): Simulated upstream latency per request in seconds
+        pages (int): Pages per endpoint served by the stand-in server
+        iterations (int): generate_tasks() calls for the throughput benchmark
+        bulk_sizes (tuple): Mission counts for the bulk generation benchmark
+        classify_count (int): Missions for the classification benchmark
+        api_requests (int): Requests for the API latency benchmark
+
+    Returns:
+        dict: Results per benchmark
+    """
+    original_base = swapi.SWAPI_BASE
+    results = {
+        'config': {
+            'latency': latency,
+            'pages': pages,
+            'iterations': iterations,
+            'bulk_sizes': list(bulk_sizes),
+            'classify_count': classify_count,
+            'api_requests': api_requests
+        }
+    }
+
+    with FakeSwapiServer(latency=latency, pages=pages) as server:
+        swapi.set_base_url(server.base_url)
+        try:
+            results['cold_crawl'] = [bench_cold_crawl(parallel=False), bench_cold_crawl(parallel=True)]
+            results['upstream_requests'] = server.requests_served
+            results['generate_tasks'] = bench_generate_tasks(iterations)
+            results['bulk_generation'] = [bench_bulk_generation(count) for count in bulk_sizes]
+            results['classification'] = bench_classification(classify_count)
+            results['api_latency'] = bench_api_latency(api_requests)
+        finally:
+            swapi.set_base_url(original_base)
+
+    return results
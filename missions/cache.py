@@ -0,0 +1,509 @@
+import sys
+import time
+import uuid
+import threading
+import logging
+from collections import OrderedDict
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Entry states returned by lookup()
+FRESH = 'fresh'
+STALE = 'stale'
+MISS = 'miss'
+
+
+def estimate_size(value):
+    """
+    Estimate the memory footprint of a cached value in bytes.
+
+    Walks dicts, lists and tuples recursively; this is an approximation
+    used for cache budgeting, not an exact measurement.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        int: Approximate size in bytes
+    """
+    size = sys.getsizeof(value)
+
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += estimate_size(key) + estimate_size(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            size += estimate_size(item)
+
+    return size
+
+
+class TTLCache:
+    """
+    Thread-safe in-process cache with per-entry TTL and LRU eviction.
+
+    Entries are evicted least-recently-used first whenever the cache holds
+    more than max_entries entries or more than max_bytes (approximate) bytes.
+    Expired entries are kept for max_stale more seconds so that lookup()
+    can still serve them as stale.
+    """
+
+    def __init__(self, max_entries=512, max_bytes=16 * 1024 * 1024, default_ttl=3600, max_stale=0):
+        """
+        Args:
+            max_entries (int): Maximum number of entries (None for unbounded)
+            max_bytes (int): Maximum approximate size in bytes (None for unbounded)
+            default_ttl (float): Seconds an entry stays fresh (None for no expiry)
+            max_stale (float): Seconds an expired entry can still be served stale
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.max_stale = max_stale
+
+        self._entries = OrderedDict()  # key -> (value, expires_at, size)
+        self._lock = threading.RLock()
+        self._total_bytes = 0
+        self._reset_counters()
+
+    def _reset_counters(self):
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _is_expired(self, expires_at, now=None):
+        if expires_at is None:
+            return False
+        return (time.monotonic() if now is None else now) >= expires_at
+
+    def _is_dead(self, expires_at, now=None):
+        if expires_at is None:
+            return False
+        return (time.monotonic() if now is None else now) >= expires_at + (self.max_stale or 0)
+
+    def _remove(self, key):
+        value, expires_at, size = self._entries.pop(key)
+        self._total_bytes -= size
+
+    def _purge_expired(self):
+        now = time.monotonic()
+        expired = [key for key, (_, expires_at, _) in self._entries.items()
+                   if self._is_dead(expires_at, now)]
+        for key in expired:
+            self._remove(key)
+            self.expirations += 1
+
+    def _evict(self):
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries) or
+            (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+        ):
+            key, (_, _, size) = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            logger.debug(f"Evicted cache entry {key}")
+
+    def get(self, key, default=None):
+        """
+        Get a fresh value from the cache.
+
+        Args:
+            key (str): Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, expires_at, _ = entry
+            if self._is_expired(expires_at):
+                if self._is_dead(expires_at):
+                    self._remove(key)
+                    self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def lookup(self, key, default=None):
+        """
+        Get a value together with its freshness.
+
+        Args:
+            key (str): Cache key
+            default: Value returned on a miss
+
+        Returns:
+            tuple: (value, FRESH), (value, STALE) for an expired entry still
+                within max_stale, or (default, MISS)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return default, MISS
+
+            value, expires_at, _ = entry
+            now = time.monotonic()
+
+            if self._is_dead(expires_at, now):
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default, MISS
+
+            self._entries.move_to_end(key)
+
+            if self._is_expired(expires_at, now):
+                self.stale_hits += 1
+                return value, STALE
+
+            self.hits += 1
+            return value, FRESH
+
+    def set(self, key, value, ttl=None):
+        """
+        Store a value in the cache.
+
+        Args:
+            key (str): Cache key
+            value: Value to store
+            ttl (float): Seconds the entry stays fresh (default: default_ttl)
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        size = estimate_size(value)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (value, expires_at, size)
+            self._total_bytes += size
+            self._evict()
+
+    def delete(self, key):
+        """Remove a key from the cache if present."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            self._reset_counters()
+
+    def keys(self):
+        with self._lock:
+            self._purge_expired()
+            return list(self._entries.keys())
+
+    def values(self):
+        with self._lock:
+            self._purge_expired()
+            return [value for value, _, _ in self._entries.values()]
+
+    def items(self):
+        with self._lock:
+            self._purge_expired()
+            return [(key, value) for key, (value, _, _) in self._entries.items()]
+
+    def stats(self):
+        """
+        Get cache counters and usage.
+
+        Returns:
+            dict: Cache statistics
+        """
+        with self._lock:
+            self._purge_expired()
+            return {
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'total_bytes': self._total_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes
+            }
+
+    def __getitem__(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._is_expired(entry[1]):
+                raise KeyError(key)
+            return entry[0]
+
+    def __setitem__(self, key, value):
+        self.set(key, value)
+
+    def __delitem__(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def __contains__(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._is_expired(entry[1])
+
+    def __len__(self):
+        with self._lock:
+            self._purge_expired()
+            return len(self._entries)
+
+
+class _Entry(tuple):
+    """(value, expires_at) envelope stored in Django cache backends."""
+
+    __slots__ = ()
+
+    def __new__(cls, value, expires_at):
+        return super().__new__(cls, (value, expires_at))
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+
+class DjangoCacheStore:
+    """
+    Cache store backed by a configured django.core.cache backend.
+
+    Exposes the same interface as TTLCache so that SWAPI data can live in a
+    shared backend (file-based, database, ...) instead of in each worker.
+    Values are stored with their wall-clock expiry and kept by the backend
+    for max_stale extra seconds so they can be served stale. Hit/miss
+    counters are tracked per process. Key listing only covers keys this
+    process has stored or read, since Django cache backends cannot
+    enumerate keys.
+
+    Keys carry a generation stored in the backend itself; clear() starts a
+    new generation, which drops the entries of every process sharing the
+    backend without touching other data in it. Each process rereads the
+    generation at most every GENERATION_REFRESH seconds, so other processes
+    see a clear() that much later. The old generation's entries are left
+    for the backend to expire, so every entry is stored with a timeout:
+    entries without a TTL are kept for at most UNBOUNDED_TIMEOUT seconds.
+    """
+
+    KEY_PREFIX = 'swapi:'
+    GENERATION_KEY = 'swapi:generation'
+    # Seconds a process reuses the generation it last read from the backend
+    GENERATION_REFRESH = 1.0
+    # Backend timeout of entries without a TTL, so cleared ones are reclaimed
+    UNBOUNDED_TIMEOUT = 24 * 3600
+
+    def __init__(self, alias, default_ttl=3600, max_stale=0):
+        """
+        Args:
+            alias (str): Alias of the backend in settings.CACHES
+            default_ttl (float): Seconds an entry stays fresh (None for no expiry)
+            max_stale (float): Seconds an expired entry can still be served stale
+        """
+        from django.core.cache import caches
+
+        self.alias = alias
+        self.default_ttl = default_ttl
+        self.max_stale = max_stale
+        self.backend = caches[alias]
+
+        self._known_keys = set()
+        self._lock = threading.Lock()
+        self._current_generation = None
+        self._generation_read_at = 0
+        self._reset_counters()
+
+    def _reset_counters(self):
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def _generation(self):
+        now = time.monotonic()
+        with self._lock:
+            if self._current_generation is not None and now - self._generation_read_at < self.GENERATION_REFRESH:
+                return self._current_generation
+
+        generation = self.backend.get(self.GENERATION_KEY)
+        if generation is None:
+            # Whoever adds it first wins; the others read the winner's
+            self.backend.add(self.GENERATION_KEY, uuid.uuid4().hex[:8], timeout=None)
+            generation = self.backend.get(self.GENERATION_KEY)
+
+        with self._lock:
+            self._current_generation = generation
+            self._generation_read_at = now
+        return generation
+
+    def _make_key(self, key, generation=None):
+        return f"{self.KEY_PREFIX}{generation or self._generation()}:{key}"
+
+    @staticmethod
+    def _unwrap(stored):
+        if isinstance(stored, _Entry):
+            return stored
+        return _Entry(stored, None)
+
+    def _read(self, key, default):
+        missing = object()
+        stored = self.backend.get(self._make_key(key), missing)
+
+        if stored is missing:
+            with self._lock:
+                self._known_keys.discard(key)
+            return default, MISS
+
+        with self._lock:
+            self._known_keys.add(key)
+
+        value, expires_at = self._unwrap(stored)
+        if expires_at is not None and time.time() >= expires_at:
+            return value, STALE
+        return value, FRESH
+
+    def lookup(self, key, default=None):
+        """
+        Get a value together with its freshness.
+
+        Args:
+            key (str): Cache key
+            default: Value returned on a miss
+
+        Returns:
+            tuple: (value, FRESH), (value, STALE) or (default, MISS)
+        """
+        value, state = self._read(key, default)
+
+        with self._lock:
+            if state == FRESH:
+                self.hits += 1
+            elif state == STALE:
+                self.stale_hits += 1
+            else:
+                self.misses += 1
+
+        return value, state
+
+    def get(self, key, default=None):
+        """
+        Get a fresh value from the shared backend.
+
+        Args:
+            key (str): Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        value, state = self._read(key, default)
+
+        with self._lock:
+            if state == FRESH:
+                self.hits += 1
+                return value
+            self.misses += 1
+            return default
+
+    def set(self, key, value, ttl=None):
+        """
+        Store a value in the shared backend.
+
+        Args:
+            key (str): Cache key
+            value: Value to store
+            ttl (float): Seconds the entry stays fresh (default: default_ttl)
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.time() + ttl if ttl else None
+        timeout = ttl + (self.max_stale or 0) if ttl else self.UNBOUNDED_TIMEOUT
+        self.backend.set(self._make_key(key), _Entry(value, expires_at), timeout=timeout)
+
+        with self._lock:
+            self._known_keys.add(key)
+
+    def delete(self, key):
+        """Remove a key from the backend if present."""
+        self.backend.delete(self._make_key(key))
+
+        with self._lock:
+            self._known_keys.discard(key)
+
+    def clear(self):
+        """Drop the SWAPI entries of every process and reset the counters."""
+        generation = uuid.uuid4().hex[:8]
+        self.backend.set(self.GENERATION_KEY, generation, timeout=None)
+
+        with self._lock:
+            self._current_generation = generation
+            self._generation_read_at = time.monotonic()
+            self._known_keys.clear()
+            self._reset_counters()
+
+    def items(self):
+        with self._lock:
+            keys = list(self._known_keys)
+
+        generation = self._generation()
+        backend_keys = {key: self._make_key(key, generation) for key in keys}
+        found = self.backend.get_many(list(backend_keys.values()))
+        return [(key, self._unwrap(found[backend_key])[0])
+                for key, backend_key in backend_keys.items() if backend_key in found]
+
+    def keys(self):
+        return [key for key, _ in self.items()]
+
+    def values(self):
+        return [value for _, value in self.items()]
+
+    def stats(self):
+        """
+        Get cache counters.
+
+        Returns:
+            dict: Cache statistics
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'evictions': 0,
+                'expirations': 0,
+                'total_bytes': None,
+                'max_entries': None,
+                'max_bytes': None,
+                'backend': self.alias
+            }
+
+    def __getitem__(self, key):
+        missing = object()
+        stored = self.backend.get(self._make_key(key), missing)
+        if stored is missing:
+            raise KeyError(key)
+        return self._unwrap(stored)[0]
+
+    def __setitem__(self, key, value):
+        self.set(key, value)
+
+    def __delitem__(self, key):
+        self.delete(key)
+
+    def __contains__(self, key):
+        return self._read(key, None)[1] == FRESH
+
+    def __len__(self):
+        return len(self.items())
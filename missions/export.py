@@ -0,0 +1,172 @@
+import io
+import csv
+import json
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from . import swapi, serializers
+from .task_generator import iter_task_chunks, add_task_metadata
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Missions rendered and encoded per work item
+EXPORT_CHUNK_SIZE = 10_000
+
+FORMATS = ('jsonl', 'csv')
+METADATA_FIELDS = ('description', 'difficulty', 'estimated_time', 'category', 'completed')
+
+
+def load_pools():
+    """
+    Build every name pool once, falling back to the built-in names.
+
+    Returns:
+        dict: Mapping of entity type to a tuple of names
+    """
+    pools = {}
+    for entity_type in swapi.ENTITY_ENDPOINTS:
+        pool = swapi.get_name_pool(entity_type)
+        if not pool:
+            logger.warning(f"No {entity_type} names available, exporting fallback names")
+            pool = swapi.FALLBACK_NAMES[entity_type]
+        pools[entity_type] = pool
+    return pools
+
+
+def chunk_seed(seed, index):
+    """
+    Derive the seed of one chunk, so output does not depend on the worker count.
+
+    Args:
+        seed (int): Export seed, or None for random output
+        index (int): Chunk number
+
+    Returns:
+        str: Chunk seed, or None
+    """
+    return None if seed is None else f"{seed}:{index}"
+
+
+def header(fmt, metadata=False):
+    """
+    Get the text written before the first chunk.
+
+    Args:
+        fmt (str): 'jsonl' or 'csv'
+        metadata (bool): Include add_task_metadata columns
+
+    Returns:
+        str: Header line(s), empty for jsonl
+    """
+    if fmt != 'csv':
+        return ''
+    return ','.join(METADATA_FIELDS if metadata else ('task',)) + '\r\n'
+
+
+def render_chunk(index, size, seed=None, fmt='jsonl', metadata=False):
+    """
+    Render and encode one chunk of missions.
+
+    Args:
+        index (int): Chunk number
+        size (int): Missions in the chunk
+        seed (int): Export seed
+        fmt (str): 'jsonl' or 'csv'
+        metadata (bool): Include difficulty, estimated time, etc.
+
+    Returns:
+        str: Encoded rows, each terminated by a newline
+    """
+    tasks = [task for chunk in iter_task_chunks(size, chunk_size=size, seed=chunk_seed(seed, index)) for task in chunk]
+    rows = add_task_metadata(tasks) if metadata else tasks
+
+    if fmt == 'jsonl':
+        if metadata:
+            return ''.join(json.dumps(row) + '\n' for row in rows)
+        return serializers.ndjson_text(rows)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if metadata:
+        writer.writerows([row[field] for field in METADATA_FIELDS] for row in rows)
+    else:
+        writer.writerows([task] for task in rows)
+    return buffer.getvalue()
+
+
+def _init_worker(pools):
+    """Install the parent's name pools, so workers never crawl SWAPI."""
+    swapi.install_name_pools(pools)
+
+
+def export_missions(out, count, workers=1, fmt='jsonl', seed=None, metadata=False,
+                    chunk_size=EXPORT_CHUNK_SIZE, progress=None):
+    """
+    Generate missions in bulk and write them to a text stream.
+
+    Chunks are rendered and encoded across a process pool and written in
+    order as they complete. At most two chunks per worker are in flight,
+    so memory use depends on chunk_size and workers, not on count. With a
+    seed the output is the same for any number of workers.
+
+    Args:
+        out: Writable text stream
+        count (int): Number of missions
+        workers (int): Worker processes (1 renders in this process)
+        fmt (str): 'jsonl' or 'csv'
+        seed (int): Seed for reproducible output
+        metadata (bool): Include difficulty, estimated time, etc.
+        chunk_size (int): Missions per work item
+        progress (callable): Called with the number of missions written
+            after every chunk
+
+    Returns:
+        int: Number of missions written
+
+    Raises:
+        ValueError: If fmt is not one of FORMATS
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format: {fmt}")
+
+    # Build the pools once; every chunk, in any process, draws from them
+    pools = load_pools()
+    sizes = [min(chunk_size, count - start) for start in range(0, count, chunk_size)]
+    written = 0
+
+    out.write(header(fmt, metadata))
+
+    if workers <= 1:
+        _init_worker(pools)
+        for index, size in enumerate(sizes):
+            out.write(render_chunk(index, size, seed, fmt, metadata))
+            written += size
+            if progress:
+                progress(written)
+        return written
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(pools,)) as executor:
+        pending = deque()
+        chunks = iter(enumerate(sizes))
+
+        def submit_next():
+            chunk = next(chunks, None)
+            if chunk is not None:
+                index, size = chunk
+                pending.append((size, executor.submit(render_chunk, index, size, seed, fmt, metadata)))
+
+        for _ in range(workers * 2):
+            submit_next()
+
+        while pending:
+            size, future = pending.popleft()
+            out.write(future.result())
+            submit_next()
+
+            written += size
+            if progress:
+                progress(written)
+
+    return written
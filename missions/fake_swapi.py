@@ -0,0 +1,213 @@
+import json
+import math
+import time
+import random
+import logging
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+from .swapi import FALLBACK_NAMES
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Page size used when a request has no limit parameter
+DEFAULT_LIMIT = 10
+
+# Fixture catalog served when no snapshot is given
+DEFAULT_CATALOG = {
+    'people': list(FALLBACK_NAMES['character']),
+    'planets': list(FALLBACK_NAMES['planet']),
+    'starships': list(FALLBACK_NAMES['starship']),
+    'vehicles': list(FALLBACK_NAMES['vehicle']),
+    'species': ["Human", "Droid", "Wookie", "Rodian", "Hutt", "Yoda's species", "Trandoshan"],
+    'films': ["A New Hope", "The Empire Strikes Back", "Return of the Jedi",
+              "The Phantom Menace", "Attack of the Clones", "Revenge of the Sith"],
+}
+
+
+def build_catalog(snapshot=None, pages=None):
+    """
+    Build the name catalog served by the stand-in server.
+
+    Args:
+        snapshot (dict): Catalog loaded with missions.snapshot.load_snapshot
+            (default: DEFAULT_CATALOG)
+        pages (int): Resize every endpoint to exactly this many pages of
+            DEFAULT_LIMIT items, numbering repeated names; empty endpoints
+            stay a single empty page
+
+    Returns:
+        dict: Mapping of endpoint name to list of names
+    """
+    if snapshot:
+        catalog = {endpoint: [item['name'] for item in items] for endpoint, items in snapshot.items()}
+    else:
+        catalog = {endpoint: list(names) for endpoint, names in DEFAULT_CATALOG.items()}
+
+    if pages:
+        size = pages * DEFAULT_LIMIT
+        for endpoint, names in catalog.items():
+            if not names:
+                continue
+            catalog[endpoint] = [
+                names[i % len(names)] if i < len(names) else f"{names[i % len(names)]} {i // len(names) + 1}"
+                for i in range(size)
+            ]
+
+    return catalog
+
+
+class FakeSwapiServer:
+    """
+    Local stand-in for swapi.tech serving fixture data over real HTTP.
+
+    Serves /api/<endpoint>?page=&limit= in the swapi.tech list format, the
+    films list under 'result', and /api/<endpoint>/<uid> detail responses.
+    Every request can be delayed by `latency` seconds and fails with a 503
+    with probability `error_rate`.
+
+    Usage:
+        with FakeSwapiServer(latency=0.05) as server:
+            swapi.set_base_url(server.base_url)
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, error_rate=0.0,
+                 pages=None, snapshot=None, seed=None):
+        """
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind (0 picks a free port)
+            latency (float): Seconds to wait before answering each request
+            error_rate (float): Probability (0-1) of answering with a 503
+            pages (int): Pages per endpoint at the default page size
+            snapshot (dict): Catalog to serve instead of the fixture names
+            seed (int): Seed for the error decisions
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.catalog = build_catalog(snapshot, pages)
+        self.requests_served = 0
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.handle(self)
+
+            def log_message(self, format, *args):
+                logger.debug(f"fake_swapi: {format % args}")
+
+        return Handler
+
+    def _should_fail(self):
+        with self._lock:
+            self.requests_served += 1
+            return self.error_rate and self._rng.random() < self.error_rate
+
+    def handle(self, request):
+        """Answer one request; called on the server's request threads."""
+        if self.latency:
+            time.sleep(self.latency)
+
+        if self._should_fail():
+            return self._send(request, 503, {'message': 'Service Unavailable'})
+
+        url = urlsplit(request.path)
+        parts = [part for part in url.path.split('/') if part]
+
+        if len(parts) < 2 or parts[0] != 'api' or parts[1] not in self.catalog:
+            return self._send(request, 404, {'message': 'not found'})
+
+        endpoint = parts[1]
+        names = self.catalog[endpoint]
+
+        if len(parts) == 3:
+            return self._send_detail(request, endpoint, names, parts[2])
+
+        if endpoint == 'films':
+            return self._send(request, 200, {
+                'message': 'ok',
+                'result': [self._item(endpoint, uid, name, detail=True) for uid, name in enumerate(names, 1)]
+            })
+
+        query = parse_qs(url.query)
+        try:
+            page = max(int(query.get('page', ['1'])[0]), 1)
+            limit = max(int(query.get('limit', [str(DEFAULT_LIMIT)])[0]), 1)
+        except ValueError:
+            return self._send(request, 400, {'message': 'page and limit must be integers'})
+
+        total_pages = max(math.ceil(len(names) / limit), 1)
+        start = (page - 1) * limit
+        page_url = f"{self.base_url}/{endpoint}?page={{}}&limit={limit}"
+
+        self._send(request, 200, {
+            'message': 'ok',
+            'total_records': len(names),
+            'total_pages': total_pages,
+            'previous': page_url.format(page - 1) if page > 1 else None,
+            'next': page_url.format(page + 1) if page < total_pages else None,
+            'results': [self._item(endpoint, uid, name)
+                        for uid, name in enumerate(names[start:start + limit], start + 1)]
+        })
+
+    def _send_detail(self, request, endpoint, names, uid):
+        try:
+            name = names[int(uid) - 1]
+        except (ValueError, IndexError):
+            return self._send(request, 404, {'message': 'not found'})
+        self._send(request, 200, {'message': 'ok', 'result': self._item(endpoint, int(uid), name, detail=True)})
+
+    def _item(self, endpoint, uid, name, detail=False):
+        url = f"{self.base_url}/{endpoint}/{uid}"
+        if not detail:
+            return {'uid': str(uid), 'name': name, 'url': url}
+        key = 'title' if endpoint == 'films' else 'name'
+        return {'uid': str(uid), 'properties': {key: name, 'url': url}}
+
+    def _send(self, request, status, payload):
+        body = json.dumps(payload).encode()
+        request.send_response(status)
+        request.send_header('Content-Type', 'application/json')
+        request.send_header('Content-Length', str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
+
+    def start(self):
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='fake-swapi', daemon=True)
+        self._thread.start()
+        logger.info(f"Fake SWAPI serving at {self.base_url}")
+        return self
+
+    def serve_forever(self):
+        """Serve requests on the current thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self):
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,147 @@
+import threading
+import logging
+
+from . import metrics
+
+# requests is imported on first use: it is a large part of the app's import
+# time, and workers serving from a warm cache or snapshot may never need it
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Pool configuration
+POOL_CONNECTIONS = 10  # Number of distinct hosts to keep pools for
+POOL_MAXSIZE = 10  # Keep-alive connections kept per host
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Get the shared keep-alive HTTP session, creating it on first use.
+
+    The session mounts an HTTPAdapter whose urllib3 connection pools are
+    thread-safe, so one session is shared by every thread in the process.
+
+    Returns:
+        requests.Session: Shared pooled session
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=POOL_CONNECTIONS,
+                    pool_maxsize=POOL_MAXSIZE
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+                logger.debug(
+                    f"Created pooled HTTP session "
+                    f"({POOL_CONNECTIONS} hosts, {POOL_MAXSIZE} connections per host)"
+                )
+
+    return _session
+
+
+def configure_pool(pool_connections=None, pool_maxsize=None):
+    """
+    Change the pool size and rebuild the shared session.
+
+    Args:
+        pool_connections (int): Number of host pools to keep
+        pool_maxsize (int): Maximum keep-alive connections per host
+    """
+    global POOL_CONNECTIONS, POOL_MAXSIZE
+
+    if pool_connections is not None:
+        POOL_CONNECTIONS = pool_connections
+    if pool_maxsize is not None:
+        POOL_MAXSIZE = pool_maxsize
+
+    close_session()
+
+
+def close_session():
+    """Close the shared session and drop all pooled connections."""
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+            logger.info("Pooled HTTP session closed")
+
+
+def get(url, **kwargs):
+    """
+    Perform a GET request through the shared pooled session.
+
+    Args:
+        url (str): URL to fetch
+        **kwargs: Extra arguments passed to requests.Session.get
+
+    Returns:
+        requests.Response: HTTP response
+    """
+    return get_session().get(url, **kwargs)
+
+
+def get_pool_stats():
+    """
+    Get connection reuse statistics for the shared session.
+
+    Every request is served on a pooled connection; requests that did not
+    need a new connection reused a kept-alive one.
+
+    Returns:
+        dict: Pool statistics
+    """
+    stats = {
+        'hosts': 0,
+        'requests': 0,
+        'connections_opened': 0,
+        'connections_reused': 0
+    }
+
+    session = _session
+    if session is None:
+        return stats
+
+    for adapter in set(session.adapters.values()):
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)  # None if evicted meanwhile
+            if pool is None:
+                continue
+            stats['hosts'] += 1
+            stats['requests'] += pool.num_requests
+            stats['connections_opened'] += pool.num_connections
+
+    stats['connections_reused'] = max(stats['requests'] - stats['connections_opened'], 0)
+    return stats
+
+
+@metrics.REGISTRY.register_collector
+def _collect_pool_metrics():
+    """Report keep-alive connection reuse of the shared session."""
+    stats = get_pool_stats()
+    yield 'swapi_http_requests_total', 'counter', "Requests sent through the pooled session.", stats['requests']
+    yield 'swapi_http_connections_opened_total', 'counter', "Connections opened, each with its own handshake.", stats['connections_opened']
+    yield 'swapi_http_connections_reused_total', 'counter', "Requests sent on a kept-alive connection.", stats['connections_reused']
+    yield 'swapi_http_host_pools', 'gauge', "Per-host connection pools held by the session.", stats['hosts']
+
+
+def __getattr__(name):
+    """Resolve RequestException lazily, importing requests on first access."""
+    if name == 'RequestException':
+        from requests.exceptions import RequestException
+        return RequestException
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from missions.fake_swapi import FakeSwapiServer
+from missions.snapshot import load_snapshot, SnapshotError
+
+
+class Command(BaseCommand):
+    help = "Serve a local stand-in for the SWAPI list/detail endpoints for load and latency testing."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1', help="Interface to bind (default: 127.0.0.1)")
+        parser.add_argument('--port', type=int, default=8001, help="Port to bind (default: 8001)")
+        parser.add_argument('--latency', type=float, default=0.0,
+                            help="Seconds to wait before answering each request")
+        parser.add_argument('--error-rate', type=float, default=0.0,
+                            help="Probability (0-1) of answering a request with a 503")
+        parser.add_argument('--pages', type=int, default=None,
+                            help="Pages per endpoint at the default page size of 10")
+        parser.add_argument('--snapshot', default=None,
+                            help="Serve the names of a swapi_sync snapshot instead of the fixture names")
+        parser.add_argument('--seed', type=int, default=None, help="Seed for the error decisions")
+
+    def handle(self, *args, **options):
+        if not 0 <= options['error_rate'] <= 1:
+            raise CommandError("--error-rate must be between 0 and 1")
+
+        snapshot = None
+        if options['snapshot']:
+            try:
+                snapshot = load_snapshot(options['snapshot'])
+            except SnapshotError as e:
+                raise CommandError(str(e))
+
+        server = FakeSwapiServer(
+            host=options['host'],
+            port=options['port'],
+            latency=options['latency'],
+            error_rate=options['error_rate'],
+            pages=options['pages'],
+            snapshot=snapshot,
+            seed=options['seed'],
+        )
+
+        self.stdout.write(self.style.SUCCESS(f"Fake SWAPI serving at {server.base_url}"))
+        self.stdout.write(f"Point the app at it with: SWAPI_BASE={server.base_url} python manage.py runserver")
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.stop()
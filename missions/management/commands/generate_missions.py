@@ -0,0 +1,63 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from missions.export import export_missions, EXPORT_CHUNK_SIZE, FORMATS
+
+
+class Command(BaseCommand):
+    help = "Generate missions in bulk across worker processes and write them as JSON lines or CSV."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, required=True, help="Number of missions to generate")
+        parser.add_argument('--workers', type=int, default=1, help="Worker processes (default: 1)")
+        parser.add_argument('--format', choices=FORMATS, default='jsonl', help="Output format (default: jsonl)")
+        parser.add_argument('--seed', type=int, default=None,
+                            help="Seed for reproducible output, independent of --workers")
+        parser.add_argument('--output', default='-', help="File to write (default: standard output)")
+        parser.add_argument('--metadata', action='store_true',
+                            help="Include difficulty, estimated time, category and completed per mission")
+        parser.add_argument('--chunk-size', type=int, default=EXPORT_CHUNK_SIZE,
+                            help=f"Missions per work item (default: {EXPORT_CHUNK_SIZE})")
+
+    def handle(self, *args, **options):
+        count = options['count']
+        if count < 1 or options['workers'] < 1 or options['chunk_size'] < 1:
+            raise CommandError("--count, --workers and --chunk-size must be positive")
+
+        # Progress goes to stderr when the missions themselves go to stdout
+        report = self.stderr if options['output'] == '-' else self.stdout
+        step = max(count // 10, options['chunk_size'])
+        next_report = [step]
+
+        def progress(written):
+            if written >= next_report[0] and written < count:
+                elapsed = time.perf_counter() - start
+                report.write(f"{written:,}/{count:,} missions ({written / elapsed:,.0f}/s)")
+                next_report[0] = written + step
+
+        start = time.perf_counter()
+        if options['output'] == '-':
+            written = self.export(sys.stdout, options, progress)
+        else:
+            with open(options['output'], 'w', encoding='utf-8', newline='') as out:
+                written = self.export(out, options, progress)
+        elapsed = time.perf_counter() - start
+
+        report.write(self.style.SUCCESS(
+            f"Wrote {written:,} missions in {elapsed:.2f}s ({written / elapsed:,.0f} missions/s, "
+            f"{options['workers']} workers)"
+        ))
+
+    def export(self, out, options, progress):
+        return export_missions(
+            out,
+            options['count'],
+            workers=options['workers'],
+            fmt=options['format'],
+            seed=options['seed'],
+            metadata=options['metadata'],
+            chunk_size=options['chunk_size'],
+            progress=progress,
+        )
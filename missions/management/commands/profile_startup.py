@@ -0,0 +1,60 @@
+import os
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from missions.startup_profile import profile_startup
+
+
+class Command(BaseCommand):
+    help = "Profile worker startup: per-module import cost and time until the app is ready."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profile-settings', action='append', dest='settings_modules',
+                            help="Settings module to profile (repeatable; default: the current settings)")
+        parser.add_argument('--top', type=int, default=20,
+                            help="Slowest modules and packages to list (default: 20)")
+        parser.add_argument('--output', default=None,
+                            help="Also write the full results to this JSON file")
+
+    def handle(self, *args, **options):
+        if options['top'] < 1:
+            raise CommandError("--top must be positive")
+
+        modules = options['settings_modules'] or [os.environ.get('DJANGO_SETTINGS_MODULE', 'StarWars_ToDo.settings')]
+
+        results = []
+        for module in modules:
+            try:
+                result = profile_startup(module, top=options['top'], cwd=settings.BASE_DIR)
+            except RuntimeError as e:
+                raise CommandError(str(e))
+            results.append(result)
+
+            self.stdout.write(self.style.MIGRATE_HEADING(module))
+            self.stdout.write(
+                f"Ready in {result['ready_seconds'] * 1000:.1f}ms "
+                f"(setup {result['setup_seconds'] * 1000:.1f}ms, "
+                f"handler {result['handler_seconds'] * 1000:.1f}ms, "
+                f"urls {result['urls_seconds'] * 1000:.1f}ms); "
+                f"process {result['process_seconds'] * 1000:.1f}ms"
+            )
+            self.stdout.write(
+                f"{result['modules']} imports, {result['import_seconds'] * 1000:.1f}ms importing; "
+                f"requests imported: {'yes' if result['requests_imported'] else 'no'}"
+            )
+
+            self.stdout.write("Slowest modules (cumulative):")
+            for record in result['slowest_modules']:
+                self.stdout.write(
+                    f"  {record['cumulative_us'] / 1000:8.1f}ms  {'  ' * record['depth']}{record['module']}"
+                )
+            self.stdout.write("Packages (own import time):")
+            for package in result['packages']:
+                self.stdout.write(f"  {package['self_us'] / 1000:8.1f}ms  {package['package']}")
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Wrote results to {options['output']}"))
@@ -0,0 +1,66 @@
+import json
+import platform
+from datetime import datetime, timezone
+
+from django.core.management.base import BaseCommand, CommandError
+
+from missions.benchmarks import run_benchmarks
+
+
+class Command(BaseCommand):
+    help = "Benchmark the fetch, generate and respond pipeline offline and write the results as JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default='benchmark_results.json',
+                            help="JSON file to write the results to (default: benchmark_results.json)")
+        parser.add_argument('--latency', type=float, default=0.02,
+                            help="Simulated upstream latency per request in seconds (default: 0.02)")
+        parser.add_argument('--pages', type=int, default=9,
+                            help="Pages per endpoint served by the stand-in server (default: 9)")
+        parser.add_argument('--iterations', type=int, default=1000,
+                            help="generate_tasks() calls for the throughput benchmark (default: 1000)")
+        parser.add_argument('--bulk-sizes', type=int, nargs='+', default=[10_000, 1_000_000],
+                            help="Mission counts for the bulk generation benchmark (default: 10000 1000000)")
+        parser.add_argument('--classify-count', type=int, default=100_000,
+                            help="Missions for the classification benchmark (default: 100000)")
+        parser.add_argument('--api-requests', type=int, default=200,
+                            help="Requests for the /api/tasks/ latency benchmark (default: 200)")
+
+    def handle(self, *args, **options):
+        counts = [options['iterations'], options['classify_count'], options['api_requests'], *options['bulk_sizes']]
+        if min(counts) < 1:
+            raise CommandError("Iteration and mission counts must be positive")
+
+        results = run_benchmarks(
+            latency=options['latency'],
+            pages=options['pages'],
+            iterations=options['iterations'],
+            bulk_sizes=tuple(options['bulk_sizes']),
+            classify_count=options['classify_count'],
+            api_requests=options['api_requests'],
+        )
+        results['meta'] = {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+        }
+
+        with open(options['output'], 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+        for crawl in results['cold_crawl']:
+            mode = 'parallel' if crawl['parallel'] else 'sequential'
+            self.stdout.write(f"Cold crawl ({mode}): {crawl['seconds']:.3f}s")
+        self.stdout.write(f"generate_tasks: {results['generate_tasks']['calls_per_second']:,.0f} calls/s")
+        for bulk in results['bulk_generation']:
+            self.stdout.write(f"Bulk {bulk['count']:,}: {bulk['missions_per_second']:,.0f} missions/s")
+        classification = results['classification']
+        self.stdout.write(
+            f"Classification: {classification['cold_missions_per_second']:,.0f} missions/s cold, "
+            f"{classification['warm_missions_per_second']:,.0f} warm"
+        )
+        latency = results['api_latency']
+        self.stdout.write(
+            f"/api/tasks/: p50 {latency['p50_ms']:.2f}ms, p95 {latency['p95_ms']:.2f}ms, p99 {latency['p99_ms']:.2f}ms"
+        )
+        self.stdout.write(self.style.SUCCESS(f"Wrote results to {options['output']}"))
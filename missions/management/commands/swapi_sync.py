@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from missions import swapi
+from missions.snapshot import write_snapshot
+
+
+class Command(BaseCommand):
+    help = "Crawl every SWAPI endpoint and write an offline catalog snapshot."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            default=None,
+            help="Snapshot file to write (default: settings.SWAPI_SNAPSHOT_PATH)",
+        )
+        parser.add_argument(
+            '--endpoint',
+            action='append',
+            choices=sorted(swapi.SWAPI_ENDPOINTS),
+            help="Only crawl this endpoint (repeatable; default: all endpoints)",
+        )
+
+    def handle(self, *args, **options):
+        if swapi.OFFLINE_MODE:
+            raise CommandError("swapi_sync crawls the live API; set SWAPI_OFFLINE = False")
+
+        output = options['output'] or settings.SWAPI_SNAPSHOT_PATH
+        endpoints = options['endpoint'] or list(swapi.SWAPI_ENDPOINTS)
+
+        catalog = {}
+        for endpoint in endpoints:
+            # Entire catalog, in as few requests as the page size allows
+            items = swapi.get_all_items_from_endpoint(endpoint, max_items=None)
+            if not items:
+                raise CommandError(f"No items fetched from '{endpoint}', snapshot not written")
+            catalog[endpoint] = items
+
+            stats = swapi.get_crawl_stats().get(endpoint, {})
+            self.stdout.write(
+                f"{endpoint}: {len(items)} items in {stats.get('requests', 0)} requests, "
+                f"{stats.get('bytes', 0)} bytes, {stats.get('seconds', 0):.2f}s"
+            )
+
+        counts = write_snapshot(output, catalog, source=swapi.SWAPI_BASE)
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {sum(counts.values())} items to {output}"
+        ))
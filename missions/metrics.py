@@ -0,0 +1,283 @@
+import time
+import bisect
+import threading
+import logging
+from contextlib import contextmanager
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Latency buckets in seconds, from a warm cache hit up to a retried timeout
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter, optionally split by label values."""
+
+    type = 'counter'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def inc(self, amount=1, **labels):
+        """
+        Increase the counter.
+
+        Args:
+            amount (float): Non-negative increment
+            **labels: One value per label name
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        """
+        Get the current value for one label combination.
+
+        Returns:
+            float: Counter value (0 if never increased)
+        """
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        """Yield (suffix, labels, value) for the exposition format."""
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield '', tuple(zip(self.labelnames, key)), value
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram:
+    """Cumulative histogram of observations, optionally split by label values."""
+
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}  # label key -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    _key = Counter._key
+
+    def observe(self, value, **labels):
+        """
+        Record one observation.
+
+        Args:
+            value (float): Observed value (e.g. seconds)
+            **labels: One value per label name
+        """
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of the with block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels):
+        """
+        Get the number of observations for one label combination.
+
+        Returns:
+            int: Observation count
+        """
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[-1] if state else 0
+
+    def samples(self):
+        """Yield (suffix, labels, value) for the exposition format."""
+        with self._lock:
+            items = sorted((key, list(state)) for key, state in self._values.items())
+
+        for key, state in items:
+            labels = tuple(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, observed in zip(self.buckets, state):
+                cumulative += observed
+                yield '_bucket', labels + (('le', _format_value(float(bound))),), cumulative
+            yield '_bucket', labels + (('le', '+Inf'),), state[-1]
+            yield '_sum', labels, state[-2]
+            yield '_count', labels, state[-1]
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Registry:
+    """
+    Collection of metrics rendered together in the Prometheus text format.
+
+    Besides counters and histograms owned by the registry, collectors can
+    report values kept elsewhere (e.g. cache counters) at render time.
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        """Create and register a Counter."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        """Create and register a Histogram."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, collector):
+        """
+        Register a callable reporting metrics at render time.
+
+        Args:
+            collector (callable): Returns an iterable of
+                (name, type, documentation, value) tuples
+
+        Returns:
+            callable: The collector, so this can be used as a decorator
+        """
+        with self._lock:
+            self._collectors.append(collector)
+        return collector
+
+    def render(self):
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: Exposition text
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for suffix, labels, value in metric.samples():
+                lines.append(f"{metric.name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+
+        for collector in collectors:
+            try:
+                collected = list(collector())
+            except Exception as e:
+                logger.error(f"Metrics collector {collector!r} failed: {e}")
+                continue
+            for name, metric_type, documentation, value in collected:
+                if value is None:
+                    continue
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {metric_type}")
+                lines.append(f"{name} {_format_value(value)}")
+
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        """Reset every registered metric (collectors are kept)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+# Process-wide registry exposed at /api/metrics
+REGISTRY = Registry()
+
+UPSTREAM_LATENCY = REGISTRY.histogram(
+    'swapi_upstream_request_seconds', "Duration of SWAPI request attempts.", ('endpoint',)
+)
+UPSTREAM_RETRIES = REGISTRY.counter(
+    'swapi_upstream_retries_total', "SWAPI request attempts retried after an error.", ('endpoint',)
+)
+UPSTREAM_FAILURES = REGISTRY.counter(
+    'swapi_upstream_failures_total', "SWAPI page loads that failed after all attempts.", ('endpoint',)
+)
+CIRCUIT_OPENED = REGISTRY.counter(
+    'swapi_circuit_opened_total', "Times the circuit breaker of an endpoint opened.", ('endpoint',)
+)
+CIRCUIT_REJECTIONS = REGISTRY.counter(
+    'swapi_circuit_rejections_total', "SWAPI requests skipped because the circuit was open.", ('endpoint',)
+)
+FALLBACK_NAMES_USED = REGISTRY.counter(
+    'missions_fallback_names_total', "Names drawn from the built-in fallback list instead of SWAPI data.",
+    ('entity_type',)
+)
+FALLBACK_TASKS_USED = REGISTRY.counter(
+    'missions_fallback_tasks_total', "Canned fallback missions returned instead of generated ones."
+)
+TASK_REQUEST_DURATION = REGISTRY.histogram(
+    'missions_task_request_seconds', "Duration of /api/tasks/ requests until the response is built."
+)
+
+
+def render():
+    """
+    Render the process-wide registry.
+
+    Returns:
+        str: Prometheus text exposition
+    """
+    return REGISTRY.render()
@@ -0,0 +1,239 @@
+import os
+import threading
+import logging
+from collections import deque
+
+from . import metrics
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Mission sets kept ready per worker process; 0 disables the buffer
+BUFFER_SIZE = 0
+# The producer refills the buffer once it holds fewer sets than this
+# (default: a quarter of BUFFER_SIZE)
+LOW_WATER = None
+# Missions per set, the size of the default /api/tasks/ response
+SET_SIZE = 5
+# Seconds the producer waits after a failure, doubling up to the maximum
+PRODUCER_BACKOFF = 0.5
+PRODUCER_BACKOFF_MAX = 30
+
+BUFFER_POPS = metrics.REGISTRY.counter(
+    'missions_buffer_pops_total', "Mission sets served from the pre-generated buffer."
+)
+BUFFER_UNDERRUNS = metrics.REGISTRY.counter(
+    'missions_buffer_underruns_total', "Requests that found the mission buffer empty and generated inline."
+)
+
+
+class MissionBuffer:
+    """
+    Bounded buffer of pre-generated mission sets, refilled in the background.
+
+    A daemon producer thread keeps the buffer topped up: whenever it drops
+    below the low-water mark, sets are generated until it is full again.
+    pop() never blocks; an empty buffer counts as an underrun and the
+    caller generates the missions itself. Each set is tagged with the
+    generation of the data it was built from, and sets of an outdated
+    generation (e.g. fallback names from an outage) are dropped. A failing
+    producer backs off before trying again.
+
+    The producer is started on first use and restarted after a fork, so
+    every worker process fills its own buffer.
+    """
+
+    def __init__(self, producer, capacity, low_water=None, set_size=5, generation=None):
+        """
+        Args:
+            producer (callable): Returns one mission set (a list of set_size missions)
+            capacity (int): Maximum number of sets kept
+            low_water (int): Refill threshold (default: capacity // 4); at
+                least 1, so an empty buffer is always refilled
+            set_size (int): Missions per set
+            generation (callable): Returns the current generation of the
+                producer's data (default: sets never go out of date)
+        """
+        self.producer = producer
+        self.capacity = capacity
+        self.low_water = max(1, capacity // 4 if low_water is None else low_water)
+        self.set_size = set_size
+        self.generation = generation or (lambda: None)
+
+        self._sets = deque(maxlen=capacity)
+        self._cond = threading.Condition()
+        self._thread = None
+        self._pid = None
+        self._stopped = False
+
+    def __len__(self):
+        with self._cond:
+            return len(self._sets)
+
+    def start(self):
+        """Start the producer thread of this process, if it is not running."""
+        with self._cond:
+            if self._pid == os.getpid() and self._thread is not None and self._thread.is_alive():
+                return self
+
+            if self._pid is not None and self._pid != os.getpid():
+                # Forked: the parent's sets and thread are not ours
+                self._sets.clear()
+
+            self._pid = os.getpid()
+            self._stopped = False
+            self._thread = threading.Thread(target=self._produce, name='mission-buffer', daemon=True)
+            self._thread.start()
+
+        logger.info(f"Mission buffer producer started ({self.capacity} sets, low water {self.low_water})")
+        return self
+
+    def stop(self, timeout=None):
+        """Stop the producer thread."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _produce(self):
+        delay = 0
+
+        while True:
+            with self._cond:
+                while not self._stopped and len(self._sets) >= self.low_water:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                missing = self.capacity - len(self._sets)
+
+            # Generate outside the lock so pop() is never held up
+            for _ in range(missing):
+                generation = self.generation()
+                try:
+                    missions = self.producer()
+                except Exception as e:
+                    delay = min(max(delay * 2, PRODUCER_BACKOFF), PRODUCER_BACKOFF_MAX)
+                    logger.error(f"Mission buffer producer failed, retrying in {delay}s: {e}")
+                    with self._cond:
+                        self._cond.wait_for(lambda: self._stopped, delay)
+                    break
+
+                delay = 0
+                with self._cond:
+                    if self._stopped:
+                        return
+                    self._sets.append((generation, missions))
+
+    def pop(self):
+        """
+        Take one ready-made mission set.
+
+        Returns:
+            list: set_size missions, or None if the buffer is empty
+        """
+        if self._pid != os.getpid() or self._thread is None or not self._thread.is_alive():
+            self.start()
+
+        generation = self.generation()
+        missions = None
+
+        with self._cond:
+            # Sets are queued oldest first, so outdated ones are at the front
+            while self._sets and missions is None:
+                set_generation, candidate = self._sets.popleft()
+                if set_generation == generation:
+                    missions = candidate
+            if len(self._sets) < self.low_water:
+                self._cond.notify()
+
+        if missions is None:
+            BUFFER_UNDERRUNS.inc()
+        else:
+            BUFFER_POPS.inc()
+        return missions
+
+
+_BUFFER = None
+_BUFFER_LOCK = threading.Lock()
+
+
+def get_buffer():
+    """
+    Get the mission buffer of this process.
+
+    Returns:
+        MissionBuffer: The buffer, or None when BUFFER_SIZE is 0
+    """
+    global _BUFFER
+
+    if not BUFFER_SIZE:
+        return None
+
+    if _BUFFER is None:
+        with _BUFFER_LOCK:
+            if _BUFFER is None:
+                from .swapi import get_pool_generation
+                from .task_generator import generate_tasks
+                _BUFFER = MissionBuffer(
+                    lambda: generate_tasks(SET_SIZE), BUFFER_SIZE, LOW_WATER, SET_SIZE,
+                    generation=get_pool_generation
+                )
+    return _BUFFER
+
+
+def take(count):
+    """
+    Take a ready-made set of count missions from the buffer.
+
+    Args:
+        count (int): Number of missions requested
+
+    Returns:
+        list: Missions, or None if the buffer is disabled, holds sets of
+            another size or is empty
+    """
+    buffer = get_buffer()
+    if buffer is None or count != buffer.set_size:
+        return None
+    return buffer.pop()
+
+
+def configure(size, low_water=None):
+    """
+    Set the buffer size of this process, replacing any running buffer.
+
+    Args:
+        size (int): Mission sets to keep ready (0 disables the buffer)
+        low_water (int): Refill threshold (default: a quarter of size)
+    """
+    global BUFFER_SIZE, LOW_WATER, _BUFFER
+
+    with _BUFFER_LOCK:
+        BUFFER_SIZE = size
+        LOW_WATER = low_water
+        old, _BUFFER = _BUFFER, None
+
+    if old is not None:
+        old.stop()
+
+
+def configure_from_settings(settings):
+    """
+    Apply MISSION_BUFFER_* settings.
+
+    Args:
+        settings: Django settings object
+    """
+    configure(
+        getattr(settings, 'MISSION_BUFFER_SIZE', BUFFER_SIZE),
+        getattr(settings, 'MISSION_BUFFER_LOW_WATER', LOW_WATER)
+    )
+
+
+@metrics.REGISTRY.register_collector
+def _collect_buffer_metrics():
+    """Report how many mission sets are ready."""
+    buffer = _BUFFER
+    yield 'missions_buffer_sets', 'gauge', "Mission sets ready in the buffer.", len(buffer) if buffer is not None else None
@@ -0,0 +1,98 @@
+import string
+import logging
+from collections import Counter
+
+from .swapi import sample as sample_names, ENTITY_ENDPOINTS
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+_formatter = string.Formatter()
+
+
+class CompiledTemplate:
+    """
+    Mission template parsed into static text and typed entity slots.
+
+    A template such as "Help {character} escape from {planet}." is stored
+    as the literal parts ("Help ", " escape from ", ".") and the slot types
+    ("character", "planet"), so rendering is a single join.
+    """
+
+    __slots__ = ('source', 'parts', 'slots')
+
+    def __init__(self, source):
+        """
+        Args:
+            source (str): Template text with {entity_type} placeholders
+
+        Raises:
+            ValueError: If a placeholder is not a known entity type
+        """
+        parts = ['']
+        slots = []
+
+        for literal, field, format_spec, conversion in _formatter.parse(source):
+            parts[-1] += literal
+            if field is None:
+                continue
+            if field not in ENTITY_ENDPOINTS or format_spec or conversion:
+                raise ValueError(f"Unknown placeholder {{{field}}} in template: {source}")
+            slots.append(field)
+            parts.append('')
+
+        self.source = source
+        self.parts = tuple(parts)
+        self.slots = tuple(slots)
+
+    def render(self, names):
+        """
+        Fill the slots with names.
+
+        Args:
+            names (dict): Mapping of entity type to an iterator of names
+
+        Returns:
+            str: Rendered mission text
+        """
+        parts = self.parts
+        pieces = [parts[0]]
+        for index, slot in enumerate(self.slots, start=1):
+            pieces.append(next(names[slot]))
+            pieces.append(parts[index])
+        return ''.join(pieces)
+
+    def __repr__(self):
+        return f"CompiledTemplate({self.source!r})"
+
+
+def compile_templates(sources):
+    """
+    Compile a list of template strings.
+
+    Args:
+        sources (list): Template strings
+
+    Returns:
+        tuple: CompiledTemplate objects
+    """
+    return tuple(CompiledTemplate(source) for source in sources)
+
+
+def render_batch(templates, rng=None):
+    """
+    Render a batch of templates with one bulk name draw per entity type.
+
+    Args:
+        templates (list): CompiledTemplate objects to render, in order
+        rng (random.Random): Random generator used for the name draws
+
+    Returns:
+        list: Rendered mission strings, one per template
+    """
+    counts = Counter(slot for template in templates for slot in template.slots)
+    names = {
+        entity_type: iter(sample_names(entity_type, count, rng))
+        for entity_type, count in counts.items()
+    }
+    return [template.render(names) for template in templates]
@@ -0,0 +1,343 @@
+import time
+import random
+import threading
+import contextvars
+import logging
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Circuit states
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# HTTP statuses worth retrying: rate limiting and server-side errors
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Monotonic time by which the current request must be done with upstream
+_DEADLINE = contextvars.ContextVar('swapi_deadline', default=None)
+
+
+class CircuitBreaker:
+    """
+    Fail fast while an upstream keeps failing.
+
+    Closed: calls go through; failure_threshold consecutive failures open
+    the circuit. Open: calls are rejected for `cooldown` seconds. Half-open:
+    after the cool-down up to `half_open_max_calls` probes go through; a
+    successful probe closes the circuit, a failed one opens it again.
+    """
+
+    def __init__(self, name, failure_threshold=5, cooldown=30.0, half_open_max_calls=1, clock=time.monotonic):
+        """
+        Args:
+            name (str): Name used in logs (e.g. the endpoint)
+            failure_threshold (int): Consecutive failures that open the circuit
+            cooldown (float): Seconds the circuit stays open before probing
+            half_open_max_calls (int): Concurrent probes allowed when half-open
+            clock (callable): Monotonic time source
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._probes = 0
+
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self):
+        """Current state, moving from open to half-open once the cool-down passed."""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self):
+        if self._state == OPEN and self._clock() - self._opened_at >= self.cooldown:
+            self._state = HALF_OPEN
+            self._probes = 0
+            logger.info(f"Circuit {self.name} half-open, probing upstream")
+        return self._state
+
+    def allow_request(self):
+        """
+        Check whether a call may go upstream now.
+
+        Returns:
+            bool: False while the circuit is open or the probes are taken
+        """
+        with self._lock:
+            state = self._current_state()
+
+            if state == CLOSED:
+                return True
+
+            if state == HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return True
+
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        """Record a successful call; closes a half-open circuit."""
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info(f"Circuit {self.name} closed")
+            self._state = CLOSED
+            self._failures = 0
+            self._probes = 0
+
+    def record_failure(self):
+        """
+        Record a failed call; may open the circuit.
+
+        Returns:
+            bool: True if this failure opened the circuit
+        """
+        with self._lock:
+            state = self._current_state()
+            self._failures += 1
+
+            if state == HALF_OPEN or (state == CLOSED and self._failures >= self.failure_threshold):
+                self._open()
+                return True
+            return False
+
+    def _open(self):
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._probes = 0
+        self.times_opened += 1
+        logger.warning(f"Circuit {self.name} opened after {self._failures} failures, "
+                       f"failing fast for {self.cooldown}s")
+
+    def reset(self):
+        """Close the circuit and forget past failures."""
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._opened_at = None
+            self._probes = 0
+
+    def stats(self):
+        """
+        Get the breaker state and counters.
+
+        Returns:
+            dict: Breaker statistics
+        """
+        with self._lock:
+            return {
+                'state': self._current_state(),
+                'consecutive_failures': self._failures,
+                'times_opened': self.times_opened,
+                'rejected': self.rejected
+            }
+
+
+class CircuitBreakers:
+    """One CircuitBreaker per key (e.g. per endpoint), created on first use."""
+
+    def __init__(self, failure_threshold=5, cooldown=30.0, half_open_max_calls=1):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.half_open_max_calls = half_open_max_calls
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Get the breaker for a key.
+
+        Args:
+            key (str): Breaker key
+
+        Returns:
+            CircuitBreaker: The key's breaker
+        """
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(key)
+                if breaker is None:
+                    breaker = self._breakers[key] = CircuitBreaker(
+                        key, self.failure_threshold, self.cooldown, self.half_open_max_calls
+                    )
+        return breaker
+
+    def configure(self, failure_threshold=None, cooldown=None, half_open_max_calls=None):
+        """Change the thresholds of existing and future breakers."""
+        with self._lock:
+            if failure_threshold is not None:
+                self.failure_threshold = failure_threshold
+            if cooldown is not None:
+                self.cooldown = cooldown
+            if half_open_max_calls is not None:
+                self.half_open_max_calls = half_open_max_calls
+
+            for breaker in self._breakers.values():
+                breaker.failure_threshold = self.failure_threshold
+                breaker.cooldown = self.cooldown
+                breaker.half_open_max_calls = self.half_open_max_calls
+
+    def reset(self):
+        """Close every circuit."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            breaker.reset()
+
+    def stats(self):
+        """
+        Get the statistics of every breaker.
+
+        Returns:
+            dict: Mapping of key to breaker statistics
+        """
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {key: breaker.stats() for key, breaker in breakers.items()}
+
+
+@contextmanager
+def deadline(seconds):
+    """
+    Bound the time spent upstream inside the with block.
+
+    The deadline lives in a context variable, so it follows the request
+    into worker threads started with a copied context. A nested deadline
+    can only shorten the outer one.
+
+    Args:
+        seconds (float): Time budget, or None to lift any outer deadline
+            (e.g. for background refreshes)
+    """
+    if seconds is None:
+        expires_at = None
+    else:
+        expires_at = time.monotonic() + seconds
+        outer = _DEADLINE.get()
+        if outer is not None:
+            expires_at = min(expires_at, outer)
+
+    token = _DEADLINE.set(expires_at)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def remaining_time():
+    """
+    Get the time left before the current deadline.
+
+    Returns:
+        float: Seconds left (may be negative), or None without a deadline
+    """
+    expires_at = _DEADLINE.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value (str): Delay in seconds or an HTTP date
+
+    Returns:
+        float: Seconds to wait, or None if missing or invalid
+    """
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class RetryPolicy:
+    """
+    Decide whether and when a failed upstream request is retried.
+
+    Timeouts, connection errors and RETRYABLE_STATUSES are retried; other
+    HTTP errors (4xx) are permanent. Delays grow exponentially with full
+    jitter, and a Retry-After header takes precedence.
+    """
+
+    def __init__(self, max_attempts=3, backoff_base=0.25, backoff_max=4.0, jitter=True,
+                 retry_statuses=RETRYABLE_STATUSES, max_retry_after=30.0, rng=None):
+        """
+        Args:
+            max_attempts (int): Attempts per request, including the first
+            backoff_base (float): Delay ceiling before the first retry in seconds
+            backoff_max (float): Upper bound for the exponential delay
+            jitter (bool): Draw each delay uniformly between 0 and the ceiling
+            retry_statuses (set): HTTP statuses that are retried
+            max_retry_after (float): Upper bound for Retry-After delays
+            rng (random.Random): Random generator for the jitter
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.max_retry_after = max_retry_after
+        self._rng = rng or random.Random()
+
+    @staticmethod
+    def _status(error):
+        response = getattr(error, 'response', None)
+        return getattr(response, 'status_code', None)
+
+    def is_retryable(self, error):
+        """
+        Check whether a failed attempt is worth retrying.
+
+        Args:
+            error (Exception): requests exception of the attempt
+
+        Returns:
+            bool: False for HTTP errors with a non-retryable status
+        """
+        status = self._status(error)
+        return status is None or status in self.retry_statuses
+
+    def delay(self, attempt, error=None):
+        """
+        Get the wait before the next attempt.
+
+        Args:
+            attempt (int): Number of the attempt that failed (1-based)
+            error (Exception): Exception of that attempt, for Retry-After
+
+        Returns:
+            float: Seconds to wait
+        """
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None)
+        retry_after = parse_retry_after(headers.get('Retry-After')) if headers is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return self._rng.uniform(0, ceiling) if self.jitter else ceiling
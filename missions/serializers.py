@@ -0,0 +1,167 @@
+import json
+import logging
+from json.encoder import encode_basestring
+
+try:
+    import orjson
+except ImportError:  # Optional: without orjson, the stdlib encoder is used
+    orjson = None
+
+from . import metrics, swapi
+from .cache import TTLCache
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Encoded seeded responses kept per process (0 disables the cache)
+RESPONSE_CACHE_MAX_ENTRIES = 256
+RESPONSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+ENCODE_DURATION = metrics.REGISTRY.histogram(
+    'missions_encode_seconds', "Time spent encoding API responses.", ('format',),
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+)
+
+# Compact separators and raw UTF-8, matching orjson's output
+_stdlib_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+RESPONSE_CACHE = TTLCache(RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_MAX_BYTES, default_ttl=None)
+
+
+def dumps(obj):
+    """
+    Encode a JSON-serializable object.
+
+    Args:
+        obj: Object to encode
+
+    Returns:
+        bytes: Compact UTF-8 JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _stdlib_encoder.encode(obj).encode()
+
+
+def encode_tasks(tasks):
+    """
+    Encode missions as the {"tasks": [...]} body of /api/tasks/.
+
+    The list is encoded in one call and wrapped in place, without building
+    a response dict.
+
+    Args:
+        tasks (list): Mission strings
+
+    Returns:
+        bytes: JSON body
+    """
+    with ENCODE_DURATION.time(format='json'):
+        return b'{"tasks":' + dumps(tasks) + b'}'
+
+
+def ndjson_text(tasks):
+    """
+    Encode missions as NDJSON lines of the form {"task": "..."}.
+
+    Each line is filled into a string template around the encoded mission,
+    so no per-mission dict is created.
+
+    Args:
+        tasks (iterable): Mission strings
+
+    Returns:
+        str: Newline-terminated lines
+    """
+    return ''.join(['{"task":' + encode_basestring(task) + '}\n' for task in tasks])
+
+
+def encode_ndjson(tasks):
+    """
+    Encode missions as NDJSON bytes, one {"task": "..."} object per line.
+
+    Lines use the stdlib string template with either encoder: per-line
+    encoder calls dominate, and orjson is no faster for single strings.
+
+    Args:
+        tasks (iterable): Mission strings
+
+    Returns:
+        bytes: Newline-terminated lines
+    """
+    with ENCODE_DURATION.time(format='ndjson'):
+        return ndjson_text(tasks).encode()
+
+
+def seeded_cache_key(count, seed, theme=None):
+    """
+    Build the cache key of a seeded /api/tasks/ response.
+
+    Args:
+        count (int): Number of missions
+        seed (int): Request seed
+        theme (str): Requested theme, if any
+
+    Returns:
+        str: Cache key, bound to the current name pool generation
+    """
+    theme_part = f"_theme_{theme}" if theme is not None else ''
+    return f"tasks_{count}_{seed}{theme_part}_{swapi.get_pool_generation()}"
+
+
+def get_or_encode(key, build):
+    """
+    Get encoded response bytes from the cache, encoding them on a miss.
+
+    Args:
+        key (str): Cache key (see seeded_cache_key)
+        build (callable): Returns the encoded bytes
+
+    Returns:
+        bytes: Encoded response
+    """
+    body = RESPONSE_CACHE.get(key) if RESPONSE_CACHE_MAX_ENTRIES else None
+    if body is None:
+        body = build()
+        if RESPONSE_CACHE_MAX_ENTRIES:
+            RESPONSE_CACHE.set(key, body)
+    return body
+
+
+def configure(max_entries=None, max_bytes=None):
+    """
+    Resize the response cache, dropping its entries.
+
+    Args:
+        max_entries (int): Responses kept (0 disables the cache)
+        max_bytes (int): Approximate size budget in bytes
+    """
+    global RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_MAX_BYTES, RESPONSE_CACHE
+
+    if max_entries is not None:
+        RESPONSE_CACHE_MAX_ENTRIES = max_entries
+    if max_bytes is not None:
+        RESPONSE_CACHE_MAX_BYTES = max_bytes
+    RESPONSE_CACHE = TTLCache(RESPONSE_CACHE_MAX_ENTRIES or None, RESPONSE_CACHE_MAX_BYTES, default_ttl=None)
+
+
+def configure_from_settings(settings):
+    """
+    Apply MISSIONS_RESPONSE_CACHE_* settings.
+
+    Args:
+        settings: Django settings object
+    """
+    configure(
+        getattr(settings, 'MISSIONS_RESPONSE_CACHE_MAX_ENTRIES', RESPONSE_CACHE_MAX_ENTRIES),
+        getattr(settings, 'MISSIONS_RESPONSE_CACHE_MAX_BYTES', RESPONSE_CACHE_MAX_BYTES)
+    )
+
+
+@metrics.REGISTRY.register_collector
+def _collect_response_cache_metrics():
+    """Report the size and hit rate of the encoded response cache."""
+    stats = RESPONSE_CACHE.stats()
+    yield 'missions_response_cache_hits_total', 'counter', "Seeded responses served pre-encoded.", stats['hits']
+    yield 'missions_response_cache_misses_total', 'counter', "Seeded responses encoded on demand.", stats['misses']
+    yield 'missions_response_cache_bytes', 'gauge', "Approximate size of the encoded response cache.", stats['total_bytes']
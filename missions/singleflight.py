@@ -0,0 +1,140 @@
+import asyncio
+import threading
+import logging
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    __slots__ = ('event', 'result', 'error', 'cancelled')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.cancelled = False
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that load the same key.
+
+    The first caller for a key runs the loader; every caller arriving while
+    it is in flight waits for and shares its result or exception. Threads
+    use do(); coroutines use do_async(). Both share one table per process,
+    so callers on different threads and event loops are coalesced too.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.coalesced = 0
+
+    def _join(self, key):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+        return call, leader
+
+    def _finish(self, key, call):
+        with self._lock:
+            del self._calls[key]
+        call.event.set()
+
+    @staticmethod
+    def _shared_result(key, call, done, default):
+        if not done or call.cancelled:
+            logger.debug(f"Gave up waiting for in-flight load of {key}")
+            return default
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def do(self, key, fn, timeout=None, default=None):
+        """
+        Run fn() unless a call for key is already in flight elsewhere.
+
+        Args:
+            key (str): Key identifying the load (e.g. a cache key)
+            fn (callable): Loader, called without arguments
+            timeout (float): Seconds to wait for an in-flight call, or None
+                to wait until it is done
+            default: Returned when the in-flight call outlasts the timeout
+                or is cancelled
+
+        Returns:
+            Result of the (shared) fn() call, or default
+
+        Raises:
+            Exception: Whatever the shared fn() call raised
+        """
+        call, leader = self._join(key)
+
+        if not leader:
+            logger.debug(f"Waiting for in-flight load of {key}")
+            return self._shared_result(key, call, call.event.wait(timeout), default)
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            self._finish(key, call)
+
+    async def do_async(self, key, coro_fn, timeout=None, default=None):
+        """
+        Await coro_fn() unless a call for key is already in flight elsewhere.
+
+        Waiting for a call made on another thread or event loop happens on a
+        worker thread, so this loop keeps running meanwhile.
+
+        Args:
+            key (str): Key identifying the load (e.g. a cache key)
+            coro_fn (callable): Returns the coroutine to await
+            timeout (float): Seconds to wait for an in-flight call, or None
+                to wait until it is done
+            default: Returned when the in-flight call outlasts the timeout
+                or is cancelled
+
+        Returns:
+            Result of the (shared) coroutine, or default
+
+        Raises:
+            Exception: Whatever the shared coroutine raised
+        """
+        call, leader = self._join(key)
+
+        if not leader:
+            logger.debug(f"Waiting for in-flight load of {key}")
+            done = call.event.is_set() or await asyncio.to_thread(call.event.wait, timeout)
+            return self._shared_result(key, call, done, default)
+
+        try:
+            call.result = await coro_fn()
+            return call.result
+        except asyncio.CancelledError:
+            # The cancellation belongs to the leader's task, not to its waiters
+            call.cancelled = True
+            raise
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            self._finish(key, call)
+
+    def in_flight(self):
+        """
+        Get the number of loads currently in flight.
+
+        Returns:
+            int: Threaded and async in-flight loads
+        """
+        with self._lock:
+            return len(self._calls)
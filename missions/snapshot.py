@@ -0,0 +1,119 @@
+import os
+import json
+import logging
+from datetime import datetime, timezone
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Bump when the line format changes; older snapshots are rejected
+SNAPSHOT_VERSION = 1
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot file is missing, malformed or outdated."""
+
+
+def get_item_name(item):
+    """
+    Extract the display name of a SWAPI item.
+
+    Args:
+        item (dict): Item from a list or detail response
+
+    Returns:
+        str: Name (or film title), or None if the item has none
+    """
+    properties = item.get('properties') or {}
+    for name in (properties.get('name'), item.get('name'),
+                 properties.get('title'), item.get('title')):
+        if isinstance(name, str) and name.strip():
+            return name.strip()
+    return None
+
+
+def write_snapshot(path, catalog, source=None):
+    """
+    Write a catalog snapshot as JSON lines.
+
+    The first line is a header with the format version; every other line
+    holds one item as {"endpoint", "uid", "name"}. The file is written to a
+    temporary path first and then moved into place.
+
+    Args:
+        path (str): Destination file
+        catalog (dict): Mapping of endpoint name to list of SWAPI items
+        source (str): Base URL the catalog was crawled from
+
+    Returns:
+        dict: Number of items written per endpoint
+    """
+    counts = {}
+    tmp_path = f"{path}.tmp"
+
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        header = {
+            'version': SNAPSHOT_VERSION,
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'source': source,
+            'counts': {endpoint: len(items) for endpoint, items in catalog.items()}
+        }
+        f.write(json.dumps(header) + '\n')
+
+        for endpoint, items in catalog.items():
+            counts[endpoint] = 0
+            for item in items:
+                name = get_item_name(item)
+                if not name:
+                    continue
+                line = {'endpoint': endpoint, 'uid': item.get('uid'), 'name': name}
+                f.write(json.dumps(line, ensure_ascii=False, separators=(',', ':')) + '\n')
+                counts[endpoint] += 1
+
+    os.replace(tmp_path, path)
+    logger.info(f"Wrote SWAPI snapshot to {path}: {counts}")
+    return counts
+
+
+def load_snapshot(path):
+    """
+    Load a catalog snapshot written by write_snapshot.
+
+    Args:
+        path (str): Snapshot file
+
+    Returns:
+        dict: Mapping of endpoint name to list of {'uid', 'name'} items
+
+    Raises:
+        SnapshotError: If the file is missing, malformed or of another version
+    """
+    catalog = {}
+
+    try:
+        with open(path, encoding='utf-8') as f:
+            header = json.loads(f.readline() or 'null')
+            if not isinstance(header, dict) or header.get('version') != SNAPSHOT_VERSION:
+                raise SnapshotError(f"Unsupported snapshot version in {path}")
+
+            for endpoint in header.get('counts', {}):
+                catalog[endpoint] = []
+
+            for line in f:
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                catalog.setdefault(item['endpoint'], []).append(
+                    {'uid': item.get('uid'), 'name': item['name']}
+                )
+
+    except SnapshotError:
+        raise
+    except OSError as e:
+        raise SnapshotError(f"Cannot read snapshot {path}: {e}") from e
+    except (ValueError, KeyError, TypeError) as e:
+        raise SnapshotError(f"Malformed snapshot {path}: {e}") from e
+
+    logger.info(f"Loaded SWAPI snapshot from {path}: "
+                f"{sum(len(items) for items in catalog.values())} items")
+    return catalog
@@ -0,0 +1,131 @@
+import os
+import re
+import sys
+import json
+import time
+import logging
+import subprocess
+from collections import defaultdict
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# One line of `python -X importtime` output:
+# "import time:       843 |     131435 |   requests"
+_IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)\s*$')
+
+# Boots the app in a fresh interpreter the way a WSGI worker does, then
+# prints the time of each phase as JSON on the last line of stdout
+_CHILD_SCRIPT = '''
+import sys, json, time
+start = time.perf_counter()
+import django
+django.setup(set_prefix=False)
+setup = time.perf_counter()
+from django.core.handlers.wsgi import WSGIHandler
+WSGIHandler()
+handler = time.perf_counter()
+from django.urls import get_resolver
+get_resolver().url_patterns
+ready = time.perf_counter()
+print(json.dumps({
+    'setup_seconds': setup - start,
+    'handler_seconds': handler - setup,
+    'urls_seconds': ready - handler,
+    'ready_seconds': ready - start,
+    'modules_loaded': len(sys.modules),
+    'requests_imported': 'requests' in sys.modules,
+}))
+'''
+
+
+def parse_importtime(text):
+    """
+    Parse `python -X importtime` output.
+
+    Args:
+        text (str): stderr of the profiled interpreter
+
+    Returns:
+        list: One dict per import with 'module', 'self_us', 'cumulative_us'
+            and 'depth' (0 for modules imported directly by the script)
+    """
+    records = []
+    for line in text.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append({
+                'module': module,
+                'self_us': int(self_us),
+                'cumulative_us': int(cumulative_us),
+                'depth': max(len(indent) - 1, 0) // 2
+            })
+    return records
+
+
+def summarize(records, top=20):
+    """
+    Summarize import costs per module and per top-level package.
+
+    Args:
+        records (list): Output of parse_importtime
+        top (int): Number of entries to keep in each ranking
+
+    Returns:
+        dict: Total import time, the slowest modules by cumulative time and
+            the packages by the sum of their modules' own time
+    """
+    packages = defaultdict(int)
+    for record in records:
+        packages[record['module'].split('.')[0]] += record['self_us']
+
+    slowest = sorted(records, key=lambda record: record['cumulative_us'], reverse=True)[:top]
+    return {
+        'import_seconds': sum(record['self_us'] for record in records) / 1e6,
+        'modules': len(records),
+        'slowest_modules': slowest,
+        'packages': [
+            {'package': package, 'self_us': self_us}
+            for package, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+        ]
+    }
+
+
+def profile_startup(settings_module, top=20, python=sys.executable, cwd=None):
+    """
+    Boot the app in a fresh interpreter under -X importtime and report the cost.
+
+    Args:
+        settings_module (str): DJANGO_SETTINGS_MODULE of the profiled process
+        top (int): Number of entries to keep in each ranking
+        python (str): Interpreter to run
+        cwd (str): Project directory (default: the current directory)
+
+    Returns:
+        dict: Phase timings of the child process, process wall time and
+            the import summary
+
+    Raises:
+        RuntimeError: If the child process fails
+    """
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings_module)
+    started = time.perf_counter()
+    result = subprocess.run(
+        [python, '-X', 'importtime', '-c', _CHILD_SCRIPT],
+        capture_output=True, text=True, env=env, cwd=cwd
+    )
+    wall = time.perf_counter() - started
+
+    if result.returncode != 0:
+        raise RuntimeError(f"Startup of {settings_module} failed:\n{result.stderr[-2000:]}")
+
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    logger.info(f"{settings_module} ready in {timings['ready_seconds']:.3f}s")
+
+    return {
+        'settings': settings_module,
+        'process_seconds': wall,
+        **timings,
+        **summarize(parse_importtime(result.stderr), top)
+    }
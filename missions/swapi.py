@@ -1,12 +1,56 @@
-import requests
 import random
 import logging
+import math
+import sys
+import time
+import threading
+import contextvars
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+from . import http_client, metrics
+from .cache import TTLCache, DjangoCacheStore, FRESH, STALE
+from .snapshot import load_snapshot, get_item_name, SnapshotError
+from .singleflight import SingleFlight
+from . import resilience
+from .resilience import CircuitBreakers, RetryPolicy
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Cache configuration
+CACHE_TTL = 3600  # Seconds before a cached response is refetched
+CACHE_MAX_ENTRIES = 512
+CACHE_MAX_BYTES = 16 * 1024 * 1024
+CACHE_ALIAS = None  # Alias in settings.CACHES; None keeps the in-process cache
+
+# Stale-while-revalidate: serve expired entries for up to MAX_STALENESS
+# seconds while one background refresh per key reloads them
+STALE_WHILE_REVALIDATE = True
+MAX_STALENESS = 3600
+
 # Cache for API responses
-CACHE = {}
+CACHE = TTLCache(
+    max_entries=CACHE_MAX_ENTRIES,
+    max_bytes=CACHE_MAX_BYTES,
+    default_ttl=CACHE_TTL,
+    max_stale=MAX_STALENESS
+)
+
+# Background refresh bookkeeping
+REFRESH_STATS = {'refresh_success': 0, 'refresh_failure': 0}
+_REFRESHING = set()
+_REFRESH_LOCK = threading.Lock()
+_REVALIDATING = contextvars.ContextVar('swapi_revalidating', default=False)
+
+# Offline mode: serve items from a snapshot written by `manage.py swapi_sync`
+OFFLINE_MODE = False
+SNAPSHOT_PATH = None
+OFFLINE_CATALOG = {}
+
+# Coalesces concurrent loads of the same cache key
+FLIGHTS = SingleFlight()
+
 
 # API Configuration
 SWAPI_BASE = "https://www.swapi.tech/api"
@@ -20,255 +64,993 @@ SWAPI_ENDPOINTS = {
 }
 
 # Request configuration
-REQUEST_TIMEOUT = 10
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 10
 MAX_RETRIES = 3
+RETRY_BACKOFF = 0.25  # Delay ceiling before the first retry, doubling per retry
+RETRY_BACKOFF_MAX = 4.0
+RETRY_POLICY = RetryPolicy(MAX_RETRIES, RETRY_BACKOFF, RETRY_BACKOFF_MAX)
+REQUEST_DEADLINE = 8  # Upstream time budget of one API request, set by the views
+PAGE_SIZE = 10  # Page size of single-page fetches
+MAX_PAGE_SIZE = 100  # Largest page requested by crawls
+
+# Circuit breaker: after BREAKER_FAILURE_THRESHOLD consecutive failed
+# attempts an endpoint fails fast to the fallback names for BREAKER_COOLDOWN
+# seconds, then a single probe decides whether it is back
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN = 30
+BREAKERS = CircuitBreakers(BREAKER_FAILURE_THRESHOLD, BREAKER_COOLDOWN)
+
+# Crawl configuration
+MAX_CRAWL_PAGES = 3  # Page limit of sampled crawls
+PARALLEL_CRAWL = False
+CRAWL_WORKERS = 4
+
+# Name pools sample SAMPLE_MAX_ITEMS items per endpoint, or the entire
+# catalog with CRAWL_FULL_CATALOG
+SAMPLE_MAX_ITEMS = 50
+CRAWL_FULL_CATALOG = False
+
+# Statistics of the last crawl per endpoint
+CRAWL_STATS = {}
+_CRAWL = contextvars.ContextVar('swapi_crawl', default=None)
+
+# Entity types served by the name pools and the endpoint each one draws from
+ENTITY_ENDPOINTS = {
+    'character': 'people',
+    'planet': 'planets',
+    'starship': 'starships',
+    'vehicle': 'vehicles'
+}
+
+# Fallback names used when the API (or snapshot) yields no names
+FALLBACK_NAMES = {
+    # Well-known Star Wars characters
+    'character': (
+        "Luke Skywalker", "Darth Vader", "Princess Leia", "Han Solo",
+        "Obi-Wan Kenobi", "Yoda", "Chewbacca", "R2-D2", "C-3PO",
+        "Mace Windu", "Qui-Gon Jinn", "Padmé Amidala", "Anakin Skywalker",
+        "Ahsoka Tano", "Darth Revan", "Kyle Katarn", "Jango Fett",
+        "Boba Fett", "Emperor Palpatine", "Darth Maul"
+    ),
+    # Well-known Star Wars planets
+    'planet': (
+        "Tatooine", "Alderaan", "Yavin 4", "Hoth", "Dagobah",
+        "Bespin", "Endor", "Coruscant", "Naboo", "Kamino",
+        "Geonosis", "Utapau", "Kashyyyk", "Mustafar", "Dantooine",
+        "Korriban", "Tython", "Jakku", "Starkiller Base", "Crait"
+    ),
+    # Well-known Star Wars starships
+    'starship': (
+        "Millennium Falcon", "X-wing", "TIE Fighter", "Star Destroyer",
+        "Death Star", "Slave I", "Tantive IV", "Executor", "Venator",
+        "Jedi Starfighter", "Naboo Starfighter", "A-wing", "B-wing",
+        "Y-wing", "TIE Interceptor", "Lambda Shuttle", "Rebel Transport"
+    ),
+    # Well-known Star Wars vehicles
+    'vehicle': (
+        "Speeder Bike", "AT-AT", "AT-ST", "Landspeeder", "Snowspeeder",
+        "Pod Racer", "Swoop Bike", "Speeder Truck", "AT-TE", "LAAT",
+        "Sand Crawler", "Sail Barge", "Dewback", "Bantha", "Tauntaun"
+    )
+}
+
+# Name pools: entity_type -> (names tuple, monotonic time it goes stale)
+_NAME_POOLS = {}
+_NAME_POOLS_LOCK = threading.Lock()
+# Entity types whose last pool build found no names, so draws use fallbacks
+_FALLBACK_TYPES = set()
+# Bumped whenever a name pool is built, dropped or installed
+_POOL_GENERATION = 0
 
 
-def fetch_from_swapi(endpoint, page=1, max_pages=5):
+def build_page_url(endpoint, page, limit=None):
+    """
+    Build the list URL of one page of an endpoint.
+
+    Args:
+        endpoint (str): API endpoint (people, planets, etc.)
+        page (int): Page number
+        limit (int): Page size (default: PAGE_SIZE)
+
+    Returns:
+        str: Page URL
+    """
+    return f"{SWAPI_ENDPOINTS[endpoint]}?page={page}&limit={limit or PAGE_SIZE}"
+
+
+def page_cache_key(endpoint, page, limit=None):
+    """
+    Build the cache key of one page; the page size is part of it unless it is PAGE_SIZE.
+
+    Args:
+        endpoint (str): API endpoint
+        page (int): Page number
+        limit (int): Page size (default: PAGE_SIZE)
+
+    Returns:
+        str: Cache key
+    """
+    if limit is None or limit == PAGE_SIZE:
+        return f"{endpoint}_page_{page}"
+    return f"{endpoint}_page_{page}_limit_{limit}"
+
+
+def items_cache_key(endpoint, max_items, max_pages):
+    """
+    Build the cache key of a crawl; the page limit is part of it unless it is the default.
+
+    Args:
+        endpoint (str): API endpoint
+        max_items (int): Item limit, or None for the entire catalog
+        max_pages (int): Page limit, or None for no limit
+
+    Returns:
+        str: Cache key
+    """
+    cache_key = f"{endpoint}_all_items_{'all' if max_items is None else max_items}"
+    if max_pages != default_max_pages(max_items):
+        cache_key += f"_pages_{'all' if max_pages is None else max_pages}"
+    return cache_key
+
+
+def default_max_pages(max_items):
+    """
+    Get the page limit of a crawl that does not set one.
+
+    Args:
+        max_items (int): Item limit, or None for the entire catalog
+
+    Returns:
+        int: MAX_CRAWL_PAGES for sampled crawls, None (no limit) for the entire catalog
+    """
+    return None if max_items is None else MAX_CRAWL_PAGES
+
+
+def plan_page_size(max_items):
+    """
+    Pick the page size that collects max_items in the fewest requests.
+
+    Among the sizes needing the fewest requests the smallest one is used,
+    so the last page is not mostly thrown away.
+
+    Args:
+        max_items (int): Item limit, or None for the entire catalog
+
+    Returns:
+        int: Page size, at most MAX_PAGE_SIZE
+    """
+    if max_items is None:
+        return MAX_PAGE_SIZE
+    max_items = max(max_items, 1)
+    requests_needed = math.ceil(max_items / MAX_PAGE_SIZE)
+    return math.ceil(max_items / requests_needed)
+
+
+def parse_response(data):
+    """
+    Normalize a SWAPI response into the cached page format.
+
+    SWAPI.tech returns data in different formats: list endpoints use
+    'results', the films list and single item endpoints use 'result'.
+
+    Args:
+        data (dict): Decoded JSON response
+
+    Returns:
+        dict: {'results', 'next', 'previous', 'count'} or None if the
+            format is not recognized
+    """
+    if not isinstance(data, dict):
+        return None
+
+    if 'results' in data:
+        # List endpoint response
+        return {
+            'results': data['results'],
+            'next': data.get('next'),
+            'previous': data.get('previous'),
+            'count': data.get('count', data.get('total_records', 0))
+        }
+    elif isinstance(data.get('result'), list):
+        # Films list endpoint returns its items under 'result'
+        return {
+            'results': data['result'],
+            'next': None,
+            'previous': None,
+            'count': len(data['result'])
+        }
+    elif 'result' in data:
+        # Single item endpoint response
+        return {
+            'results': [data['result']],
+            'next': None,
+            'previous': None,
+            'count': 1
+        }
+
+    return None
+
+
+def fetch_from_swapi(endpoint, page=1, *, limit=None):
     """
     Fetch data from SWAPI with pagination support and error handling.
 
     Args:
         endpoint (str): API endpoint (people, planets, etc.)
         page (int): Page number to fetch
-        max_pages (int): Maximum pages to fetch
+        limit (int): Page size (default: PAGE_SIZE)
 
     Returns:
         dict: API response data or None if failed
     """
-    cache_key = f"{endpoint}_page_{page}"
-
-    # Check cache first
-    if cache_key in CACHE:
-        logger.debug(f"Using cached data for {cache_key}")
-        return CACHE[cache_key]
+    cache_key = page_cache_key(endpoint, page, limit)
 
     if endpoint not in SWAPI_ENDPOINTS:
         logger.error(f"Invalid endpoint: {endpoint}")
         return None
 
-    url = f"{SWAPI_ENDPOINTS[endpoint]}?page={page}&limit=10"
+    # Check cache first
+    cached = get_cached(cache_key, lambda: _fetch_page(endpoint, page, cache_key, limit))
+    if cached is not None:
+        logger.debug(f"Using cached data for {cache_key}")
+        return cached
+
+    # Only one request per page is in flight; concurrent callers share it
+    # for as long as their deadline allows
+    return FLIGHTS.do(
+        cache_key,
+        lambda: _fetch_page(endpoint, page, cache_key, limit),
+        timeout=resilience.remaining_time()
+    )
+
+
+def _fetch_page(endpoint, page, cache_key, limit=None):
+    """
+    Request one page from SWAPI with retries and cache the parsed result.
+
+    Args:
+        endpoint (str): API endpoint (people, planets, etc.)
+        page (int): Page number to fetch
+        cache_key (str): Cache key for the page
+        limit (int): Page size (default: PAGE_SIZE)
+
+    Returns:
+        dict: API response data or None if failed
+    """
+    url = build_page_url(endpoint, page, limit)
+    breaker = BREAKERS.get(endpoint)
+
+    for attempt in range(1, RETRY_POLICY.max_attempts + 1):
+        timeout = request_timeout()
+        if timeout is None:
+            logger.warning(f"Deadline exceeded before requesting {url}")
+            metrics.UPSTREAM_FAILURES.inc(endpoint=endpoint)
+            return None
+
+        if not allow_upstream(endpoint):
+            return None
 
-    for attempt in range(MAX_RETRIES):
         try:
-            logger.debug(f"Fetching from {url} (attempt {attempt + 1})")
-            response = requests.get(url, timeout=REQUEST_TIMEOUT)
+            logger.debug(f"Fetching from {url} (attempt {attempt})")
+            with metrics.UPSTREAM_LATENCY.time(endpoint=endpoint):
+                response = http_client.get(url, timeout=timeout)
+            record_transfer(response.content)
             response.raise_for_status()
 
             data = response.json()
 
-            # SWAPI.tech returns data in different format
-            # Check if response has 'results' (list endpoint) or 'result' (single item)
-            if 'results' in data:
-                # List endpoint response
-                processed_data = {
-                    'results': data['results'],
-                    'next': data.get('next'),
-                    'previous': data.get('previous'),
-                    'count': data.get('count', 0)
-                }
-            elif 'result' in data:
-                # Single item endpoint response
-                processed_data = {
-                    'results': [data['result']],
-                    'next': None,
-                    'previous': None,
-                    'count': 1
-                }
-            else:
+            processed_data = parse_response(data)
+            if processed_data is None:
                 logger.error(f"Unexpected response format from {url}")
+                record_upstream_failure(endpoint)
+                metrics.UPSTREAM_FAILURES.inc(endpoint=endpoint)
                 return None
 
+            breaker.record_success()
+
             # Cache the response
             CACHE[cache_key] = processed_data
             logger.debug(f"Successfully fetched and cached {cache_key}")
 
             return processed_data
 
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Request failed for {url} (attempt {attempt + 1}): {e}")
-            if attempt == MAX_RETRIES - 1:
-                logger.error(f"All {MAX_RETRIES} attempts failed for {url}")
+        except http_client.RequestException as e:
+            delay = plan_retry(endpoint, url, attempt, e)
+            if delay is None:
                 return None
+            time.sleep(delay)
 
         except ValueError as e:
             logger.error(f"Invalid JSON response from {url}: {e}")
+            record_upstream_failure(endpoint)
+            metrics.UPSTREAM_FAILURES.inc(endpoint=endpoint)
             return None
 
     return None
 
 
-def get_all_items_from_endpoint(endpoint, max_items=50):
+def request_timeout():
+    """
+    Get the (connect, read) timeouts for the next attempt.
+
+    Both are clipped to the time left before the current deadline.
+
+    Returns:
+        tuple: (connect, read) seconds, or None if the deadline has passed
+    """
+    remaining = resilience.remaining_time()
+    if remaining is None:
+        return (CONNECT_TIMEOUT, READ_TIMEOUT)
+    if remaining <= 0:
+        return None
+    return (min(CONNECT_TIMEOUT, remaining), min(READ_TIMEOUT, remaining))
+
+
+def plan_retry(endpoint, url, attempt, error):
+    """
+    Handle a failed attempt and decide whether to retry it.
+
+    Permanent errors (4xx) are not retried. Upstream did answer them, so
+    they count as a success for the circuit breaker, which also ends a
+    half-open probe. A retry is skipped when its delay would not leave any
+    of the deadline for the attempt itself.
+
+    Args:
+        endpoint (str): API endpoint
+        url (str): Requested URL
+        attempt (int): Number of the failed attempt (1-based)
+        error (Exception): Exception of the attempt
+
+    Returns:
+        float: Seconds to wait before retrying, or None to give up
+    """
+    logger.warning(f"Request failed for {url} (attempt {attempt}): {error}")
+
+    if not RETRY_POLICY.is_retryable(error):
+        logger.error(f"Not retrying {url}: {error}")
+        BREAKERS.get(endpoint).record_success()
+        metrics.UPSTREAM_FAILURES.inc(endpoint=endpoint)
+        return None
+
+    record_upstream_failure(endpoint)
+
+    if attempt >= RETRY_POLICY.max_attempts:
+        logger.error(f"All {RETRY_POLICY.max_attempts} attempts failed for {url}")
+        metrics.UPSTREAM_FAILURES.inc(endpoint=endpoint)
+        return None
+
+    delay = RETRY_POLICY.delay(attempt, error)
+    remaining = resilience.remaining_time()
+    if remaining is not None and delay >= remaining:
+        logger.error(f"Deadline leaves no time to retry {url}")
+        metrics.UPSTREAM_FAILURES.inc(endpoint=endpoint)
+        return None
+
+    metrics.UPSTREAM_RETRIES.inc(endpoint=endpoint)
+    logger.debug(f"Retrying {url} in {delay:.2f}s")
+    return delay
+
+
+def allow_upstream(endpoint):
+    """
+    Check the endpoint's circuit breaker before a request.
+
+    Args:
+        endpoint (str): API endpoint
+
+    Returns:
+        bool: False while the circuit is open; callers then use fallbacks
+    """
+    if BREAKERS.get(endpoint).allow_request():
+        return True
+
+    logger.debug(f"Circuit for {endpoint} is open, skipping request")
+    metrics.CIRCUIT_REJECTIONS.inc(endpoint=endpoint)
+    return False
+
+
+def record_upstream_failure(endpoint):
+    """
+    Count a failed request attempt against the endpoint's circuit breaker.
+
+    Args:
+        endpoint (str): API endpoint
+    """
+    if BREAKERS.get(endpoint).record_failure():
+        metrics.CIRCUIT_OPENED.inc(endpoint=endpoint)
+
+
+def get_all_items_from_endpoint(endpoint, max_items=50, parallel=None, max_pages=None):
     """
     Get multiple items from an endpoint by fetching multiple pages.
 
+    Pages are requested with the page size that collects max_items in the
+    fewest requests (at most MAX_PAGE_SIZE).
+
     Args:
         endpoint (str): API endpoint
-        max_items (int): Maximum number of items to collect
+        max_items (int): Maximum number of items to collect, or None for
+            the entire catalog
+        parallel (bool): Fetch the remaining pages concurrently
+            (default: PARALLEL_CRAWL)
+        max_pages (int): Maximum number of pages to fetch (default:
+            MAX_CRAWL_PAGES, or no limit for the entire catalog)
 
     Returns:
         list: List of items or empty list if failed
     """
-    cache_key = f"{endpoint}_all_items"
+    if OFFLINE_MODE:
+        return OFFLINE_CATALOG.get(endpoint, [])[:max_items]
+
+    if max_pages is None:
+        max_pages = default_max_pages(max_items)
+
+    cache_key = items_cache_key(endpoint, max_items, max_pages)
+
+    if parallel is None:
+        parallel = PARALLEL_CRAWL
+
+    cached = get_cached(
+        cache_key,
+        lambda: _crawl_endpoint(endpoint, max_items, parallel, cache_key, keep_stale=True, max_pages=max_pages)
+    )
+    if cached is not None:
+        return cached
+
+    # Only one crawl per endpoint and limit is in flight
+    return FLIGHTS.do(
+        cache_key,
+        lambda: _crawl_endpoint(endpoint, max_items, parallel, cache_key, max_pages=max_pages),
+        timeout=resilience.remaining_time(),
+        default=[]
+    )
+
+
+def _crawl_endpoint(endpoint, max_items, parallel, cache_key, keep_stale=False, max_pages=None):
+    """
+    Crawl an endpoint, cache the collected items and record the crawl stats.
+
+    An empty crawl (upstream down or its circuit open) is only cached for
+    BREAKER_COOLDOWN seconds, so the endpoint is tried again once its
+    circuit lets a probe through.
+
+    Args:
+        endpoint (str): API endpoint
+        max_items (int): Maximum number of items to collect, or None for all
+        parallel (bool): Fetch the remaining pages concurrently
+        cache_key (str): Cache key for the items
+        keep_stale (bool): On an empty crawl, report a failure so the cached
+            (stale) items are kept
+        max_pages (int): Maximum number of pages to fetch, or None for no limit
+
+    Returns:
+        list: Collected items, or None for an empty crawl with keep_stale
+    """
+    limit = plan_page_size(max_items)
+
+    with crawl_stats(endpoint, limit) as stats:
+        if parallel:
+            all_items = _crawl_pages_parallel(endpoint, max_items, max_pages, limit)
+        else:
+            all_items = _crawl_pages_sequential(endpoint, max_items, max_pages=max_pages, limit=limit)
+        all_items = all_items[:max_items]
+        stats.items = len(all_items)
+
+    if not all_items and keep_stale:
+        return None
+
+    cache_crawl(cache_key, all_items)
+    return all_items
+
+
+def cache_crawl(cache_key, items):
+    """
+    Cache the items of a crawl.
+
+    Empty crawls expire after BREAKER_COOLDOWN (at most CACHE_TTL) seconds
+    rather than CACHE_TTL, so an outage does not pin the fallback names.
+
+    Args:
+        cache_key (str): Cache key for the items
+        items (list): Collected items
+    """
+    if items:
+        CACHE[cache_key] = items
+    elif BREAKER_COOLDOWN:
+        CACHE.set(cache_key, items, ttl=min(BREAKER_COOLDOWN, CACHE_TTL or BREAKER_COOLDOWN))
+
+
+class CrawlStats:
+    """Counters of one endpoint crawl."""
+
+    def __init__(self, endpoint, page_size):
+        self.endpoint = endpoint
+        self.page_size = page_size
+        self.pages = 0
+        self.requests = 0
+        self.items = 0
+        self.bytes = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add_page(self):
+        with self._lock:
+            self.pages += 1
+
+    def add_request(self, size):
+        with self._lock:
+            self.requests += 1
+            self.bytes += size
+
+    def as_dict(self):
+        return {
+            'page_size': self.page_size,
+            'pages': self.pages,
+            'requests': self.requests,
+            'items': self.items,
+            'bytes': self.bytes,
+            'seconds': self.seconds
+        }
+
+
+@contextmanager
+def crawl_stats(endpoint, page_size):
+    """
+    Collect the stats of the crawl in the with block into CRAWL_STATS.
+
+    Page requests made in the block, including those on worker threads
+    started with a copied context, are counted.
+
+    Args:
+        endpoint (str): API endpoint
+        page_size (int): Requested page size
+
+    Yields:
+        CrawlStats: Counters of the crawl
+    """
+    stats = CrawlStats(endpoint, page_size)
+    token = _CRAWL.set(stats)
+    start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats.seconds = time.perf_counter() - start
+        _CRAWL.reset(token)
+        CRAWL_STATS[endpoint] = stats.as_dict()
+        logger.info(
+            f"Crawled {endpoint}: {stats.items} items, {stats.pages} pages, "
+            f"{stats.requests} requests, {stats.bytes} bytes in {stats.seconds:.2f}s"
+        )
+
+
+def record_transfer(content):
+    """
+    Count an upstream response towards the current crawl, if any.
+
+    Args:
+        content (bytes): Response body
+    """
+    stats = _CRAWL.get()
+    if stats is not None:
+        stats.add_request(len(content) if isinstance(content, (bytes, bytearray)) else 0)
 
-    if cache_key in CACHE:
-        return CACHE[cache_key]
 
-    all_items = []
-    page = 1
+def record_page():
+    """Count a page read (from upstream or the cache) towards the current crawl, if any."""
+    stats = _CRAWL.get()
+    if stats is not None:
+        stats.add_page()
+
+
+def get_crawl_stats():
+    """
+    Get the stats of the last crawl of every endpoint.
+
+    Returns:
+        dict: Mapping of endpoint to page size, pages, requests, items,
+            bytes and seconds
+    """
+    return dict(CRAWL_STATS)
+
+
+def get_cached(cache_key, refresh):
+    """
+    Get a cached value, serving stale values while they are refreshed.
+
+    A fresh value is returned as is. An expired value still within
+    MAX_STALENESS is returned immediately and one background refresh per
+    key is started. Inside a background refresh stale values count as
+    misses, so the refresh reloads them instead.
+
+    Args:
+        cache_key (str): Cache key
+        refresh (callable): Reloads and caches the value; returns None on failure
+
+    Returns:
+        Cached value, or None if the caller must load it
+    """
+    value, state = CACHE.lookup(cache_key)
 
-    while len(all_items) < max_items:
-        data = fetch_from_swapi(endpoint, page)
+    if state == FRESH:
+        return value
+
+    if state == STALE and STALE_WHILE_REVALIDATE and not _REVALIDATING.get():
+        _schedule_refresh(cache_key, refresh)
+        return value
+
+    return None
+
+
+def _schedule_refresh(cache_key, refresh):
+    with _REFRESH_LOCK:
+        if cache_key in _REFRESHING:
+            return
+        _REFRESHING.add(cache_key)
+
+    context = contextvars.copy_context()
+    thread = threading.Thread(
+        target=context.run,
+        args=(_refresh, cache_key, refresh),
+        name=f"swapi-refresh-{cache_key}",
+        daemon=True
+    )
+    thread.start()
+
+
+def _refresh(cache_key, refresh):
+    _REVALIDATING.set(True)
+    try:
+        # Share the load with any caller that found the entry past MAX_STALENESS;
+        # the refresh outlives the request, so its deadline does not apply
+        with resilience.deadline(None):
+            result = FLIGHTS.do(cache_key, refresh)
+    except Exception as e:
+        logger.error(f"Background refresh of {cache_key} failed: {e}")
+        result = None
+    finally:
+        with _REFRESH_LOCK:
+            _REFRESHING.discard(cache_key)
+
+    with _REFRESH_LOCK:
+        if result is None:
+            REFRESH_STATS['refresh_failure'] += 1
+        else:
+            REFRESH_STATS['refresh_success'] += 1
+
+    if result is None:
+        logger.warning(f"Background refresh of {cache_key} failed, keeping stale data")
+        return
+
+    logger.info(f"Background refresh of {cache_key} succeeded")
+
+    # Swap in name pools built from the refreshed items; the old pools keep
+    # serving until then, so draws never wait for a crawl
+    max_items = catalog_max_items()
+    for entity_type, endpoint in ENTITY_ENDPOINTS.items():
+        if cache_key == items_cache_key(endpoint, max_items, default_max_pages(max_items)):
+            update_name_pool(entity_type, result)
+
+
+def _crawl_pages_sequential(endpoint, max_items, start_page=1, all_items=None, max_pages=None, limit=None):
+    """
+    Fetch pages one after another, following 'next' links.
+
+    Args:
+        endpoint (str): API endpoint
+        max_items (int): Maximum number of items to collect, or None for all
+        start_page (int): First page to fetch
+        all_items (list): Items collected so far
+        max_pages (int): Last page to fetch, or None for no limit
+        limit (int): Page size
+
+    Returns:
+        list: Collected items (may exceed max_items)
+    """
+    all_items = [] if all_items is None else all_items
+    page = start_page
+
+    while max_items is None or len(all_items) < max_items:
+        data = fetch_from_swapi(endpoint, page, limit=limit)
 
         if not data or not data.get('results'):
             break
 
+        record_page()
         items = data.get('results', [])
         all_items.extend(items)
 
         # Check if there are more pages
         # SWAPI.tech uses 'next' in the response to indicate more pages
-        if not data.get('next') or page >= 3:  # Limit to 3 pages max for faster response
+        if not data.get('next') or (max_pages is not None and page >= max_pages):
             break
 
         page += 1
 
-    # Cache the collected items
-    CACHE[cache_key] = all_items[:max_items]
-    return all_items[:max_items]
+    return all_items
 
 
-def get_random_character():
+def plan_remaining_pages(first, max_items, max_pages=None):
     """
-    Get a random character name from the Star Wars API.
+    Work out which pages follow page 1 for a concurrent crawl.
+
+    The page size is taken from page 1 itself, since servers may return
+    fewer items per page than requested.
+
+    Args:
+        first (dict): Parsed page 1 response
+        max_items (int): Maximum number of items to collect, or None for all
+        max_pages (int): Maximum number of pages, or None for no limit
 
     Returns:
-        str: Random character name
+        range: Page numbers still to fetch (possibly empty), or None if
+            page 1 does not report a total 'count'
     """
-    try:
-        characters = get_all_items_from_endpoint('people')
-
-        if characters:
-            character = random.choice(characters)
-            # SWAPI.tech format: data is in 'properties' object
-            properties = character.get('properties', {})
-            name = properties.get('name')
-
-            if name and name.strip():
-                logger.debug(f"Selected random character: {name}")
-                return name
-            else:
-                # Fallback: try to get name directly (in case format changes)
-                name = character.get('name')
-                if name and name.strip():
-                    logger.debug(f"Selected random character (direct): {name}")
-                    return name
-
-        logger.warning("No characters found in API response, using fallback")
+    page_size = len(first.get('results', []))
 
-    except Exception as e:
-        logger.error(f"Error getting random character: {e}")
+    if not first.get('next') or not page_size or (max_items is not None and page_size >= max_items):
+        return range(0)
 
-    # Fallback to well-known Star Wars characters
-    fallback_characters = [
-        "Luke Skywalker", "Darth Vader", "Princess Leia", "Han Solo",
-        "Obi-Wan Kenobi", "Yoda", "Chewbacca", "R2-D2", "C-3PO",
-        "Mace Windu", "Qui-Gon Jinn", "Padmé Amidala", "Anakin Skywalker",
-        "Ahsoka Tano", "Darth Revan", "Kyle Katarn", "Jango Fett",
-        "Boba Fett", "Emperor Palpatine", "Darth Maul"
-    ]
+    count = first.get('count') or 0
+    if not count:
+        return None
 
-    selected = random.choice(fallback_characters)
-    logger.debug(f"Using fallback character: {selected}")
-    return selected
+    total_pages = math.ceil(count / page_size)
+    if max_items is not None:
+        total_pages = min(total_pages, math.ceil(max_items / page_size))
+    if max_pages is not None:
+        total_pages = min(total_pages, max_pages)
+    return range(2, total_pages + 1)
 
 
-def get_random_planet():
+def _crawl_pages_parallel(endpoint, max_items, max_pages=None, limit=None):
     """
-    Get a random planet name from the Star Wars API.
+    Fetch page 1, then the remaining pages concurrently.
+
+    The total page count is derived from the 'count' reported by page 1,
+    bounded by max_pages and by the pages needed for max_items.
+    Pages are concatenated in page order and stop at the first failed page.
+
+    Args:
+        endpoint (str): API endpoint
+        max_items (int): Maximum number of items to collect, or None for all
+        max_pages (int): Maximum number of pages, or None for no limit
+        limit (int): Page size
 
     Returns:
-        str: Random planet name
+        list: Collected items (may exceed max_items)
     """
-    try:
-        planets = get_all_items_from_endpoint('planets')
-
-        if planets:
-            planet = random.choice(planets)
-            # SWAPI.tech format: data is in 'properties' object
-            properties = planet.get('properties', {})
-            name = properties.get('name')
-
-            if name and name.strip():
-                logger.debug(f"Selected random planet: {name}")
-                return name
-            else:
-                # Fallback: try to get name directly
-                name = planet.get('name')
-                if name and name.strip():
-                    logger.debug(f"Selected random planet (direct): {name}")
-                    return name
-
-        logger.warning("No planets found in API response, using fallback")
+    first = fetch_from_swapi(endpoint, 1, limit=limit)
 
-    except Exception as e:
-        logger.error(f"Error getting random planet: {e}")
+    if not first or not first.get('results'):
+        return []
 
-    # Fallback to well-known Star Wars planets
-    fallback_planets = [
-        "Tatooine", "Alderaan", "Yavin 4", "Hoth", "Dagobah",
-        "Bespin", "Endor", "Coruscant", "Naboo", "Kamino",
-        "Geonosis", "Utapau", "Kashyyyk", "Mustafar", "Dantooine",
-        "Korriban", "Tython", "Jakku", "Starkiller Base", "Crait"
-    ]
+    record_page()
+    all_items = list(first['results'])
 
-    selected = random.choice(fallback_planets)
-    logger.debug(f"Using fallback planet: {selected}")
-    return selected
+    pages = plan_remaining_pages(first, max_items, max_pages)
+    if pages is None:
+        # No total reported: fall back to following 'next' links
+        return _crawl_pages_sequential(endpoint, max_items, start_page=2, all_items=all_items,
+                                       max_pages=max_pages, limit=limit)
 
+    if not pages:
+        return all_items
 
-def get_random_starship():
+    logger.debug(f"Crawling {endpoint} pages 2-{pages[-1]} with {CRAWL_WORKERS} workers")
+
+    with ThreadPoolExecutor(max_workers=min(CRAWL_WORKERS, len(pages))) as executor:
+        # executor.map yields results in page order
+        context = contextvars.copy_context()
+        fetch = lambda page: context.copy().run(fetch_from_swapi, endpoint, page, limit=limit)
+        for data in executor.map(fetch, pages):
+            if not data or not data.get('results'):
+                break
+            record_page()
+            all_items.extend(data['results'])
+
+    return all_items
+
+
+def build_name_pool(items):
     """
-    Get a random starship name from the Star Wars API.
+    Extract the valid names of SWAPI items into a compact tuple.
+
+    Args:
+        items (list): SWAPI items
 
     Returns:
-        str: Random starship name
+        tuple: Interned, non-empty names in item order
     """
-    try:
-        starships = get_all_items_from_endpoint('starships')
-
-        if starships:
-            starship = random.choice(starships)
-            # SWAPI.tech format: data is in 'properties' object
-            properties = starship.get('properties', {})
-            name = properties.get('name')
-
-            if name and name.strip():
-                logger.debug(f"Selected random starship: {name}")
-                return name
-            else:
-                # Fallback: try to get name directly
-                name = starship.get('name')
-                if name and name.strip():
-                    logger.debug(f"Selected random starship (direct): {name}")
-                    return name
-
-        logger.warning("No starships found in API response, using fallback")
+    names = []
+    for item in items:
+        name = get_item_name(item) if isinstance(item, dict) else None
+        if name:
+            names.append(sys.intern(name))
+    return tuple(names)
+
+
+def get_fresh_name_pool(entity_type):
+    """
+    Get the name pool of an entity type only if it is built and not stale.
+
+    Args:
+        entity_type (str): One of ENTITY_ENDPOINTS
+
+    Returns:
+        tuple: Names, or None if the pool needs to be (re)built
+    """
+    entry = _NAME_POOLS.get(entity_type)
+    if entry is not None and (entry[1] is None or time.monotonic() < entry[1]):
+        return entry[0]
+    return None
+
+
+def _bump_pool_generation():
+    """Record a name pool change; call with _NAME_POOLS_LOCK held."""
+    global _POOL_GENERATION
+    _POOL_GENERATION += 1
+
+
+def update_name_pool(entity_type, items):
+    """
+    Build an entity type's name pool from catalog items and swap it in.
+
+    Pools are kept per process for CACHE_TTL seconds. Empty pools are not
+    kept, so the catalog is retried once its failed crawl expires.
+
+    Args:
+        entity_type (str): One of ENTITY_ENDPOINTS
+        items (list): SWAPI items of the entity type's endpoint
+
+    Returns:
+        tuple: Names (may be empty)
+    """
+    pool = build_name_pool(items)
+
+    if not pool:
+        # Warn once when names switch to the fallbacks, not on every draw
+        with _NAME_POOLS_LOCK:
+            switched = entity_type not in _FALLBACK_TYPES
+            _FALLBACK_TYPES.add(entity_type)
+        if switched:
+            logger.warning(f"No {entity_type} names found in API response, using fallback")
+        return pool
+
+    stale_at = None if OFFLINE_MODE or not CACHE_TTL else time.monotonic() + CACHE_TTL
+    with _NAME_POOLS_LOCK:
+        _NAME_POOLS[entity_type] = (pool, stale_at)
+        _bump_pool_generation()
+        recovered = entity_type in _FALLBACK_TYPES
+        _FALLBACK_TYPES.discard(entity_type)
+    if recovered:
+        logger.info(f"{entity_type.capitalize()} names available again, no longer using fallback")
+    logger.debug(f"Built {entity_type} name pool with {len(pool)} names")
+    return pool
+
+
+def get_pool_generation():
+    """
+    Get a number that changes whenever the name pools change.
+
+    Anything derived from the pools (e.g. encoded seeded responses) can
+    include it in its cache key to be invalidated on a catalog refresh.
+
+    Returns:
+        int: Pool generation
+    """
+    return _POOL_GENERATION
+
+
+def catalog_max_items():
+    """
+    Get the number of items the name pools are built from.
+
+    Returns:
+        int: SAMPLE_MAX_ITEMS, or None (entire catalog) with CRAWL_FULL_CATALOG
+    """
+    return None if CRAWL_FULL_CATALOG else SAMPLE_MAX_ITEMS
+
+
+def get_name_pool(entity_type):
+    """
+    Get the name pool of an entity type, rebuilding it once per catalog refresh.
+
+    Only one build per entity type runs at a time; concurrent draws of the
+    same type wait for it until their deadline, and draws of other types
+    are never held up by it.
+
+    Args:
+        entity_type (str): One of ENTITY_ENDPOINTS
+
+    Returns:
+        tuple: Names (may be empty)
+    """
+    pool = get_fresh_name_pool(entity_type)
+    if pool is not None:
+        return pool
+
+    return FLIGHTS.do(
+        f"name_pool_{entity_type}",
+        lambda: _load_name_pool(entity_type),
+        timeout=resilience.remaining_time(),
+        default=()
+    )
+
+
+def _load_name_pool(entity_type):
+    # A build that finished just before this flight started may have stored it
+    pool = get_fresh_name_pool(entity_type)
+    if pool is not None:
+        return pool
+
+    items = get_all_items_from_endpoint(ENTITY_ENDPOINTS[entity_type], catalog_max_items())
+    return update_name_pool(entity_type, items)
+
+
+def sample(entity_type, k=1, rng=None):
+    """
+    Draw random names of one entity type, with replacement.
+
+    Each draw is a single index into a precomputed tuple. Falls back to
+    FALLBACK_NAMES when no names are available.
+
+    Args:
+        entity_type (str): 'character', 'planet', 'starship' or 'vehicle'
+        k (int): Number of names to draw
+        rng (random.Random): Random generator (default: the random module)
+
+    Returns:
+        list: k names
 
+    Raises:
+        ValueError: If entity_type is unknown
+    """
+    if entity_type not in ENTITY_ENDPOINTS:
+        raise ValueError(f"Unknown entity type: {entity_type}")
+
+    try:
+        pool = get_name_pool(entity_type)
     except Exception as e:
-        logger.error(f"Error getting random starship: {e}")
+        logger.error(f"Error getting {entity_type} names: {e}")
+        pool = ()
 
-    # Fallback to well-known Star Wars starships
-    fallback_starships = [
-        "Millennium Falcon", "X-wing", "TIE Fighter", "Star Destroyer",
-        "Death Star", "Slave I", "Tantive IV", "Executor", "Venator",
-        "Jedi Starfighter", "Naboo Starfighter", "A-wing", "B-wing",
-        "Y-wing", "TIE Interceptor", "Lambda Shuttle", "Rebel Transport"
-    ]
+    if not pool:
+        pool = FALLBACK_NAMES[entity_type]
+        metrics.FALLBACK_NAMES_USED.inc(k, entity_type=entity_type)
+        logger.debug(f"Using fallback {entity_type} names")
+
+    return (rng or random).choices(pool, k=k)
+
+
+def get_random_character():
+    """
+    Get a random character name from the Star Wars API.
 
-    selected = random.choice(fallback_starships)
-    logger.debug(f"Using fallback starship: {selected}")
-    return selected
+    Returns:
+        str: Random character name
+    """
+    return sample('character')[0]
+
+
+def get_random_planet():
+    """
+    Get a random planet name from the Star Wars API.
+
+    Returns:
+        str: Random planet name
+    """
+    return sample('planet')[0]
+
+
+def get_random_starship():
+    """
+    Get a random starship name from the Star Wars API.
+
+    Returns:
+        str: Random starship name
+    """
+    return sample('starship')[0]
 
 
 def get_random_vehicle():
@@ -278,46 +1060,186 @@ def get_random_vehicle():
     Returns:
         str: Random vehicle name
     """
+    return sample('vehicle')[0]
+
+
+def install_name_pools(pools, ttl=None):
+    """
+    Use the given names as name pools until they are cleared or go stale.
+
+    Lets worker processes draw from pools built once by their parent
+    instead of crawling SWAPI themselves.
+
+    Args:
+        pools (dict): Mapping of entity type to a sequence of names
+        ttl (float): Seconds until the pools are rebuilt from the catalog
+            (None keeps them until cleared)
+    """
+    stale_at = None if ttl is None else time.monotonic() + ttl
+    with _NAME_POOLS_LOCK:
+        for entity_type, names in pools.items():
+            _NAME_POOLS[entity_type] = (tuple(sys.intern(name) for name in names), stale_at)
+        _bump_pool_generation()
+
+
+def name_pools_loaded():
+    """
+    Check whether every entity type has a name pool, fresh or stale.
+
+    Returns:
+        bool: True once no draw has to wait for a crawl
+    """
+    return all(entity_type in _NAME_POOLS for entity_type in ENTITY_ENDPOINTS)
+
+
+def clear_name_pools():
+    """Drop the name pools so they are rebuilt on the next draw."""
+    with _NAME_POOLS_LOCK:
+        _NAME_POOLS.clear()
+        _bump_pool_generation()
+
+
+def set_base_url(base_url, clear=True):
+    """
+    Point the client at another SWAPI-compatible server.
+
+    Updates SWAPI_BASE and every URL in SWAPI_ENDPOINTS, and clears the
+    cache so no data from the previous server is served.
+
+    Args:
+        base_url (str): Base URL such as "http://127.0.0.1:8001/api"
+        clear (bool): Clear the cache; pass False when nothing has been
+            fetched from the previous server yet
+    """
+    global SWAPI_BASE
+
+    SWAPI_BASE = base_url.rstrip('/')
+    for endpoint in SWAPI_ENDPOINTS:
+        SWAPI_ENDPOINTS[endpoint] = f"{SWAPI_BASE}/{endpoint}"
+
+    if clear:
+        clear_cache()
+    logger.info(f"Using SWAPI at {SWAPI_BASE}")
+
+
+def load_offline_catalog(path):
+    """
+    Switch to offline mode, serving items from a catalog snapshot.
+
+    If the snapshot cannot be read the catalog stays empty, so the random
+    name helpers use their fallback names instead of the network.
+
+    Args:
+        path (str): Snapshot file written by `manage.py swapi_sync`
+
+    Returns:
+        bool: True if the snapshot was loaded
+    """
+    global OFFLINE_MODE, OFFLINE_CATALOG, SNAPSHOT_PATH
+
+    OFFLINE_MODE = True
+    SNAPSHOT_PATH = path
+
     try:
-        vehicles = get_all_items_from_endpoint('vehicles')
-
-        if vehicles:
-            vehicle = random.choice(vehicles)
-            # SWAPI.tech format: data is in 'properties' object
-            properties = vehicle.get('properties', {})
-            name = properties.get('name')
-
-            if name and name.strip():
-                logger.debug(f"Selected random vehicle: {name}")
-                return name
-            else:
-                # Fallback: try to get name directly
-                name = vehicle.get('name')
-                if name and name.strip():
-                    logger.debug(f"Selected random vehicle (direct): {name}")
-                    return name
-
-        logger.warning("No vehicles found in API response, using fallback")
+        OFFLINE_CATALOG = load_snapshot(path)
+        return True
+    except SnapshotError as e:
+        logger.error(f"Offline mode without catalog, using fallback names: {e}")
+        OFFLINE_CATALOG = {}
+        return False
+    finally:
+        clear_name_pools()
 
-    except Exception as e:
-        logger.error(f"Error getting random vehicle: {e}")
 
-    # Fallback to well-known Star Wars vehicles
-    fallback_vehicles = [
-        "Speeder Bike", "AT-AT", "AT-ST", "Landspeeder", "Snowspeeder",
-        "Pod Racer", "Swoop Bike", "Speeder Truck", "AT-TE", "LAAT",
-        "Sand Crawler", "Sail Barge", "Dewback", "Bantha", "Tauntaun"
-    ]
+def configure_cache(alias=None):
+    """
+    Select where SWAPI data is cached.
 
-    selected = random.choice(fallback_vehicles)
-    logger.debug(f"Using fallback vehicle: {selected}")
-    return selected
+    Args:
+        alias (str): Alias of a django.core.cache backend shared by all
+            worker processes, or None for the per-process in-memory cache
+    """
+    global CACHE, CACHE_ALIAS
+
+    max_stale = MAX_STALENESS if STALE_WHILE_REVALIDATE else 0
+
+    if alias:
+        CACHE = DjangoCacheStore(alias, default_ttl=CACHE_TTL, max_stale=max_stale)
+        logger.info(f"Using Django cache backend '{alias}' for SWAPI data")
+    else:
+        CACHE = TTLCache(
+            max_entries=CACHE_MAX_ENTRIES,
+            max_bytes=CACHE_MAX_BYTES,
+            default_ttl=CACHE_TTL,
+            max_stale=max_stale
+        )
+
+    CACHE_ALIAS = alias
+    clear_name_pools()
+
+
+def configure_from_settings(settings):
+    """
+    Apply SWAPI_* overrides from the Django settings.
+
+    Args:
+        settings: Django settings object
+    """
+    global CACHE_TTL, CACHE_MAX_ENTRIES, CACHE_MAX_BYTES
+    global STALE_WHILE_REVALIDATE, MAX_STALENESS
+    global BREAKER_FAILURE_THRESHOLD, BREAKER_COOLDOWN
+    global CONNECT_TIMEOUT, READ_TIMEOUT, MAX_RETRIES, RETRY_BACKOFF, RETRY_BACKOFF_MAX
+    global RETRY_POLICY, REQUEST_DEADLINE
+    global MAX_PAGE_SIZE, MAX_CRAWL_PAGES, CRAWL_FULL_CATALOG, PARALLEL_CRAWL, CRAWL_WORKERS
+
+    CACHE_TTL = getattr(settings, 'SWAPI_CACHE_TTL', CACHE_TTL)
+    CACHE_MAX_ENTRIES = getattr(settings, 'SWAPI_CACHE_MAX_ENTRIES', CACHE_MAX_ENTRIES)
+    CACHE_MAX_BYTES = getattr(settings, 'SWAPI_CACHE_MAX_BYTES', CACHE_MAX_BYTES)
+    STALE_WHILE_REVALIDATE = getattr(settings, 'SWAPI_STALE_WHILE_REVALIDATE', STALE_WHILE_REVALIDATE)
+    MAX_STALENESS = getattr(settings, 'SWAPI_MAX_STALENESS', MAX_STALENESS)
+    BREAKER_FAILURE_THRESHOLD = getattr(settings, 'SWAPI_BREAKER_FAILURE_THRESHOLD', BREAKER_FAILURE_THRESHOLD)
+    BREAKER_COOLDOWN = getattr(settings, 'SWAPI_BREAKER_COOLDOWN', BREAKER_COOLDOWN)
+    BREAKERS.configure(BREAKER_FAILURE_THRESHOLD, BREAKER_COOLDOWN)
+
+    CONNECT_TIMEOUT = getattr(settings, 'SWAPI_CONNECT_TIMEOUT', CONNECT_TIMEOUT)
+    READ_TIMEOUT = getattr(settings, 'SWAPI_READ_TIMEOUT', READ_TIMEOUT)
+    MAX_RETRIES = getattr(settings, 'SWAPI_MAX_RETRIES', MAX_RETRIES)
+    RETRY_BACKOFF = getattr(settings, 'SWAPI_RETRY_BACKOFF', RETRY_BACKOFF)
+    RETRY_BACKOFF_MAX = getattr(settings, 'SWAPI_RETRY_BACKOFF_MAX', RETRY_BACKOFF_MAX)
+    RETRY_POLICY = RetryPolicy(MAX_RETRIES, RETRY_BACKOFF, RETRY_BACKOFF_MAX)
+    REQUEST_DEADLINE = getattr(settings, 'SWAPI_REQUEST_DEADLINE', REQUEST_DEADLINE)
+
+    MAX_PAGE_SIZE = getattr(settings, 'SWAPI_MAX_PAGE_SIZE', MAX_PAGE_SIZE)
+    MAX_CRAWL_PAGES = getattr(settings, 'SWAPI_MAX_CRAWL_PAGES', MAX_CRAWL_PAGES)
+    CRAWL_FULL_CATALOG = getattr(settings, 'SWAPI_CRAWL_FULL_CATALOG', CRAWL_FULL_CATALOG)
+    PARALLEL_CRAWL = getattr(settings, 'SWAPI_PARALLEL_CRAWL', PARALLEL_CRAWL)
+    CRAWL_WORKERS = getattr(settings, 'SWAPI_CRAWL_WORKERS', CRAWL_WORKERS)
+
+    pool_size = (
+        getattr(settings, 'SWAPI_POOL_CONNECTIONS', http_client.POOL_CONNECTIONS),
+        getattr(settings, 'SWAPI_POOL_MAXSIZE', http_client.POOL_MAXSIZE)
+    )
+    if pool_size != (http_client.POOL_CONNECTIONS, http_client.POOL_MAXSIZE):
+        http_client.configure_pool(*pool_size)
+
+    configure_cache(getattr(settings, 'SWAPI_CACHE_ALIAS', None))
+
+    # Nothing was fetched from the default server yet, and a shared cache
+    # already holds what the other workers fetched from this one
+    base_url = getattr(settings, 'SWAPI_BASE', SWAPI_BASE)
+    if base_url != SWAPI_BASE:
+        set_base_url(base_url, clear=False)
+
+    if getattr(settings, 'SWAPI_OFFLINE', False):
+        load_offline_catalog(settings.SWAPI_SNAPSHOT_PATH)
 
 
 def clear_cache():
-    """Clear the API cache."""
+    """Clear the API cache and name pools, and close the circuit breakers."""
     global CACHE
     CACHE.clear()
+    clear_name_pools()
+    BREAKERS.reset()
     logger.info("API cache cleared")
 
 
@@ -331,5 +1253,25 @@ def get_cache_info():
     return {
         'cache_size': len(CACHE),
         'cached_endpoints': list(CACHE.keys()),
-        'total_cached_items': sum(len(v) if isinstance(v, list) else 1 for v in CACHE.values())
+        'total_cached_items': sum(len(v) if isinstance(v, list) else 1 for v in CACHE.values()),
+        **CACHE.stats(),
+        **REFRESH_STATS,
+        'circuit_breakers': BREAKERS.stats(),
+        'http_pool': http_client.get_pool_stats()
     }
+
+
+@metrics.REGISTRY.register_collector
+def _collect_cache_metrics():
+    """Report the response cache and background refresh counters."""
+    stats = CACHE.stats()
+    yield 'swapi_cache_hits_total', 'counter', "Fresh response cache hits.", stats['hits']
+    yield 'swapi_cache_stale_hits_total', 'counter', "Stale response cache hits served while refreshing.", stats['stale_hits']
+    yield 'swapi_cache_misses_total', 'counter', "Response cache misses.", stats['misses']
+    yield 'swapi_cache_evictions_total', 'counter', "Entries evicted to stay within the cache limits.", stats['evictions']
+    yield 'swapi_cache_expirations_total', 'counter', "Entries dropped after expiring.", stats['expirations']
+    yield 'swapi_cache_entries', 'gauge', "Entries in the response cache.", len(CACHE)
+    yield 'swapi_cache_bytes', 'gauge', "Estimated size of the response cache in bytes.", stats['total_bytes']
+    yield 'swapi_refresh_success_total', 'counter', "Successful background refreshes.", REFRESH_STATS['refresh_success']
+    yield 'swapi_refresh_failure_total', 'counter', "Failed background refreshes.", REFRESH_STATS['refresh_failure']
+    yield 'swapi_requests_coalesced_total', 'counter', "Loads that waited for an identical in-flight load.", FLIGHTS.coalesced
@@ -1,84 +1,100 @@
-from .swapi import (
-    get_random_character, get_random_planet,
-    get_random_starship, get_random_vehicle
-)
-from random import sample, choice
+from .mission_templates import compile_templates, render_batch
+from .async_swapi import load_name_pools_async
+from .themes import REGISTRY as THEMES
+from . import metrics
+import re
+import random
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Mission templates using different SWAPI data types, compiled once at import
+MISSION_TEMPLATES = compile_templates([
+    # Character-based missions
+    "Meet with {character} for strategic planning.",
+    "Deliver urgent message to {character} on {planet}.",
+    "Train with Jedi Master {character} in lightsaber combat.",
+    "Escort {character} safely to the Rebel base.",
+    "Rescue {character} from Imperial custody.",
+
+    # Planet-based missions
+    "Scout {planet} for signs of Imperial activity.",
+    "Establish a new Rebel outpost on {planet}.",
+    "Investigate disturbances in the Force on {planet}.",
+    "Search {planet} for ancient Jedi artifacts.",
+    "Negotiate peace treaty with the leaders of {planet}.",
+
+    # Starship-based missions
+    "Pilot the {starship} on a reconnaissance mission.",
+    "Repair and maintain the {starship} in the hangar bay.",
+    "Defend the {starship} against TIE fighter attacks.",
+
+    # Mixed missions combining different elements
+    "Transport {character} to {planet} using the {starship}.",
+    "Help {character} escape from {planet}.",
+
+    # Force and Jedi training missions
+    "Meditate on the Force while orbiting {planet}.",
+    "Study ancient Jedi texts with {character}.",
+    "Practice Force abilities in the caves of {planet}.",
+
+    # Rebellion missions
+    "Recruit new members for the Rebellion on {planet}.",
+    "Sabotage Imperial operations on {planet}.",
+    "Gather intelligence on Imperial troop movements near {planet}.",
+])
+
+# Missions rendered per batch when generating in bulk
+BULK_CHUNK_SIZE = 1000
+
+
+def get_rng(seed=None):
+    """
+    Create the random generator for one generation call.
+
+    Every call gets its own instance, so seeded calls are reproducible
+    and threads do not share the global random state.
+
+    Args:
+        seed (int): Seed for reproducible output (default: random seed)
+
+    Returns:
+        random.Random: Random generator
+    """
+    return random.Random(seed)
+
 
-def generate_tasks(max_tasks=5):
+def generate_tasks(max_tasks=5, seed=None):
     """
     Generate random Star Wars missions using live SWAPI data.
 
     Args:
         max_tasks (int): Maximum number of tasks to generate (default: 5)
+        seed (int): Seed for reproducible output; the same seed gives the
+            same missions for the same catalog
 
     Returns:
         list: List of generated task strings
     """
-    # Mission templates using different SWAPI data types
-    mission_templates = [
-        # Character-based missions
-        lambda: f"Meet with {get_random_character()} for strategic planning.",
-        lambda: f"Deliver urgent message to {get_random_character()} on {get_random_planet()}.",
-        lambda: f"Train with Jedi Master {get_random_character()} in lightsaber combat.",
-        lambda: f"Escort {get_random_character()} safely to the Rebel base.",
-        lambda: f"Rescue {get_random_character()} from Imperial custody.",
-
-        # Planet-based missions
-        lambda: f"Scout {get_random_planet()} for signs of Imperial activity.",
-        lambda: f"Establish a new Rebel outpost on {get_random_planet()}.",
-        lambda: f"Investigate disturbances in the Force on {get_random_planet()}.",
-        lambda: f"Search {get_random_planet()} for ancient Jedi artifacts.",
-        lambda: f"Negotiate peace treaty with the leaders of {get_random_planet()}.",
-
-        # Starship-based missions
-        lambda: f"Pilot the {get_random_starship()} on a reconnaissance mission.",
-        lambda: f"Repair and maintain the {get_random_starship()} in the hangar bay.",
-        lambda: f"Defend the {get_random_starship()} against TIE fighter attacks.",
-
-        # Mixed missions combining different elements
-        lambda: f"Transport {get_random_character()} to {get_random_planet()} using the {get_random_starship()}.",
-        lambda: f"Help {get_random_character()} escape from {get_random_planet()}.",
-
-        # Force and Jedi training missions
-        lambda: f"Meditate on the Force while orbiting {get_random_planet()}.",
-        lambda: f"Study ancient Jedi texts with {get_random_character()}.",
-        lambda: f"Practice Force abilities in the caves of {get_random_planet()}.",
-
-        # Rebellion missions
-        lambda: f"Recruit new members for the Rebellion on {get_random_planet()}.",
-        lambda: f"Sabotage Imperial operations on {get_random_planet()}.",
-        lambda: f"Gather intelligence on Imperial troop movements near {get_random_planet()}.",
-    ]
+    rng = get_rng(seed)
 
     try:
         # Select exactly max_tasks random templates
-        num_tasks = min(max_tasks, len(mission_templates))
-        selected_templates = sample(mission_templates, num_tasks)
-
-        # Generate tasks by calling the lambda functions
-        tasks = []
-        for template in selected_templates:
-            try:
-                task = template()
-                if task and isinstance(task, str) and task.strip():
-                    tasks.append(task)
-                    logger.debug(f"Generated task: {task}")
-            except Exception as e:
-                logger.error(f"Error generating task from template: {e}")
-                continue
+        num_tasks = min(max_tasks, len(MISSION_TEMPLATES))
+        selected_templates = rng.sample(MISSION_TEMPLATES, num_tasks)
+
+        # Draw all names per entity type at once, then fill the slots
+        tasks = [task for task in render_batch(selected_templates, rng) if task.strip()]
 
         if not tasks:
             logger.warning("No tasks generated, using fallback")
-            return generate_fallback_tasks(max_tasks)
+            return generate_fallback_tasks(max_tasks, rng)
 
         # Ensure we return exactly max_tasks items
         if len(tasks) < max_tasks:
             # If we have fewer tasks than requested, add fallback tasks
-            fallback_tasks = generate_fallback_tasks(max_tasks - len(tasks))
+            fallback_tasks = generate_fallback_tasks(max_tasks - len(tasks), rng)
             tasks.extend(fallback_tasks)
 
         # Return exactly max_tasks items
@@ -88,96 +104,191 @@ def generate_tasks(max_tasks=5):
 
     except Exception as e:
         logger.error(f"Error in task generation: {e}")
-        return generate_fallback_tasks(max_tasks)
+        return generate_fallback_tasks(max_tasks, rng)
+
+
+def iter_task_chunks(count, chunk_size=BULK_CHUNK_SIZE, seed=None, theme=None):
+    """
+    Generate missions in bulk, drawing templates with replacement.
+
+    Missions are produced chunk by chunk, so memory use depends on
+    chunk_size only, not on count.
+
+    Args:
+        count (int): Total number of missions to generate
+        chunk_size (int): Missions rendered per chunk
+        seed (int): Seed for reproducible output
+        theme (str): Registered theme whose templates are drawn by weight
+            (default: all MISSION_TEMPLATES, uniformly)
+
+    Yields:
+        list: Up to chunk_size mission strings
+
+    Raises:
+        UnknownThemeError: If theme is not registered
+    """
+    rng = get_rng(seed)
+    remaining = count
+    themed = THEMES.get(theme) if theme is not None else None
+
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        templates = themed.choose(size, rng) if themed else rng.choices(MISSION_TEMPLATES, k=size)
+        yield render_batch(templates, rng)
+        remaining -= size
+
+
+async def generate_tasks_async(max_tasks=5, seed=None):
+    """
+    Generate random Star Wars missions without blocking the event loop.
+
+    The name pools are loaded concurrently first; rendering the missions
+    afterwards needs no network access.
+
+    Args:
+        max_tasks (int): Maximum number of tasks to generate (default: 5)
+        seed (int): Seed for reproducible output
+
+    Returns:
+        list: List of generated task strings
+    """
+    try:
+        await load_name_pools_async()
+    except Exception as e:
+        logger.error(f"Error loading name pools: {e}")
+
+    return generate_tasks(max_tasks, seed)
+
+
+FALLBACK_TASKS = (
+    "Train with your lightsaber in the training room.",
+    "Study the ancient Jedi texts in the library.",
+    "Meditate on the Force for inner peace.",
+    "Repair your damaged equipment in the workshop.",
+    "Practice piloting skills in the flight simulator.",
+    "Attend strategy meeting with the Rebel leadership.",
+    "Patrol the base perimeter for security threats.",
+    "Assist in the medical bay with wounded allies.",
+    "Decrypt captured Imperial communications.",
+    "Maintain your starfighter in the hangar bay."
+)
 
 
-def generate_fallback_tasks(max_tasks=5):
+def generate_fallback_tasks(max_tasks=5, rng=None):
     """
     Generate fallback tasks when API fails.
 
     Args:
         max_tasks (int): Maximum number of tasks to generate
+        rng (random.Random): Random generator (default: a new unseeded one)
 
     Returns:
         list: List of fallback task strings
     """
-    fallback_tasks = [
-        "Train with your lightsaber in the training room.",
-        "Study the ancient Jedi texts in the library.",
-        "Meditate on the Force for inner peace.",
-        "Repair your damaged equipment in the workshop.",
-        "Practice piloting skills in the flight simulator.",
-        "Attend strategy meeting with the Rebel leadership.",
-        "Patrol the base perimeter for security threats.",
-        "Assist in the medical bay with wounded allies.",
-        "Decrypt captured Imperial communications.",
-        "Maintain your starfighter in the hangar bay."
-    ]
+    rng = rng or get_rng()
 
     logger.info(f"Using {max_tasks} fallback tasks")
-    return sample(fallback_tasks, min(max_tasks, len(fallback_tasks)))
-
-
-def generate_themed_tasks(theme='general', max_tasks=10):
+    tasks = rng.sample(FALLBACK_TASKS, min(max_tasks, len(FALLBACK_TASKS)))
+    metrics.FALLBACK_TASKS_USED.inc(len(tasks))
+    return tasks
+
+
+# Built-in themed mission templates, compiled once at import
+THEME_TEMPLATES = {
+    'combat': compile_templates([
+        "Engage Imperial forces on {planet}.",
+        "Defend {planet} from enemy invasion.",
+        "Lead assault on Imperial base using {starship}.",
+        "Duel with {character} in lightsaber combat.",
+    ]),
+    'diplomatic': compile_templates([
+        "Negotiate peace treaty with {character}.",
+        "Attend diplomatic summit on {planet}.",
+        "Mediate conflict between factions on {planet}.",
+        "Establish trade agreement with {character}.",
+    ]),
+    'exploration': compile_templates([
+        "Explore uncharted regions of {planet}.",
+        "Map star system near {planet}.",
+        "Investigate ancient ruins on {planet}.",
+        "Search for new hyperspace routes to {planet}.",
+    ]),
+    'training': compile_templates([
+        "Train with {character} in Force techniques.",
+        "Practice meditation on {planet}.",
+        "Learn new lightsaber forms from {character}.",
+        "Study Jedi philosophy on {planet}.",
+    ])
+}
+
+# 'general' draws from every mission template; settings may add more themes
+THEMES.register('general', MISSION_TEMPLATES)
+for _theme, _templates in THEME_TEMPLATES.items():
+    THEMES.register(_theme, _templates)
+
+
+def generate_themed_tasks(theme='general', max_tasks=10, seed=None):
     """
     Generate tasks based on a specific theme.
 
+    Templates are drawn by their theme weights, with replacement, and the
+    names of the whole batch are drawn at once as in iter_task_chunks.
+
     Args:
-        theme (str): Theme for tasks ('combat', 'diplomatic', 'exploration', 'training')
-        max_tasks (int): Maximum number of tasks to generate
+        theme (str): Registered theme ('general', 'combat', 'diplomatic',
+            'exploration', 'training' or one added in settings)
+        max_tasks (int): Number of tasks to generate
+        seed (int): Seed for reproducible output
 
     Returns:
         list: List of themed task strings
+
+    Raises:
+        UnknownThemeError: If theme is not registered
     """
-    theme_templates = {
-        'combat': [
-            lambda: f"Engage Imperial forces on {get_random_planet()}.",
-            lambda: f"Defend {get_random_planet()} from enemy invasion.",
-            lambda: f"Lead assault on Imperial base using {get_random_starship()}.",
-            lambda: f"Duel with {get_random_character()} in lightsaber combat.",
-        ],
-        'diplomatic': [
-            lambda: f"Negotiate peace treaty with {get_random_character()}.",
-            lambda: f"Attend diplomatic summit on {get_random_planet()}.",
-            lambda: f"Mediate conflict between factions on {get_random_planet()}.",
-            lambda: f"Establish trade agreement with {get_random_character()}.",
-        ],
-        'exploration': [
-            lambda: f"Explore uncharted regions of {get_random_planet()}.",
-            lambda: f"Map star system near {get_random_planet()}.",
-            lambda: f"Investigate ancient ruins on {get_random_planet()}.",
-            lambda: f"Search for new hyperspace routes to {get_random_planet()}.",
-        ],
-        'training': [
-            lambda: f"Train with {get_random_character()} in Force techniques.",
-            lambda: f"Practice meditation on {get_random_planet()}.",
-            lambda: f"Learn new lightsaber forms from {get_random_character()}.",
-            lambda: f"Study Jedi philosophy on {get_random_planet()}.",
-        ]
-    }
-
-    templates = theme_templates.get(theme, theme_templates['training'])
+    rng = get_rng(seed)
+    templates = THEMES.get(theme).choose(max_tasks, rng)
 
     try:
-        selected_templates = sample(templates, min(max_tasks, len(templates)))
-        tasks = []
+        tasks = [task for task in render_batch(templates, rng) if task]
 
-        for template in selected_templates:
-            try:
-                task = template()
-                if task:
-                    tasks.append(task)
-            except Exception as e:
-                logger.error(f"Error generating themed task: {e}")
-                continue
-
-        return tasks if tasks else generate_fallback_tasks()
+        return tasks if tasks else generate_fallback_tasks(max_tasks, rng)
 
     except Exception as e:
         logger.error(f"Error generating themed tasks: {e}")
-        return generate_fallback_tasks()
+        return generate_fallback_tasks(max_tasks, rng)
+
+
+# Difficulty keywords, from the highest severity down
+DIFFICULTY_KEYWORDS = (
+    ('Extreme', ('duel', 'assault', 'infiltrate', 'sabotage', 'steal')),
+    ('Hard', ('rescue', 'defend', 'combat', 'escape', 'negotiate')),
+    ('Medium', ('escort', 'deliver', 'investigate', 'patrol', 'repair')),
+)
+
+# Estimated time per difficulty level
+TIME_ESTIMATES = {
+    'Easy': '30 minutes',
+    'Medium': '1-2 hours',
+    'Hard': '2-4 hours',
+    'Extreme': '4+ hours'
+}
+
+# One alternation with a named group per level, matched in a single scan.
+# It sits in a zero-width lookahead so the scan tries every position and
+# keywords overlapping an earlier match ("deliverescue") are still found.
+_DIFFICULTY_PATTERN = re.compile(
+    '(?=' + '|'.join(
+        f"(?P<{level}>{'|'.join(re.escape(keyword) for keyword in keywords)})"
+        for level, keywords in DIFFICULTY_KEYWORDS
+    ) + ')',
+    re.IGNORECASE
+)
+_SEVERITY = {level: rank for rank, (level, _) in enumerate(reversed(DIFFICULTY_KEYWORDS), start=1)}
+_HIGHEST_LEVEL = DIFFICULTY_KEYWORDS[0][0]
 
 
+@lru_cache(maxsize=4096)
 def get_task_difficulty(task_text):
     """
     Determine the difficulty level of a task based on keywords.
@@ -188,20 +299,30 @@ def get_task_difficulty(task_text):
     Returns:
         str: Difficulty level ('Easy', 'Medium', 'Hard', 'Extreme')
     """
-    task_lower = task_text.lower()
+    difficulty = 'Easy'
+    severity = 0
 
-    extreme_keywords = ['duel', 'assault', 'infiltrate', 'sabotage', 'steal']
-    hard_keywords = ['rescue', 'defend', 'combat', 'escape', 'negotiate']
-    medium_keywords = ['escort', 'deliver', 'investigate', 'patrol', 'repair']
+    for match in _DIFFICULTY_PATTERN.finditer(task_text):
+        level = match.lastgroup
+        if _SEVERITY[level] > severity:
+            difficulty, severity = level, _SEVERITY[level]
+            if level == _HIGHEST_LEVEL:
+                break
 
-    if any(keyword in task_lower for keyword in extreme_keywords):
-        return 'Extreme'
-    elif any(keyword in task_lower for keyword in hard_keywords):
-        return 'Hard'
-    elif any(keyword in task_lower for keyword in medium_keywords):
-        return 'Medium'
-    else:
-        return 'Easy'
+    return difficulty
+
+
+def classify_many(texts):
+    """
+    Determine the difficulty level of many tasks.
+
+    Args:
+        texts (list): Task descriptions
+
+    Returns:
+        list: Difficulty level per task, in order
+    """
+    return [get_task_difficulty(text) for text in texts]
 
 
 def add_task_metadata(tasks):
@@ -214,27 +335,13 @@ def add_task_metadata(tasks):
     Returns:
         list: List of task dictionaries with metadata
     """
-    enhanced_tasks = []
-
-    for task in tasks:
-        difficulty = get_task_difficulty(task)
-
-        # Estimate time based on difficulty
-        time_estimates = {
-            'Easy': '30 minutes',
-            'Medium': '1-2 hours',
-            'Hard': '2-4 hours',
-            'Extreme': '4+ hours'
-        }
-
-        enhanced_task = {
+    return [
+        {
             'description': task,
             'difficulty': difficulty,
-            'estimated_time': time_estimates[difficulty],
+            'estimated_time': TIME_ESTIMATES[difficulty],
             'category': 'Mission',
             'completed': False
         }
-
-        enhanced_tasks.append(enhanced_task)
-
-    return enhanced_tasks
\ No newline at end of file
+        for task, difficulty in zip(tasks, classify_many(tasks))
+    ]
@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import patch, Mock
+import requests
+
+from missions import swapi, async_swapi
+from missions.resilience import RetryPolicy
+from missions.task_generator import generate_tasks_async
+
+
+def fake_page(endpoint, page, limit=None):
+    """Return a 3-page listing with one named item per page."""
+    return {
+        'results': [{'uid': str(page), 'name': f"{endpoint} {page}"}],
+        'next': 'more' if page < 3 else None,
+        'previous': None,
+        'count': 30
+    }
+
+
+class TestAsyncSwapi(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the async SWAPI client."""
+
+    def setUp(self):
+        """Clear cache before each test."""
+        swapi.clear_cache()
+
+    def tearDown(self):
+        """Clear cache after each test."""
+        swapi.clear_cache()
+
+    @patch('missions.swapi.http_client.get')
+    async def test_fetch_uses_shared_session_and_retries(self, mock_get):
+        """Test that async fetches go through the pooled session with the sync retry policy."""
+        page = {'results': [{'name': 'Luke'}], 'next': None, 'count': 1}
+        mock_get.side_effect = [
+            requests.exceptions.ConnectionError("reset"),
+            Mock(content=b'', raise_for_status=lambda: None, json=lambda: page)
+        ]
+
+        with patch('missions.swapi.RETRY_POLICY', RetryPolicy(backoff_base=0)):
+            result = await async_swapi.fetch_from_swapi_async('people')
+
+        self.assertEqual(result['results'], [{'name': 'Luke'}])
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertIn('people_page_1', swapi.CACHE)
+
+    @patch('missions.swapi.fetch_from_swapi', side_effect=fake_page)
+    async def test_get_all_items_async_keeps_page_order(self, mock_fetch):
+        """Test that pages fetched concurrently are joined in page order."""
+        result = await async_swapi.get_all_items_async('people')
+
+        self.assertEqual([item['name'] for item in result], ['people 1', 'people 2', 'people 3'])
+        self.assertEqual(mock_fetch.call_count, 3)
+
+    @patch('missions.swapi.fetch_from_swapi', side_effect=fake_page)
+    async def test_load_name_pools_async(self, mock_fetch):
+        """Test that all four pools are loaded and later draws stay offline."""
+        pools = await async_swapi.load_name_pools_async()
+
+        self.assertEqual(set(pools), set(swapi.ENTITY_ENDPOINTS))
+        self.assertEqual(pools['planet'], ('planets 1', 'planets 2', 'planets 3'))
+
+        calls = mock_fetch.call_count
+        await async_swapi.load_name_pools_async()
+        self.assertEqual(mock_fetch.call_count, calls)
+
+    @patch('missions.swapi.fetch_from_swapi', return_value=None)
+    async def test_generate_tasks_async_with_api_down(self, mock_fetch):
+        """Test that async generation still returns missions when the API fails."""
+        tasks = await generate_tasks_async(5)
+
+        self.assertEqual(len(tasks), 5)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, buffer=True)
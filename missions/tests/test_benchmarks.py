@@ -0,0 +1,44 @@
+import io
+import os
+import json
+import tempfile
+import unittest
+
+from django.core.management import call_command
+
+from missions import swapi
+from missions.benchmarks import run_benchmarks
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Test the offline benchmark suite with tiny sizes."""
+
+    def tearDown(self):
+        swapi.clear_cache()
+
+    def test_run_benchmarks(self):
+        """Test that every benchmark reports and the base URL is restored."""
+        original_base = swapi.SWAPI_BASE
+        results = run_benchmarks(latency=0, pages=2, iterations=5, bulk_sizes=(50,),
+                                 classify_count=50, api_requests=3)
+
+        self.assertEqual(swapi.SWAPI_BASE, original_base)
+        self.assertEqual([crawl['parallel'] for crawl in results['cold_crawl']], [False, True])
+        self.assertGreater(results['upstream_requests'], 0)
+        self.assertEqual(results['generate_tasks']['iterations'], 5)
+        self.assertEqual(results['bulk_generation'][0]['count'], 50)
+        self.assertEqual(results['classification']['count'], 50)
+        self.assertEqual(results['api_latency']['samples'], 3)
+
+    def test_command_writes_json(self):
+        """Test that the command writes comparable JSON results."""
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, 'results.json')
+            call_command('run_benchmarks', output=output, latency=0, pages=1, iterations=2,
+                         bulk_sizes=[20], classify_count=20, api_requests=2, stdout=io.StringIO())
+
+            with open(output, encoding='utf-8') as f:
+                results = json.load(f)
+
+        self.assertIn('meta', results)
+        self.assertEqual(results['config']['bulk_sizes'], [20])
@@ -0,0 +1,166 @@
+import time
+import unittest
+from unittest.mock import patch
+
+from missions.cache import TTLCache, DjangoCacheStore, estimate_size, FRESH, STALE, MISS
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test cases for the TTLCache engine."""
+
+    def test_get_and_set(self):
+        """Test storing and reading a value."""
+        cache = TTLCache()
+        cache.set('people_page_1', {'results': [1, 2]})
+
+        self.assertEqual(cache.get('people_page_1'), {'results': [1, 2]})
+        self.assertIsNone(cache.get('missing'))
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+    @patch('missions.cache.time.monotonic')
+    def test_entry_expires_after_ttl(self, mock_monotonic):
+        """Test that entries are dropped once their TTL has passed."""
+        mock_monotonic.return_value = 100.0
+        cache = TTLCache(default_ttl=10)
+        cache.set('key', 'value')
+
+        mock_monotonic.return_value = 109.0
+        self.assertEqual(cache.get('key'), 'value')
+
+        mock_monotonic.return_value = 110.0
+        self.assertIsNone(cache.get('key'))
+        self.assertEqual(cache.expirations, 1)
+        self.assertEqual(len(cache), 0)
+
+    @patch('missions.cache.time.monotonic')
+    def test_lookup_serves_stale_within_max_stale(self, mock_monotonic):
+        """Test that expired entries are served stale until max_stale passes."""
+        mock_monotonic.return_value = 100.0
+        cache = TTLCache(default_ttl=10, max_stale=20)
+        cache.set('key', 'value')
+
+        self.assertEqual(cache.lookup('key'), ('value', FRESH))
+
+        mock_monotonic.return_value = 115.0
+        self.assertEqual(cache.lookup('key'), ('value', STALE))
+        self.assertIsNone(cache.get('key'))
+
+        mock_monotonic.return_value = 130.0
+        self.assertEqual(cache.lookup('key'), (None, MISS))
+        self.assertEqual(cache.stale_hits, 1)
+
+    def test_lru_eviction_by_entry_count(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = TTLCache(max_entries=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')  # 'b' is now least recently used
+        cache.set('c', 3)
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_eviction_by_byte_size(self):
+        """Test that the byte budget evicts old entries."""
+        value = 'x' * 1000
+        cache = TTLCache(max_bytes=estimate_size(value) * 2)
+        cache.set('a', value)
+        cache.set('b', value)
+        cache.set('c', value)
+
+        self.assertEqual(cache.keys(), ['b', 'c'])
+        self.assertLessEqual(cache.stats()['total_bytes'], cache.max_bytes)
+
+    def test_clear_resets_counters(self):
+        """Test that clear empties the cache and its counters."""
+        cache = TTLCache()
+        cache['a'] = 1
+        cache.get('a')
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()['hits'], 0)
+        self.assertEqual(cache.stats()['total_bytes'], 0)
+
+
+class TestDjangoCacheStore(unittest.TestCase):
+    """Test cases for the Django cache backend store."""
+
+    def setUp(self):
+        """Use the local-memory default backend."""
+        self.cache = DjangoCacheStore('default', default_ttl=60)
+        self.cache.clear()
+
+    def tearDown(self):
+        """Clear the backend after each test."""
+        self.cache.clear()
+
+    def test_get_and_set(self):
+        """Test storing and reading a value through the backend."""
+        self.cache.set('people_page_1', {'results': [1, 2]})
+
+        self.assertEqual(self.cache.get('people_page_1'), {'results': [1, 2]})
+        self.assertIn('people_page_1', self.cache)
+        self.assertEqual(self.cache.keys(), ['people_page_1'])
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    def test_values_are_shared_between_stores(self):
+        """Test that two stores on the same alias see the same data."""
+        other = DjangoCacheStore('default')
+        self.cache.set('planets_all_items_50', ['Tatooine'])
+
+        self.assertEqual(other.get('planets_all_items_50'), ['Tatooine'])
+
+    def test_miss(self):
+        """Test that a missing key returns the default and counts a miss."""
+        self.assertIsNone(self.cache.get('missing'))
+        self.assertEqual(self.cache.stats()['misses'], 1)
+
+    @patch.object(DjangoCacheStore, 'GENERATION_REFRESH', 0)
+    def test_clear_only_drops_swapi_entries(self):
+        """Test that clearing drops the entries of every store but leaves other data alone."""
+        other = DjangoCacheStore('default')
+        other.set('planets_all_items_50', ['Tatooine'])
+        self.cache.backend.set('session:abc', 'unrelated')
+        self.addCleanup(self.cache.backend.delete, 'session:abc')
+
+        self.cache.clear()
+
+        self.assertIsNone(other.get('planets_all_items_50'))
+        self.assertEqual(self.cache.backend.get('session:abc'), 'unrelated')
+
+    def test_generation_read_once_per_refresh(self):
+        """Test that the generation is not reread from the backend on every operation."""
+        with patch.object(self.cache.backend, 'get', wraps=self.cache.backend.get) as mock_get:
+            self.cache.set('people_page_1', {'results': []})
+            self.cache.get('people_page_1')
+            self.cache.delete('people_page_1')
+
+        generation_reads = [c for c in mock_get.call_args_list if c.args[0] == DjangoCacheStore.GENERATION_KEY]
+        self.assertEqual(generation_reads, [])
+
+    def test_other_stores_see_clear_after_refresh(self):
+        """Test that a clear() elsewhere is picked up once the cached generation is old."""
+        other = DjangoCacheStore('default')
+        other.set('planets_all_items_50', ['Tatooine'])
+        self.cache.clear()
+
+        with patch('missions.cache.time.monotonic', return_value=time.monotonic() + 2):
+            self.assertIsNone(other.get('planets_all_items_50'))
+
+    def test_entries_without_ttl_get_backend_timeout(self):
+        """Test that entries without a TTL still expire in the backend eventually."""
+        cache = DjangoCacheStore('default', default_ttl=None)
+
+        with patch.object(cache.backend, 'set', wraps=cache.backend.set) as mock_set:
+            cache.set('people_page_1', {'results': []})
+
+        self.assertEqual(mock_set.call_args.kwargs['timeout'], DjangoCacheStore.UNBOUNDED_TIMEOUT)
+        self.assertEqual(cache.get('people_page_1'), {'results': []})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, buffer=True)
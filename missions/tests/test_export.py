@@ -0,0 +1,69 @@
+import io
+import os
+import csv
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from django.core.management import call_command
+
+from missions import swapi
+from missions.export import export_missions
+
+
+@patch('missions.swapi.fetch_from_swapi', return_value=None)
+class TestExportMissions(unittest.TestCase):
+    """Test cases for bulk mission export."""
+
+    def setUp(self):
+        swapi.clear_cache()
+
+    def tearDown(self):
+        swapi.clear_cache()
+
+    def export(self, **kwargs):
+        out = io.StringIO()
+        written = export_missions(out, **kwargs)
+        return written, out.getvalue()
+
+    def test_jsonl(self, mock_fetch):
+        """Test that every mission is written as one JSON line."""
+        written, text = self.export(count=2500, chunk_size=1000)
+
+        lines = text.splitlines()
+        self.assertEqual(written, 2500)
+        self.assertEqual(len(lines), 2500)
+        self.assertIn('task', json.loads(lines[0]))
+
+    def test_seeded_output_independent_of_workers(self, mock_fetch):
+        """Test that a seed gives the same file for any number of workers."""
+        _, inline = self.export(count=2500, chunk_size=1000, seed=7)
+        _, pooled = self.export(count=2500, chunk_size=1000, seed=7, workers=2)
+
+        self.assertEqual(inline, pooled)
+
+    def test_csv_with_metadata(self, mock_fetch):
+        """Test that CSV rows carry the add_task_metadata columns."""
+        _, text = self.export(count=30, fmt='csv', metadata=True, seed=1)
+
+        rows = list(csv.DictReader(io.StringIO(text)))
+        self.assertEqual(len(rows), 30)
+        self.assertIn(rows[0]['difficulty'], ('Easy', 'Medium', 'Hard', 'Extreme'))
+
+    def test_unknown_format(self, mock_fetch):
+        """Test that unknown formats are rejected."""
+        with self.assertRaises(ValueError):
+            self.export(count=1, fmt='xml')
+
+    def test_command(self, mock_fetch):
+        """Test that generate_missions writes the file and reports throughput."""
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, 'missions.jsonl')
+            stdout = io.StringIO()
+            call_command('generate_missions', count=1200, workers=2, chunk_size=500, seed=3,
+                         output=output, stdout=stdout)
+
+            with open(output, encoding='utf-8') as f:
+                self.assertEqual(sum(1 for _ in f), 1200)
+        self.assertIn('missions/s', stdout.getvalue())
@@ -0,0 +1,158 @@
+import unittest
+from unittest.mock import patch
+
+from missions import http_client, metrics, swapi
+from missions.fake_swapi import FakeSwapiServer, build_catalog
+from missions.resilience import RetryPolicy
+
+
+class FakeSwapiTestCase(unittest.TestCase):
+    """Run the real HTTP path against a local stand-in server."""
+
+    server_options = {}
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the stand-in server and point the client at it."""
+        cls.original_base = swapi.SWAPI_BASE
+        cls.server = FakeSwapiServer(**cls.server_options).start()
+        swapi.set_base_url(cls.server.base_url)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the server and restore the real base URL."""
+        cls.server.stop()
+        swapi.set_base_url(cls.original_base)
+
+    def setUp(self):
+        """Clear cache before each test and retry without waiting."""
+        swapi.clear_cache()
+        patcher = patch('missions.swapi.RETRY_POLICY', RetryPolicy(backoff_base=0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestFakeSwapiPagination(FakeSwapiTestCase):
+    """Test pagination against the stand-in server."""
+
+    server_options = {'pages': 9}
+
+    def test_fetch_page(self):
+        """Test that a list page is fetched and parsed over HTTP."""
+        result = swapi.fetch_from_swapi('people', page=2)
+
+        self.assertEqual(len(result['results']), 10)
+        self.assertEqual(result['count'], 90)
+        self.assertIsNotNone(result['next'])
+
+    def test_crawl_follows_pages(self):
+        """Test that both crawl modes collect the same items in order."""
+        sequential = swapi.get_all_items_from_endpoint('planets', max_items=30, parallel=False)
+        swapi.clear_cache()
+        parallel = swapi.get_all_items_from_endpoint('planets', max_items=30, parallel=True)
+
+        self.assertEqual(len(sequential), 30)
+        self.assertEqual(sequential, parallel)
+
+    def test_keep_alive_connections_reused(self):
+        """Test that sequential requests reuse one pooled connection and are reported as metrics."""
+        http_client.close_session()
+        for page in range(1, 4):
+            swapi.fetch_from_swapi('people', page=page)
+
+        stats = http_client.get_pool_stats()
+        self.assertEqual(stats['requests'], 3)
+        self.assertEqual(stats['connections_opened'], 1)
+        self.assertEqual(stats['connections_reused'], 2)
+        self.assertIn('swapi_http_connections_reused_total 2', metrics.REGISTRY.render())
+
+    def test_films_list(self):
+        """Test that the films list, returned under 'result', is parsed."""
+        result = swapi.fetch_from_swapi('films')
+
+        self.assertEqual(len(result['results']), 90)
+        self.assertEqual(result['results'][0]['properties']['title'], "A New Hope")
+
+
+class TestFakeSwapiFullCatalog(FakeSwapiTestCase):
+    """Test full-catalog crawls against the stand-in server."""
+
+    server_options = {'pages': 9}
+
+    def test_entire_catalog_in_one_request(self):
+        """Test that the entire catalog is fetched with the largest page size."""
+        items = swapi.get_all_items_from_endpoint('people', max_items=None)
+
+        self.assertEqual(len(items), 90)
+        stats = swapi.get_crawl_stats()['people']
+        self.assertEqual(stats['requests'], 1)
+        self.assertEqual(stats['items'], 90)
+        self.assertGreater(stats['bytes'], 0)
+
+    @patch('missions.swapi.MAX_PAGE_SIZE', 25)
+    def test_entire_catalog_in_parallel(self):
+        """Test that both crawl modes page through the entire catalog."""
+        sequential = swapi.get_all_items_from_endpoint('planets', max_items=None, parallel=False)
+        swapi.clear_cache()
+        parallel = swapi.get_all_items_from_endpoint('planets', max_items=None, parallel=True)
+
+        self.assertEqual(len(sequential), 90)
+        self.assertEqual(sequential, parallel)
+        self.assertEqual(swapi.get_crawl_stats()['planets']['pages'], 4)
+
+    @patch('missions.swapi.MAX_PAGE_SIZE', 25)
+    def test_max_pages_is_honoured(self):
+        """Test that max_pages bounds an entire-catalog crawl."""
+        items = swapi.get_all_items_from_endpoint('people', max_items=None, max_pages=2)
+
+        self.assertEqual(len(items), 50)
+        self.assertIn('people_all_items_all_pages_2', swapi.CACHE)
+
+
+class TestFakeSwapiEmptyEndpoint(FakeSwapiTestCase):
+    """Test a snapshot with an empty endpoint resized to several pages."""
+
+    server_options = {'pages': 2, 'snapshot': {'people': [{'name': 'Luke'}], 'planets': []}}
+
+    def test_build_catalog_keeps_empty_endpoint(self):
+        """Test that an empty endpoint stays empty instead of failing the resize."""
+        catalog = build_catalog(self.server_options['snapshot'], pages=2)
+
+        self.assertEqual(catalog['planets'], [])
+        self.assertEqual(len(catalog['people']), 20)
+
+    def test_empty_endpoint_is_one_empty_page(self):
+        """Test that the empty endpoint is served as a single empty page."""
+        result = swapi.fetch_from_swapi('planets')
+
+        self.assertEqual(result['results'], [])
+        self.assertIsNone(result['next'])
+
+
+class TestFakeSwapiErrors(FakeSwapiTestCase):
+    """Test retries against a failing stand-in server."""
+
+    server_options = {'error_rate': 1.0}
+
+    def test_retries_then_gives_up(self):
+        """Test that every attempt is made before falling back."""
+        before = self.server.requests_served
+
+        self.assertIsNone(swapi.fetch_from_swapi('people'))
+        self.assertEqual(self.server.requests_served - before, swapi.MAX_RETRIES)
+        self.assertIn(swapi.get_random_character(), swapi.FALLBACK_NAMES['character'])
+
+
+class TestFakeSwapiLatency(FakeSwapiTestCase):
+    """Test timeouts against a slow stand-in server."""
+
+    server_options = {'latency': 0.3}
+
+    @patch('missions.swapi.READ_TIMEOUT', 0.05)
+    def test_timeout(self):
+        """Test that slow responses time out."""
+        self.assertIsNone(swapi.fetch_from_swapi('people'))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, buffer=True)
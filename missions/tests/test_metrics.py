@@ -0,0 +1,114 @@
+import unittest
+from unittest.mock import patch
+import requests
+
+from django.test import SimpleTestCase
+
+from missions import metrics, swapi
+from missions.metrics import Registry
+from missions.resilience import RetryPolicy
+
+
+class TestRegistry(unittest.TestCase):
+    """Test cases for counters, histograms and the text format."""
+
+    def setUp(self):
+        self.registry = Registry()
+
+    def test_counter_with_labels(self):
+        """Test that counters are kept per label value and rendered."""
+        counter = self.registry.counter('things_total', "Things.", ('kind',))
+        counter.inc(kind='a')
+        counter.inc(3, kind='b')
+
+        self.assertEqual(counter.value(kind='b'), 3)
+        text = self.registry.render()
+        self.assertIn('# TYPE things_total counter', text)
+        self.assertIn('things_total{kind="a"} 1', text)
+        self.assertIn('things_total{kind="b"} 3', text)
+
+    def test_counter_rejects_wrong_labels(self):
+        """Test that label names must match the declaration."""
+        counter = self.registry.counter('things_total', "Things.", ('kind',))
+
+        with self.assertRaises(ValueError):
+            counter.inc(other='a')
+        with self.assertRaises(ValueError):
+            counter.inc(-1, kind='a')
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test that histogram buckets, sum and count are rendered."""
+        histogram = self.registry.histogram('latency_seconds', "Latency.", buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5)
+
+        text = self.registry.render()
+        self.assertIn('latency_seconds_bucket{le="0.1"} 1', text)
+        self.assertIn('latency_seconds_bucket{le="1"} 2', text)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 3', text)
+        self.assertIn('latency_seconds_sum 5.55', text)
+        self.assertIn('latency_seconds_count 3', text)
+
+    def test_collector(self):
+        """Test that collectors are rendered and failing ones skipped."""
+        self.registry.register_collector(lambda: [('size', 'gauge', "Size.", 7), ('unset', 'gauge', "Unset.", None)])
+        self.registry.register_collector(lambda: 1 / 0)
+
+        text = self.registry.render()
+        self.assertIn('size 7', text)
+        self.assertNotIn('unset', text)
+
+
+class TestSwapiMetrics(unittest.TestCase):
+    """Test that the SWAPI client records its metrics."""
+
+    def setUp(self):
+        swapi.clear_cache()
+        metrics.REGISTRY.reset()
+        patcher = patch('missions.swapi.RETRY_POLICY', RetryPolicy(backoff_base=0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        swapi.clear_cache()
+
+    @patch('missions.swapi.http_client.get')
+    def test_retries_and_failures(self, mock_get):
+        """Test that failed attempts count as retries, then as one failure."""
+        mock_get.side_effect = requests.exceptions.ConnectionError("down")
+
+        swapi.fetch_from_swapi('people')
+
+        self.assertEqual(metrics.UPSTREAM_LATENCY.count(endpoint='people'), swapi.MAX_RETRIES)
+        self.assertEqual(metrics.UPSTREAM_RETRIES.value(endpoint='people'), swapi.MAX_RETRIES - 1)
+        self.assertEqual(metrics.UPSTREAM_FAILURES.value(endpoint='people'), 1)
+
+    @patch('missions.swapi.get_all_items_from_endpoint', return_value=[])
+    def test_fallback_usage(self, mock_items):
+        """Test that names drawn from the fallback list are counted per entity type."""
+        swapi.sample('planet', k=4)
+
+        self.assertEqual(metrics.FALLBACK_NAMES_USED.value(entity_type='planet'), 4)
+        self.assertEqual(metrics.FALLBACK_NAMES_USED.value(entity_type='character'), 0)
+
+
+@patch('missions.swapi.fetch_from_swapi', return_value=None)
+class TestMetricsView(SimpleTestCase):
+    """Test cases for the /api/metrics endpoint."""
+
+    def setUp(self):
+        swapi.clear_cache()
+        metrics.REGISTRY.reset()
+
+    def test_metrics_endpoint(self, mock_fetch):
+        """Test that request durations, fallbacks and cache counters are exposed."""
+        self.client.get('/api/tasks/')
+        response = self.client.get('/api/metrics')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        text = response.content.decode()
+        self.assertIn('missions_task_request_seconds_count 1', text)
+        self.assertIn('missions_fallback_names_total{entity_type=', text)
+        self.assertIn('swapi_cache_misses_total', text)
@@ -0,0 +1,160 @@
+import time
+import threading
+import unittest
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from missions import metrics, mission_buffer, swapi
+from missions.mission_buffer import MissionBuffer
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out waiting for the mission buffer")
+        time.sleep(0.005)
+
+
+class TestMissionBuffer(unittest.TestCase):
+    """Test cases for the pre-generated mission buffer."""
+
+    def setUp(self):
+        metrics.REGISTRY.reset()
+        self.produced = 0
+        self.buffer = MissionBuffer(self.produce, capacity=8, low_water=3, set_size=2)
+        self.addCleanup(self.buffer.stop, 5)
+
+    def produce(self):
+        self.produced += 1
+        return [f"mission {self.produced}a", f"mission {self.produced}b"]
+
+    def test_fills_to_capacity(self):
+        """Test that the producer fills the buffer and then waits."""
+        self.buffer.start()
+        wait_for(lambda: len(self.buffer) == 8)
+        time.sleep(0.05)
+
+        self.assertEqual(self.produced, 8)
+
+    def test_pop_in_order_and_refill_below_low_water(self):
+        """Test that sets are served oldest first and refilled at the low-water mark."""
+        self.buffer.start()
+        wait_for(lambda: len(self.buffer) == 8)
+
+        self.assertEqual(self.buffer.pop(), ["mission 1a", "mission 1b"])
+        for _ in range(4):
+            self.buffer.pop()
+        time.sleep(0.05)
+        self.assertEqual(self.produced, 8)  # 3 left, still at the low-water mark
+
+        self.buffer.pop()
+        wait_for(lambda: len(self.buffer) == 8)
+        self.assertEqual(self.produced, 14)
+        self.assertEqual(mission_buffer.BUFFER_POPS.value(), 6)
+
+    def test_underrun_is_counted(self):
+        """Test that an empty buffer returns None and counts an underrun."""
+        release = threading.Event()
+        slow = MissionBuffer(lambda: release.wait(5) and ["late"], capacity=2, set_size=1)
+        self.addCleanup(slow.stop, 5)
+        self.addCleanup(release.set)
+
+        self.assertIsNone(slow.pop())
+        self.assertEqual(mission_buffer.BUFFER_UNDERRUNS.value(), 1)
+
+        release.set()
+        wait_for(lambda: len(slow) == 2)
+        self.assertEqual(slow.pop(), ["late"])
+
+    def test_outdated_sets_are_dropped(self):
+        """Test that sets built before the data generation changed are not served."""
+        generation = [1]
+        buffer = MissionBuffer(self.produce, capacity=4, low_water=1, set_size=2,
+                               generation=lambda: generation[0])
+        self.addCleanup(buffer.stop, 5)
+        buffer.start()
+        wait_for(lambda: len(buffer) == 4)
+
+        generation[0] = 2
+        self.assertIsNone(buffer.pop())  # All four sets are outdated
+
+        wait_for(lambda: len(buffer) == 4)
+        self.assertEqual(buffer.pop(), ["mission 5a", "mission 5b"])
+
+    def test_zero_low_water_refills_when_empty(self):
+        """Test that a low-water mark of 0 still fills an empty buffer."""
+        buffer = MissionBuffer(self.produce, capacity=3, low_water=0, set_size=2)
+        self.addCleanup(buffer.stop, 5)
+        buffer.start()
+
+        wait_for(lambda: len(buffer) == 3)
+
+    @patch('missions.mission_buffer.PRODUCER_BACKOFF', 0.05)
+    def test_failing_producer_backs_off(self):
+        """Test that a producer that keeps failing waits longer between attempts."""
+        calls = []
+
+        def failing():
+            calls.append(time.monotonic())
+            raise RuntimeError("down")
+
+        buffer = MissionBuffer(failing, capacity=2, set_size=1)
+        self.addCleanup(buffer.stop, 5)
+        buffer.start()
+        time.sleep(0.5)
+
+        # Waits of 0.05, 0.1 and 0.2 seconds fit in half a second, not a busy loop
+        self.assertLessEqual(len(calls), 5)
+        self.assertGreaterEqual(calls[-1] - calls[-2], 0.05)
+
+    @patch('missions.mission_buffer.PRODUCER_BACKOFF', 0.01)
+    def test_producer_errors_do_not_stop_buffer(self):
+        """Test that a failing producer is logged and the buffer keeps serving."""
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("down")
+            return ["ok"]
+
+        buffer = MissionBuffer(flaky, capacity=2, low_water=2, set_size=1)
+        self.addCleanup(buffer.stop, 5)
+        buffer.start()
+        buffer.pop()  # Wakes the producer after its failed round
+
+        wait_for(lambda: len(buffer) >= 1)
+        self.assertEqual(buffer.pop(), ["ok"])
+
+
+@patch('missions.swapi.fetch_from_swapi', return_value=None)
+class TestTaskListAPIBuffer(SimpleTestCase):
+    """Test that the missions API serves default responses from the buffer."""
+
+    def setUp(self):
+        swapi.clear_cache()
+        metrics.REGISTRY.reset()
+        mission_buffer.configure(4)
+        self.addCleanup(mission_buffer.configure, 0)
+
+    def test_default_response_from_buffer(self, mock_fetch):
+        """Test that unseeded 5-mission responses are popped from the buffer."""
+        buffer = mission_buffer.get_buffer().start()
+        wait_for(lambda: len(buffer) == 4)
+
+        response = self.client.get('/api/tasks/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['tasks']), 5)
+        self.assertEqual(mission_buffer.BUFFER_POPS.value(), 1)
+
+    def test_seeded_response_bypasses_buffer(self, mock_fetch):
+        """Test that seeded responses stay reproducible and skip the buffer."""
+        first = self.client.get('/api/tasks/', {'seed': 7}).json()
+        second = self.client.get('/api/tasks/', {'seed': 7}).json()
+
+        self.assertEqual(first, second)
+        self.assertEqual(mission_buffer.BUFFER_POPS.value(), 0)
+        self.assertEqual(mission_buffer.BUFFER_UNDERRUNS.value(), 0)
@@ -0,0 +1,292 @@
+import time
+import threading
+import unittest
+from unittest.mock import patch, Mock
+import requests
+
+from missions import metrics, swapi
+from missions.cache import FRESH
+from missions.resilience import (
+    CircuitBreaker, CircuitBreakers, RetryPolicy, deadline, remaining_time, parse_retry_after,
+    CLOSED, OPEN, HALF_OPEN
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test cases for the circuit breaker state machine."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker('people', failure_threshold=3, cooldown=10, clock=self.clock)
+
+    def trip(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+
+    def test_opens_after_threshold(self):
+        """Test that consecutive failures open the circuit."""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CLOSED)
+
+        self.assertTrue(self.breaker.record_failure())
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertFalse(self.breaker.allow_request())
+        self.assertEqual(self.breaker.stats()['rejected'], 1)
+
+    def test_success_resets_failures(self):
+        """Test that only consecutive failures count."""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, CLOSED)
+
+    def test_half_open_probe_closes(self):
+        """Test that one probe is allowed after the cool-down and closes on success."""
+        self.trip()
+        self.clock.now = 10
+
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertTrue(self.breaker.allow_request())
+        self.assertFalse(self.breaker.allow_request())  # Only one probe at a time
+
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertTrue(self.breaker.allow_request())
+
+    def test_half_open_probe_failure_reopens(self):
+        """Test that a failed probe opens the circuit for another cool-down."""
+        self.trip()
+        self.clock.now = 10
+        self.assertTrue(self.breaker.allow_request())
+
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, OPEN)
+
+        self.clock.now = 19
+        self.assertFalse(self.breaker.allow_request())
+        self.clock.now = 20
+        self.assertTrue(self.breaker.allow_request())
+
+
+def http_error(status, headers=None):
+    response = Mock(status_code=status, headers=headers or {})
+    return requests.exceptions.HTTPError(f"{status} error", response=response)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Test cases for retry decisions and backoff."""
+
+    def test_retryable_errors(self):
+        """Test that timeouts, 429 and 5xx are retried but other 4xx are not."""
+        policy = RetryPolicy()
+
+        self.assertTrue(policy.is_retryable(requests.exceptions.ConnectTimeout()))
+        self.assertTrue(policy.is_retryable(requests.exceptions.ConnectionError()))
+        self.assertTrue(policy.is_retryable(http_error(429)))
+        self.assertTrue(policy.is_retryable(http_error(503)))
+        self.assertFalse(policy.is_retryable(http_error(404)))
+        self.assertFalse(policy.is_retryable(http_error(400)))
+
+    def test_exponential_backoff(self):
+        """Test that delays double up to the maximum and jitter stays below them."""
+        policy = RetryPolicy(backoff_base=0.5, backoff_max=3, jitter=False)
+        self.assertEqual([policy.delay(attempt) for attempt in range(1, 6)], [0.5, 1, 2, 3, 3])
+
+        jittered = RetryPolicy(backoff_base=0.5, backoff_max=3)
+        for attempt in range(1, 6):
+            self.assertLessEqual(jittered.delay(attempt), policy.delay(attempt))
+
+    def test_retry_after(self):
+        """Test that Retry-After overrides the backoff, within its bound."""
+        policy = RetryPolicy(max_retry_after=10)
+
+        self.assertEqual(policy.delay(1, http_error(429, {'Retry-After': '2'})), 2)
+        self.assertEqual(policy.delay(1, http_error(503, {'Retry-After': '120'})), 10)
+        self.assertEqual(parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'), 0)
+        self.assertIsNone(parse_retry_after('soon'))
+
+
+class TestDeadline(unittest.TestCase):
+    """Test cases for the request deadline."""
+
+    def test_nested_deadline_only_shortens(self):
+        """Test that an inner deadline cannot extend the outer one."""
+        self.assertIsNone(remaining_time())
+
+        with deadline(1):
+            with deadline(60):
+                self.assertLessEqual(remaining_time(), 1)
+            with deadline(None):
+                self.assertIsNone(remaining_time())
+
+        self.assertIsNone(remaining_time())
+
+
+class TestSwapiRetries(unittest.TestCase):
+    """Test the retry policy and deadline in the SWAPI client."""
+
+    def setUp(self):
+        swapi.clear_cache()
+
+    def tearDown(self):
+        swapi.clear_cache()
+
+    @patch('missions.swapi.http_client.get')
+    def test_client_error_not_retried(self, mock_get):
+        """Test that a 404 fails at once without touching the circuit breaker."""
+        mock_get.return_value = Mock(raise_for_status=Mock(side_effect=http_error(404)))
+
+        self.assertIsNone(swapi.fetch_from_swapi('people'))
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(swapi.BREAKERS.get('people').stats()['consecutive_failures'], 0)
+
+    @patch('missions.swapi.http_client.get')
+    def test_client_error_ends_half_open_probe(self, mock_get):
+        """Test that a 404 answering a half-open probe closes the circuit."""
+        mock_get.return_value = Mock(raise_for_status=Mock(side_effect=http_error(404)))
+
+        with patch('missions.swapi.BREAKERS', CircuitBreakers(failure_threshold=1, cooldown=0)):
+            breaker = swapi.BREAKERS.get('people')
+            breaker.record_failure()
+            self.assertEqual(breaker.state, HALF_OPEN)
+
+            self.assertIsNone(swapi.fetch_from_swapi('people', page=99))
+
+        self.assertEqual(breaker.state, CLOSED)
+        self.assertTrue(breaker.allow_request())
+
+    @patch('missions.swapi.http_client.get')
+    def test_backoff_between_attempts(self, mock_get):
+        """Test that retries wait for the policy's delay."""
+        mock_get.side_effect = requests.exceptions.ReadTimeout("slow")
+
+        with patch('missions.swapi.RETRY_POLICY', RetryPolicy(backoff_base=0.01, jitter=False)), \
+                patch('missions.swapi.time.sleep') as mock_sleep:
+            swapi.fetch_from_swapi('people')
+
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [0.01, 0.02])
+
+    @patch('missions.swapi.http_client.get')
+    def test_deadline_bounds_timeouts_and_retries(self, mock_get):
+        """Test that timeouts are clipped to the deadline and no retry outlives it."""
+        mock_get.side_effect = requests.exceptions.ConnectionError("down")
+
+        with patch('missions.swapi.RETRY_POLICY', RetryPolicy(backoff_base=5, jitter=False)), deadline(1):
+            start = time.monotonic()
+            self.assertIsNone(swapi.fetch_from_swapi('people'))
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(mock_get.call_count, 1)
+        connect, read = mock_get.call_args.kwargs['timeout']
+        self.assertLessEqual(connect, 1)
+        self.assertLessEqual(read, 1)
+
+    @patch('missions.swapi.http_client.get')
+    def test_expired_deadline_skips_request(self, mock_get):
+        """Test that no request is made once the deadline has passed."""
+        with deadline(0):
+            self.assertIsNone(swapi.fetch_from_swapi('people'))
+
+        mock_get.assert_not_called()
+
+    @patch('missions.swapi.http_client.get')
+    def test_deadline_bounds_wait_for_in_flight_request(self, mock_get):
+        """Test that a request sharing a slow in-flight fetch gives up at its deadline."""
+        release = threading.Event()
+
+        def slow_get(url, timeout):
+            release.wait(5)
+            raise http_error(404)
+
+        mock_get.side_effect = slow_get
+
+        fetching = threading.Thread(target=swapi.fetch_from_swapi, args=('people',))
+        fetching.start()
+        self.addCleanup(fetching.join)
+        self.addCleanup(release.set)
+        while not swapi.FLIGHTS.in_flight():
+            time.sleep(0.01)
+
+        with deadline(0.1):
+            start = time.monotonic()
+            self.assertIsNone(swapi.fetch_from_swapi('people'))
+
+        self.assertLess(time.monotonic() - start, 1)
+
+
+class TestSwapiCircuitBreaker(unittest.TestCase):
+    """Test that SWAPI requests fail fast while an endpoint's circuit is open."""
+
+    def setUp(self):
+        swapi.clear_cache()
+        metrics.REGISTRY.reset()
+        patcher = patch('missions.swapi.RETRY_POLICY', RetryPolicy(backoff_base=0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        swapi.clear_cache()
+
+    @patch('missions.swapi.http_client.get')
+    def test_open_circuit_skips_requests(self, mock_get):
+        """Test that an outage stops hitting upstream once the circuit opens."""
+        mock_get.side_effect = requests.exceptions.ConnectionError("down")
+
+        for page in range(1, 5):
+            self.assertIsNone(swapi.fetch_from_swapi('people', page=page))
+
+        self.assertEqual(mock_get.call_count, swapi.BREAKER_FAILURE_THRESHOLD)
+        self.assertEqual(swapi.BREAKERS.get('people').state, OPEN)
+        self.assertEqual(metrics.CIRCUIT_OPENED.value(endpoint='people'), 1)
+        self.assertGreater(metrics.CIRCUIT_REJECTIONS.value(endpoint='people'), 0)
+
+        # Other endpoints are unaffected
+        self.assertTrue(swapi.BREAKERS.get('planets').allow_request())
+
+    @patch('missions.swapi.http_client.get')
+    def test_open_circuit_uses_fallback_names(self, mock_get):
+        """Test that random names come from the fallback list while the circuit is open."""
+        mock_get.side_effect = requests.exceptions.ConnectionError("down")
+        for _ in range(swapi.BREAKER_FAILURE_THRESHOLD):
+            swapi.record_upstream_failure('people')
+
+        name = swapi.get_random_character()
+
+        self.assertIn(name, swapi.FALLBACK_NAMES['character'])
+        mock_get.assert_not_called()
+
+    @patch('missions.swapi.http_client.get')
+    def test_failed_crawl_cached_for_cooldown(self, mock_get):
+        """Test that names come from upstream again once the cool-down after an outage passed."""
+        mock_get.side_effect = requests.exceptions.ConnectionError("down")
+
+        with patch('missions.swapi.BREAKER_COOLDOWN', 0.05):
+            self.assertIn(swapi.get_random_character(), swapi.FALLBACK_NAMES['character'])
+            self.assertEqual(swapi.CACHE.lookup('people_all_items_50'), ([], FRESH))
+            time.sleep(0.06)
+
+            mock_get.side_effect = None
+            mock_get.return_value = Mock(
+                content=b'',
+                raise_for_status=lambda: None,
+                json=lambda: {'results': [{'name': 'Wedge Antilles'}], 'next': None, 'count': 1}
+            )
+            # The expired empty crawl is served while it is refreshed
+            swapi.get_random_character()
+
+            deadline_at = time.monotonic() + 5
+            while swapi.get_fresh_name_pool('character') is None and time.monotonic() < deadline_at:
+                time.sleep(0.01)
+
+        self.assertEqual(swapi.get_random_character(), 'Wedge Antilles')
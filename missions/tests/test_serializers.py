@@ -0,0 +1,124 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from missions import swapi, serializers
+
+
+TASKS = ["Escort Luke Skywalker to Tatooine.", 'Decode the "Death Star" plans', "Fly the Millennium Falcon—fast"]
+
+
+class TestEncoders(unittest.TestCase):
+    """Test cases for the JSON and NDJSON encoders."""
+
+    def check_encoders(self):
+        self.assertEqual(json.loads(serializers.encode_tasks(TASKS)), {'tasks': TASKS})
+
+        lines = serializers.encode_ndjson(TASKS).decode().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], [{'task': task} for task in TASKS])
+
+        self.assertEqual(json.loads(serializers.dumps({'tasks': [{'task': 'x'}]})), {'tasks': [{'task': 'x'}]})
+
+    def test_encoders_round_trip(self):
+        """Test that encoded bodies decode back to the missions."""
+        self.check_encoders()
+
+    def test_stdlib_fallback(self):
+        """Test that the stdlib encoder gives the same bytes when orjson is missing."""
+        fast = (serializers.encode_tasks(TASKS), serializers.encode_ndjson(TASKS))
+
+        with patch('missions.serializers.orjson', None):
+            self.check_encoders()
+            slow = (serializers.encode_tasks(TASKS), serializers.encode_ndjson(TASKS))
+
+        if serializers.orjson is not None:
+            self.assertEqual(fast, slow)
+
+    def test_ndjson_text_matches_bytes(self):
+        """Test that the text variant used by the exporter matches the bytes."""
+        self.assertEqual(serializers.ndjson_text(TASKS).encode(), serializers.encode_ndjson(TASKS))
+
+    def test_encode_time_is_recorded(self):
+        """Test that encoding is timed per format."""
+        before = serializers.ENCODE_DURATION.count(format='ndjson')
+        serializers.encode_ndjson(TASKS)
+        self.assertEqual(serializers.ENCODE_DURATION.count(format='ndjson'), before + 1)
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for the encoded response cache."""
+
+    def setUp(self):
+        serializers.configure(max_entries=4)
+
+    def tearDown(self):
+        serializers.configure(max_entries=256)
+        swapi.clear_name_pools()
+
+    def test_get_or_encode_caches_bytes(self):
+        """Test that a cached body is not encoded again."""
+        calls = []
+
+        def build():
+            calls.append(1)
+            return b'{"tasks":[]}'
+
+        key = serializers.seeded_cache_key(5, 42)
+        self.assertEqual(serializers.get_or_encode(key, build), b'{"tasks":[]}')
+        self.assertEqual(serializers.get_or_encode(key, build), b'{"tasks":[]}')
+        self.assertEqual(len(calls), 1)
+
+    def test_key_changes_with_name_pools(self):
+        """Test that installing new name pools invalidates seeded responses."""
+        key = serializers.seeded_cache_key(5, 42)
+        swapi.install_name_pools({'character': ["Yoda"]})
+
+        self.assertNotEqual(serializers.seeded_cache_key(5, 42), key)
+
+    def test_disabled_cache(self):
+        """Test that a zero-sized cache always encodes."""
+        serializers.configure(max_entries=0)
+        calls = []
+
+        serializers.get_or_encode('key', lambda: calls.append(1) or b'1')
+        serializers.get_or_encode('key', lambda: calls.append(1) or b'1')
+
+        self.assertEqual(len(calls), 2)
+
+
+@patch('missions.swapi.fetch_from_swapi', return_value=None)
+class TestSeededResponses(SimpleTestCase):
+    """Test cases for pre-encoded seeded API responses."""
+
+    def setUp(self):
+        swapi.clear_cache()
+        serializers.configure(max_entries=256)
+
+    def tearDown(self):
+        swapi.clear_cache()
+
+    def test_seeded_response_served_from_cache(self, mock_fetch):
+        """Test that a repeated seeded request reuses the encoded bytes."""
+        first = self.client.get('/api/tasks/', {'seed': 3, 'count': 50})
+        hits = serializers.RESPONSE_CACHE.stats()['hits']
+        second = self.client.get('/api/tasks/', {'seed': 3, 'count': 50})
+
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(serializers.RESPONSE_CACHE.stats()['hits'], hits + 1)
+        self.assertEqual(first['Content-Type'], 'application/json')
+        self.assertEqual(len(first.json()['tasks']), 50)
+
+    def test_seeded_response_follows_catalog(self, mock_fetch):
+        """Test that new name pools give a freshly encoded response."""
+        self.client.get('/api/tasks/', {'seed': 3})
+        swapi.install_name_pools({entity_type: ["Grogu"] for entity_type in swapi.ENTITY_ENDPOINTS})
+
+        tasks = self.client.get('/api/tasks/', {'seed': 3}).json()['tasks']
+
+        self.assertTrue(any("Grogu" in task for task in tasks))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from missions.singleflight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test cases for threaded request coalescing."""
+
+    def test_concurrent_callers_share_one_call(self):
+        """Test that concurrent callers for one key run the loader once."""
+        flights = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            release.wait(5)
+            return {'results': ['Luke']}
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(flights.do, 'people_page_1', loader) for _ in range(5)]
+            while flights.coalesced < 4:
+                threading.Event().wait(0.01)
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result == {'results': ['Luke']} for result in results))
+        self.assertEqual(flights.in_flight(), 0)
+
+    def test_error_is_shared(self):
+        """Test that waiters receive the loader's exception."""
+        flights = SingleFlight()
+
+        with self.assertRaises(RuntimeError):
+            flights.do('people_page_1', lambda: (_ for _ in ()).throw(RuntimeError("down")))
+
+        # A later call runs the loader again
+        self.assertEqual(flights.do('people_page_1', lambda: 'ok'), 'ok')
+
+    def test_waiter_timeout_returns_default(self):
+        """Test that a waiter stops waiting after its timeout and gets the default."""
+        flights = SingleFlight()
+        release = threading.Event()
+
+        leader = threading.Thread(target=flights.do, args=('people_page_1', lambda: release.wait(5)))
+        leader.start()
+        self.addCleanup(leader.join)
+        self.addCleanup(release.set)
+        while not flights.in_flight():
+            threading.Event().wait(0.01)
+
+        self.assertEqual(flights.do('people_page_1', lambda: 'unused', timeout=0.05, default=[]), [])
+
+
+class TestSingleFlightAsync(unittest.IsolatedAsyncioTestCase):
+    """Test cases for async request coalescing."""
+
+    async def test_concurrent_coroutines_share_one_call(self):
+        """Test that concurrent coroutines for one key await one loader."""
+        flights = SingleFlight()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 'Tatooine'
+
+        results = await asyncio.gather(*(flights.do_async('planets', loader) for _ in range(5)))
+
+        self.assertEqual(results, ['Tatooine'] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flights.coalesced, 4)
+
+    async def test_error_is_shared(self):
+        """Test that waiting coroutines receive the loader's exception."""
+        flights = SingleFlight()
+
+        async def loader():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("down")
+
+        results = await asyncio.gather(
+            *(flights.do_async('planets', loader) for _ in range(3)),
+            return_exceptions=True
+        )
+
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+
+    def test_coalesces_across_event_loops(self):
+        """Test that coroutines on event loops in different threads share one call."""
+        flights = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            started.set()
+            await asyncio.to_thread(release.wait, 5)
+            return 'Tatooine'
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(asyncio.run, flights.do_async('planets', loader))
+            started.wait(5)
+            waiter = executor.submit(asyncio.run, flights.do_async('planets', loader))
+            for _ in range(500):
+                if flights.coalesced:
+                    break
+                threading.Event().wait(0.01)
+            release.set()
+            results = [leader.result(), waiter.result()]
+
+        self.assertEqual(results, ['Tatooine'] * 2)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flights.in_flight(), 0)
+
+    async def test_waiter_timeout_returns_default(self):
+        """Test that a waiting coroutine stops after its timeout and gets the default."""
+        flights = SingleFlight()
+
+        async def loader():
+            await asyncio.sleep(0.2)
+            return 'Tatooine'
+
+        results = await asyncio.gather(
+            flights.do_async('planets', loader),
+            flights.do_async('planets', loader, timeout=0.01, default=None)
+        )
+
+        self.assertEqual(results, ['Tatooine', None])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, buffer=True)
@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+
+from missions import swapi
+from missions.snapshot import write_snapshot, load_snapshot, SnapshotError, SNAPSHOT_VERSION
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test cases for writing and loading catalog snapshots."""
+
+    def setUp(self):
+        """Create a temporary snapshot path."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'snapshot.jsonl')
+
+    def tearDown(self):
+        """Remove the temporary directory and leave offline mode."""
+        self.tmpdir.cleanup()
+        swapi.OFFLINE_MODE = False
+        swapi.OFFLINE_CATALOG = {}
+        swapi.clear_cache()
+
+    def test_round_trip(self):
+        """Test that a written snapshot loads back with the same names."""
+        catalog = {
+            'people': [{'uid': '1', 'name': 'Luke Skywalker'}, {'uid': '2', 'name': ''}],
+            'films': [{'uid': '1', 'properties': {'title': 'A New Hope'}}],
+        }
+
+        counts = write_snapshot(self.path, catalog)
+        result = load_snapshot(self.path)
+
+        self.assertEqual(counts, {'people': 1, 'films': 1})
+        self.assertEqual(result['people'], [{'uid': '1', 'name': 'Luke Skywalker'}])
+        self.assertEqual(result['films'], [{'uid': '1', 'name': 'A New Hope'}])
+
+    def test_load_rejects_other_version(self):
+        """Test that snapshots of another format version are rejected."""
+        with open(self.path, 'w') as f:
+            f.write('{"version": %d}\n' % (SNAPSHOT_VERSION + 1))
+
+        with self.assertRaises(SnapshotError):
+            load_snapshot(self.path)
+
+    def test_load_missing_file(self):
+        """Test that a missing snapshot raises SnapshotError."""
+        with self.assertRaises(SnapshotError):
+            load_snapshot(self.path)
+
+    @patch('missions.swapi.http_client.get')
+    def test_offline_mode_never_touches_network(self, mock_get):
+        """Test that offline mode serves names from the snapshot only."""
+        write_snapshot(self.path, {'people': [{'uid': '1', 'name': 'Ahsoka Tano'}]})
+
+        self.assertTrue(swapi.load_offline_catalog(self.path))
+
+        self.assertEqual(swapi.get_random_character(), 'Ahsoka Tano')
+        self.assertIsInstance(swapi.get_random_planet(), str)
+        mock_get.assert_not_called()
+
+    @patch('missions.management.commands.swapi_sync.swapi.fetch_from_swapi')
+    def test_swapi_sync_command(self, mock_fetch):
+        """Test that swapi_sync crawls every page and writes the snapshot."""
+        mock_fetch.side_effect = lambda endpoint, page, limit=None: {
+            'results': [{'uid': str(page), 'name': f"{endpoint} {page}"}],
+            'next': 'more' if page < 2 else None,
+            'count': 2
+        }
+
+        call_command('swapi_sync', output=self.path, endpoint=['people', 'planets'], stdout=StringIO())
+
+        result = load_snapshot(self.path)
+        self.assertEqual([item['name'] for item in result['people']], ['people 1', 'people 2'])
+        self.assertEqual(len(result['planets']), 2)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, buffer=True)
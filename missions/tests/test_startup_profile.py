@@ -0,0 +1,81 @@
+import os
+import sys
+import importlib
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+
+from missions.startup_profile import parse_importtime, summarize, profile_startup
+
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _io
+import time:       300 |        420 |   io
+import time:      1000 |       1000 |     urllib3.util
+import time:      2000 |       3000 |   urllib3
+import time:       843 |       4263 | requests
+some other stderr output
+"""
+
+
+class TestImportTimeParsing(unittest.TestCase):
+    """Test cases for parsing -X importtime output."""
+
+    def test_parse_importtime(self):
+        """Test that every import line is parsed with its nesting depth."""
+        records = parse_importtime(IMPORTTIME)
+
+        self.assertEqual([record['module'] for record in records], ['_io', 'io', 'urllib3.util', 'urllib3', 'requests'])
+        self.assertEqual(records[-1], {'module': 'requests', 'self_us': 843, 'cumulative_us': 4263, 'depth': 0})
+        self.assertEqual([record['depth'] for record in records], [2, 1, 2, 1, 0])
+
+    def test_summarize(self):
+        """Test that modules are ranked by cumulative and packages by own time."""
+        summary = summarize(parse_importtime(IMPORTTIME), top=2)
+
+        self.assertEqual(summary['modules'], 5)
+        self.assertAlmostEqual(summary['import_seconds'], 0.004263)
+        self.assertEqual([record['module'] for record in summary['slowest_modules']], ['requests', 'urllib3'])
+        self.assertEqual(summary['packages'][0], {'package': 'urllib3', 'self_us': 3000})
+
+
+class TestProfileStartup(unittest.TestCase):
+    """Test cases for profiling a real worker boot."""
+
+    def test_production_settings_boot_lean(self):
+        """Test that production workers boot without requests, the admin or django_extensions."""
+        with patch.dict(os.environ, DJANGO_SECRET_KEY='test-secret-key'):
+            result = profile_startup('StarWars_ToDo.settings_production', top=5, cwd=settings.BASE_DIR)
+
+        self.assertFalse(result['requests_imported'])
+        modules = {record['module'] for record in result['slowest_modules']}
+        self.assertNotIn('django_extensions', modules)
+        self.assertGreater(result['ready_seconds'], 0)
+        self.assertGreaterEqual(result['process_seconds'], result['ready_seconds'])
+        self.assertLessEqual(len(result['packages']), 5)
+
+    def test_production_settings_require_secret_key(self):
+        """Test that production settings refuse to start without DJANGO_SECRET_KEY."""
+        env = {name: value for name, value in os.environ.items() if name != 'DJANGO_SECRET_KEY'}
+
+        with patch.dict(os.environ, env, clear=True), self.assertRaises(ImproperlyConfigured):
+            sys.modules.pop('StarWars_ToDo.settings_production', None)
+            importlib.import_module('StarWars_ToDo.settings_production')
+
+    def test_command_output(self):
+        """Test that the command reports the ready time and slowest modules."""
+        out = StringIO()
+        call_command('profile_startup', '--top', '3', stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("Ready in", output)
+        self.assertIn("Slowest modules", output)
+
+
+if __name__ == '__main__':
+    unittest.main()
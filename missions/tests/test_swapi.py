@@ -1,50 +1,52 @@
+import time
+import threading
 import unittest
+from types import SimpleNamespace
 from unittest.mock import patch, Mock
 import requests
-import sys
-import os
-
-# Add the parent directory (StarWars_ToDo root) to the Python path to import swapi module
-# Current file is in StarWars_ToDo/tests/, we need to go up one level to StarWars_ToDo/
-current_dir = os.path.dirname(os.path.abspath(__file__))  # /path/to/StarWars_ToDo/tests
-project_root = os.path.dirname(current_dir)  # /path/to/StarWars_ToDo
-sys.path.insert(0, project_root)
-
-try:
-    from swapi import (
-        fetch_from_swapi,
-        get_all_items_from_endpoint,
-        get_random_character,
-        get_random_planet,
-        get_random_starship,
-        get_random_vehicle,
-        clear_cache,
-        get_cache_info,
-        CACHE,
-        SWAPI_ENDPOINTS
+
+from missions import http_client, swapi
+from missions.resilience import RetryPolicy
+from missions.swapi import (
+    fetch_from_swapi,
+    get_all_items_from_endpoint,
+    get_random_character,
+    get_random_planet,
+    get_random_starship,
+    get_random_vehicle,
+    clear_cache,
+    get_cache_info,
+    sample,
+    CACHE,
+    FALLBACK_NAMES,
+    SWAPI_ENDPOINTS
+)
+
+
+def preserve_settings():
+    """Restore every module setting configure_from_settings assigns."""
+    return patch.multiple(
+        swapi,
+        CACHE_TTL=swapi.CACHE_TTL,
+        CACHE_MAX_ENTRIES=swapi.CACHE_MAX_ENTRIES,
+        CACHE_MAX_BYTES=swapi.CACHE_MAX_BYTES,
+        STALE_WHILE_REVALIDATE=swapi.STALE_WHILE_REVALIDATE,
+        MAX_STALENESS=swapi.MAX_STALENESS,
+        BREAKER_FAILURE_THRESHOLD=swapi.BREAKER_FAILURE_THRESHOLD,
+        BREAKER_COOLDOWN=swapi.BREAKER_COOLDOWN,
+        CONNECT_TIMEOUT=swapi.CONNECT_TIMEOUT,
+        READ_TIMEOUT=swapi.READ_TIMEOUT,
+        MAX_RETRIES=swapi.MAX_RETRIES,
+        RETRY_BACKOFF=swapi.RETRY_BACKOFF,
+        RETRY_BACKOFF_MAX=swapi.RETRY_BACKOFF_MAX,
+        RETRY_POLICY=swapi.RETRY_POLICY,
+        REQUEST_DEADLINE=swapi.REQUEST_DEADLINE,
+        MAX_PAGE_SIZE=swapi.MAX_PAGE_SIZE,
+        MAX_CRAWL_PAGES=swapi.MAX_CRAWL_PAGES,
+        CRAWL_FULL_CATALOG=swapi.CRAWL_FULL_CATALOG,
+        PARALLEL_CRAWL=swapi.PARALLEL_CRAWL,
+        CRAWL_WORKERS=swapi.CRAWL_WORKERS
     )
-except ImportError as e:
-    print(f"Error importing swapi module: {e}")
-    print("Current directory:", os.getcwd())
-    print("Test file location:", current_dir)
-    print("Looking for swapi.py in project root:", project_root)
-
-    # Check if swapi.py exists in project root
-    swapi_path = os.path.join(project_root, 'swapi.py')
-    if os.path.exists(swapi_path):
-        print(f"✓ Found swapi.py at: {swapi_path}")
-    else:
-        print(f"✗ swapi.py not found at: {swapi_path}")
-        print("Files in project root:", [f for f in os.listdir(project_root) if f.endswith('.py')])
-
-    print("\nPlease ensure:")
-    print("1. swapi.py is in the StarWars_ToDo/ root directory")
-    print("2. test_swapi.py is in the StarWars_ToDo/tests/ subdirectory")
-    print("3. Use one of these commands:")
-    print("   From StarWars_ToDo/: python -m tests.test_swapi")
-    print("   From StarWars_ToDo/: python tests/test_swapi.py")
-    print("   From tests/: python test_swapi.py")
-    sys.exit(1)
 
 
 class TestSwapiModule(unittest.TestCase):
@@ -55,6 +57,11 @@ class TestSwapiModule(unittest.TestCase):
         # Clear cache before each test
         clear_cache()
 
+        # Retry without waiting
+        patcher = patch('missions.swapi.RETRY_POLICY', RetryPolicy(backoff_base=0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def tearDown(self):
         """Clean up after each test method."""
         # Clear cache after each test
@@ -64,7 +71,7 @@ class TestSwapiModule(unittest.TestCase):
 class TestFetchFromSwapi(TestSwapiModule):
     """Test cases for fetch_from_swapi function."""
 
-    @patch('swapi.requests.get')
+    @patch('missions.swapi.http_client.get')
     def test_fetch_from_swapi_success_list_endpoint(self, mock_get):
         """Test successful fetch from list endpoint."""
         # Mock response data
@@ -96,10 +103,10 @@ class TestFetchFromSwapi(TestSwapiModule):
         # Verify the request was made correctly
         mock_get.assert_called_once_with(
             f"{SWAPI_ENDPOINTS['people']}?page=1&limit=10",
-            timeout=10
+            timeout=(swapi.CONNECT_TIMEOUT, swapi.READ_TIMEOUT)
         )
 
-    @patch('swapi.requests.get')
+    @patch('missions.swapi.http_client.get')
     def test_fetch_from_swapi_success_single_endpoint(self, mock_get):
         """Test successful fetch from single item endpoint."""
         # Mock response data for single item
@@ -122,7 +129,7 @@ class TestFetchFromSwapi(TestSwapiModule):
         self.assertIsNone(result['next'])
         self.assertIsNone(result['previous'])
 
-    @patch('swapi.requests.get')
+    @patch('missions.swapi.http_client.get')
     def test_fetch_from_swapi_caching(self, mock_get):
         """Test that caching works correctly."""
         # Mock response data
@@ -149,12 +156,17 @@ class TestFetchFromSwapi(TestSwapiModule):
         # Should only make one HTTP request due to caching
         mock_get.assert_called_once()
 
+    def test_fetch_from_swapi_limit_is_keyword_only(self):
+        """Test that a third positional argument (formerly max_pages) is rejected."""
+        with self.assertRaises(TypeError):
+            fetch_from_swapi('people', 1, 3)
+
     def test_fetch_from_swapi_invalid_endpoint(self):
         """Test handling of invalid endpoint."""
         result = fetch_from_swapi('invalid_endpoint')
         self.assertIsNone(result)
 
-    @patch('swapi.requests.get')
+    @patch('missions.swapi.http_client.get')
     def test_fetch_from_swapi_request_timeout(self, mock_get):
         """Test handling of request timeout."""
         mock_get.side_effect = requests.exceptions.Timeout("Request timeout")
@@ -162,7 +174,7 @@ class TestFetchFromSwapi(TestSwapiModule):
         result = fetch_from_swapi('people')
         self.assertIsNone(result)
 
-    @patch('swapi.requests.get')
+    @patch('missions.swapi.http_client.get')
     def test_fetch_from_swapi_request_exception(self, mock_get):
         """Test handling of request exceptions."""
         mock_get.side_effect = requests.exceptions.RequestException("Connection error")
@@ -170,7 +182,7 @@ class TestFetchFromSwapi(TestSwapiModule):
         result = fetch_from_swapi('people')
         self.assertIsNone(result)
 
-    @patch('swapi.requests.get')
+    @patch('missions.swapi.http_client.get')
     def test_fetch_from_swapi_invalid_json(self, mock_get):
         """Test handling of invalid JSON response."""
         mock_response = Mock()
@@ -181,7 +193,7 @@ class TestFetchFromSwapi(TestSwapiModule):
         result = fetch_from_swapi('people')
         self.assertIsNone(result)
 
-    @patch('swapi.requests.get')
+    @patch('missions.swapi.http_client.get')
     def test_fetch_from_swapi_retry_mechanism(self, mock_get):
         """Test retry mechanism on failure."""
         # First two calls fail, third succeeds
@@ -195,7 +207,7 @@ class TestFetchFromSwapi(TestSwapiModule):
         self.assertIsNotNone(result)
         self.assertEqual(mock_get.call_count, 3)
 
-    @patch('swapi.requests.get')
+    @patch('missions.swapi.http_client.get')
     def test_fetch_from_swapi_unexpected_response_format(self, mock_get):
         """Test handling of unexpected response format."""
         mock_response_data = {
@@ -214,7 +226,7 @@ class TestFetchFromSwapi(TestSwapiModule):
 class TestGetAllItemsFromEndpoint(TestSwapiModule):
     """Test cases for get_all_items_from_endpoint function."""
 
-    @patch('swapi.fetch_from_swapi')
+    @patch('missions.swapi.fetch_from_swapi')
     def test_get_all_items_single_page(self, mock_fetch):
         """Test getting all items from single page."""
         mock_fetch.return_value = {
@@ -229,9 +241,9 @@ class TestGetAllItemsFromEndpoint(TestSwapiModule):
         result = get_all_items_from_endpoint('people', max_items=10)
 
         self.assertEqual(len(result), 2)
-        mock_fetch.assert_called_once_with('people', 1)
+        mock_fetch.assert_called_once_with('people', 1, limit=10)
 
-    @patch('swapi.fetch_from_swapi')
+    @patch('missions.swapi.fetch_from_swapi')
     def test_get_all_items_multiple_pages(self, mock_fetch):
         """Test getting all items from multiple pages."""
         # Mock multiple pages
@@ -258,7 +270,42 @@ class TestGetAllItemsFromEndpoint(TestSwapiModule):
         self.assertEqual(len(result), 3)
         self.assertEqual(mock_fetch.call_count, 3)
 
-    @patch('swapi.fetch_from_swapi')
+    @patch('missions.swapi.fetch_from_swapi')
+    def test_get_all_items_parallel_keeps_page_order(self, mock_fetch):
+        """Test parallel crawl fetches remaining pages and keeps page order."""
+        def fetch_page(endpoint, page, limit=None):
+            return {
+                "results": [{"properties": {"name": f"Item {page}-{i}"}} for i in range(10)],
+                "next": f"page{page + 1}" if page < 3 else None,
+                "count": 30
+            }
+
+        mock_fetch.side_effect = fetch_page
+
+        result = get_all_items_from_endpoint('people', max_items=50, parallel=True)
+
+        self.assertEqual(len(result), 30)
+        self.assertEqual(mock_fetch.call_count, 3)
+        names = [item['properties']['name'] for item in result]
+        self.assertEqual(names[0], "Item 1-0")
+        self.assertEqual(names[10], "Item 2-0")
+        self.assertEqual(names[29], "Item 3-9")
+
+    @patch('missions.swapi.fetch_from_swapi')
+    def test_get_all_items_parallel_respects_max_items(self, mock_fetch):
+        """Test parallel crawl only fetches the pages needed for max_items."""
+        mock_fetch.return_value = {
+            "results": [{"properties": {"name": "Luke"}}] * 10,
+            "next": "page2",
+            "count": 82
+        }
+
+        result = get_all_items_from_endpoint('people', max_items=15, parallel=True)
+
+        self.assertEqual(len(result), 15)
+        self.assertEqual(mock_fetch.call_count, 2)
+
+    @patch('missions.swapi.fetch_from_swapi')
     def test_get_all_items_max_items_limit(self, mock_fetch):
         """Test max_items limit is respected."""
         mock_fetch.return_value = {
@@ -275,7 +322,7 @@ class TestGetAllItemsFromEndpoint(TestSwapiModule):
 
         self.assertEqual(len(result), 2)
 
-    @patch('swapi.fetch_from_swapi')
+    @patch('missions.swapi.fetch_from_swapi')
     def test_get_all_items_caching(self, mock_fetch):
         """Test that caching works for get_all_items_from_endpoint."""
         mock_fetch.return_value = {
@@ -294,7 +341,19 @@ class TestGetAllItemsFromEndpoint(TestSwapiModule):
         # Should only call fetch_from_swapi once
         mock_fetch.assert_called_once()
 
-    @patch('swapi.fetch_from_swapi')
+    @patch('missions.swapi.fetch_from_swapi')
+    def test_get_all_items_cache_key_includes_max_items(self, mock_fetch):
+        """Test that a different max_items does not reuse a shorter cached slice."""
+        mock_fetch.return_value = {
+            "results": [{"properties": {"name": "Luke"}}] * 5,
+            "next": None,
+            "count": 5
+        }
+
+        self.assertEqual(len(get_all_items_from_endpoint('people', max_items=2)), 2)
+        self.assertEqual(len(get_all_items_from_endpoint('people', max_items=5)), 5)
+
+    @patch('missions.swapi.fetch_from_swapi')
     def test_get_all_items_fetch_failure(self, mock_fetch):
         """Test handling when fetch_from_swapi fails."""
         mock_fetch.return_value = None
@@ -303,7 +362,7 @@ class TestGetAllItemsFromEndpoint(TestSwapiModule):
 
         self.assertEqual(result, [])
 
-    @patch('swapi.fetch_from_swapi')
+    @patch('missions.swapi.fetch_from_swapi')
     def test_get_all_items_empty_results(self, mock_fetch):
         """Test handling of empty results."""
         mock_fetch.return_value = {
@@ -317,171 +376,278 @@ class TestGetAllItemsFromEndpoint(TestSwapiModule):
         self.assertEqual(result, [])
 
 
+class TestCrawlPlanning(unittest.TestCase):
+    """Test cases for crawl page sizes and cache keys."""
+
+    def test_plan_page_size(self):
+        """Test that page sizes cover max_items in the fewest requests."""
+        self.assertEqual(swapi.plan_page_size(50), 50)
+        self.assertEqual(swapi.plan_page_size(100), 100)
+        self.assertEqual(swapi.plan_page_size(250), 84)
+        self.assertEqual(swapi.plan_page_size(None), swapi.MAX_PAGE_SIZE)
+
+    def test_cache_keys(self):
+        """Test that non-default page sizes and limits get their own cache keys."""
+        self.assertEqual(swapi.page_cache_key('people', 2), 'people_page_2')
+        self.assertEqual(swapi.page_cache_key('people', 2, 100), 'people_page_2_limit_100')
+        self.assertEqual(swapi.items_cache_key('people', 50, swapi.MAX_CRAWL_PAGES), 'people_all_items_50')
+        self.assertEqual(swapi.items_cache_key('people', None, None), 'people_all_items_all')
+        self.assertEqual(swapi.items_cache_key('people', None, 2), 'people_all_items_all_pages_2')
+
+    def test_plan_remaining_pages_uses_served_page_size(self):
+        """Test that planning follows the page size the server actually returned."""
+        first = {'results': [{}] * 10, 'next': 'more', 'count': 82}
+
+        self.assertEqual(swapi.plan_remaining_pages(first, None), range(2, 10))
+        self.assertEqual(swapi.plan_remaining_pages(first, None, max_pages=4), range(2, 5))
+        self.assertEqual(swapi.plan_remaining_pages(first, 25), range(2, 4))
+
+    @patch('missions.swapi.set_base_url')
+    @patch('missions.swapi.configure_cache')
+    def test_parallel_crawl_settings(self, mock_configure_cache, mock_set_base_url):
+        """Test that SWAPI_PARALLEL_CRAWL and SWAPI_CRAWL_WORKERS are applied."""
+        with preserve_settings():
+            swapi.configure_from_settings(SimpleNamespace(SWAPI_PARALLEL_CRAWL=True, SWAPI_CRAWL_WORKERS=8))
+
+            self.assertTrue(swapi.PARALLEL_CRAWL)
+            self.assertEqual(swapi.CRAWL_WORKERS, 8)
+
+        mock_configure_cache.assert_called_once_with(None)
+        mock_set_base_url.assert_not_called()
+
+    @patch('missions.swapi.set_base_url')
+    @patch('missions.swapi.configure_cache')
+    def test_base_url_setting_keeps_shared_cache(self, mock_configure_cache, mock_set_base_url):
+        """Test that SWAPI_BASE at startup does not clear the (shared) cache."""
+        with preserve_settings():
+            swapi.configure_from_settings(SimpleNamespace(SWAPI_BASE="http://127.0.0.1:8001/api"))
+
+        mock_set_base_url.assert_called_once_with("http://127.0.0.1:8001/api", clear=False)
+
+    @patch('missions.swapi.http_client.configure_pool')
+    @patch('missions.swapi.configure_cache')
+    def test_pool_size_settings(self, mock_configure_cache, mock_configure_pool):
+        """Test that the pool is resized only when SWAPI_POOL_* differ from the current size."""
+        with preserve_settings():
+            swapi.configure_from_settings(SimpleNamespace())
+            mock_configure_pool.assert_not_called()
+
+            swapi.configure_from_settings(SimpleNamespace(SWAPI_POOL_MAXSIZE=32))
+
+        mock_configure_pool.assert_called_once_with(http_client.POOL_CONNECTIONS, 32)
+
+
 class TestGetRandomCharacter(TestSwapiModule):
     """Test cases for get_random_character function."""
 
-    @patch('swapi.get_all_items_from_endpoint')
-    @patch('swapi.random.choice')
-    def test_get_random_character_success(self, mock_choice, mock_get_all):
+    @patch('missions.swapi.get_all_items_from_endpoint')
+    @patch('missions.swapi.random.choices')
+    def test_get_random_character_success(self, mock_choices, mock_get_all):
         """Test successful random character retrieval."""
         mock_characters = [
             {"properties": {"name": "Luke Skywalker"}},
             {"properties": {"name": "Darth Vader"}}
         ]
         mock_get_all.return_value = mock_characters
-        mock_choice.return_value = mock_characters[0]
+        mock_choices.return_value = ["Luke Skywalker"]
 
         result = get_random_character()
 
         self.assertEqual(result, "Luke Skywalker")
-        mock_get_all.assert_called_once_with('people')
-        mock_choice.assert_called_once_with(mock_characters)
+        mock_get_all.assert_called_once_with('people', swapi.SAMPLE_MAX_ITEMS)
+        mock_choices.assert_called_once_with(("Luke Skywalker", "Darth Vader"), k=1)
 
-    @patch('swapi.get_all_items_from_endpoint')
-    @patch('swapi.random.choice')
-    def test_get_random_character_direct_name(self, mock_choice, mock_get_all):
+    @patch('missions.swapi.get_all_items_from_endpoint')
+    def test_get_random_character_direct_name(self, mock_get_all):
         """Test character retrieval when name is directly in object."""
         mock_characters = [
             {"name": "Luke Skywalker"}  # Direct name field
         ]
         mock_get_all.return_value = mock_characters
-        mock_choice.return_value = mock_characters[0]
 
         result = get_random_character()
 
         self.assertEqual(result, "Luke Skywalker")
 
-    @patch('swapi.get_all_items_from_endpoint')
-    @patch('swapi.random.choice')
-    def test_get_random_character_fallback(self, mock_choice, mock_get_all):
+    @patch('missions.swapi.get_all_items_from_endpoint')
+    def test_get_random_character_fallback(self, mock_get_all):
         """Test fallback when API returns no characters."""
         mock_get_all.return_value = []
-        mock_choice.return_value = "Luke Skywalker"
 
         result = get_random_character()
 
-        self.assertEqual(result, "Luke Skywalker")
-        # Should call choice twice: once for empty list, once for fallback
-        self.assertEqual(mock_choice.call_count, 1)
+        self.assertIn(result, FALLBACK_NAMES['character'])
 
-    @patch('swapi.get_all_items_from_endpoint')
-    @patch('swapi.random.choice')
-    def test_get_random_character_exception_handling(self, mock_choice, mock_get_all):
+    @patch('missions.swapi.get_all_items_from_endpoint')
+    def test_get_random_character_exception_handling(self, mock_get_all):
         """Test exception handling in get_random_character."""
         mock_get_all.side_effect = Exception("API Error")
-        mock_choice.return_value = "Luke Skywalker"
 
         result = get_random_character()
 
-        self.assertEqual(result, "Luke Skywalker")
+        self.assertIn(result, FALLBACK_NAMES['character'])
 
-    @patch('swapi.get_all_items_from_endpoint')
-    @patch('swapi.random.choice')
-    def test_get_random_character_empty_name(self, mock_choice, mock_get_all):
+    @patch('missions.swapi.get_all_items_from_endpoint')
+    def test_get_random_character_empty_name(self, mock_get_all):
         """Test handling of empty/None name."""
         mock_characters = [
             {"properties": {"name": ""}},  # Empty name
             {"properties": {"name": None}}  # None name
         ]
         mock_get_all.return_value = mock_characters
-        mock_choice.side_effect = [mock_characters[0], "Luke Skywalker"]
 
         result = get_random_character()
 
-        self.assertEqual(result, "Luke Skywalker")
+        self.assertIn(result, FALLBACK_NAMES['character'])
+
+    @patch('missions.swapi.get_all_items_from_endpoint')
+    def test_name_pool_built_once(self, mock_get_all):
+        """Test that names are extracted once and reused across draws."""
+        mock_get_all.return_value = [{"properties": {"name": "Yoda"}}]
+
+        for _ in range(5):
+            self.assertEqual(get_random_character(), "Yoda")
+
+        mock_get_all.assert_called_once_with('people', swapi.SAMPLE_MAX_ITEMS)
 
 
 class TestGetRandomPlanet(TestSwapiModule):
     """Test cases for get_random_planet function."""
 
-    @patch('swapi.get_all_items_from_endpoint')
-    @patch('swapi.random.choice')
-    def test_get_random_planet_success(self, mock_choice, mock_get_all):
+    @patch('missions.swapi.get_all_items_from_endpoint')
+    def test_get_random_planet_success(self, mock_get_all):
         """Test successful random planet retrieval."""
         mock_planets = [
             {"properties": {"name": "Tatooine"}},
             {"properties": {"name": "Alderaan"}}
         ]
         mock_get_all.return_value = mock_planets
-        mock_choice.return_value = mock_planets[0]
 
         result = get_random_planet()
 
-        self.assertEqual(result, "Tatooine")
-        mock_get_all.assert_called_once_with('planets')
+        self.assertIn(result, ["Tatooine", "Alderaan"])
+        mock_get_all.assert_called_once_with('planets', swapi.SAMPLE_MAX_ITEMS)
 
-    @patch('swapi.get_all_items_from_endpoint')
-    @patch('swapi.random.choice')
-    def test_get_random_planet_fallback(self, mock_choice, mock_get_all):
+    @patch('missions.swapi.get_all_items_from_endpoint')
+    def test_get_random_planet_fallback(self, mock_get_all):
         """Test fallback when API returns no planets."""
         mock_get_all.return_value = []
-        mock_choice.return_value = "Tatooine"
 
         result = get_random_planet()
 
-        self.assertEqual(result, "Tatooine")
+        self.assertIn(result, FALLBACK_NAMES['planet'])
 
 
 class TestGetRandomStarship(TestSwapiModule):
     """Test cases for get_random_starship function."""
 
-    @patch('swapi.get_all_items_from_endpoint')
-    @patch('swapi.random.choice')
-    def test_get_random_starship_success(self, mock_choice, mock_get_all):
+    @patch('missions.swapi.get_all_items_from_endpoint')
+    def test_get_random_starship_success(self, mock_get_all):
         """Test successful random starship retrieval."""
         mock_starships = [
             {"properties": {"name": "Millennium Falcon"}},
             {"properties": {"name": "X-wing"}}
         ]
         mock_get_all.return_value = mock_starships
-        mock_choice.return_value = mock_starships[0]
 
         result = get_random_starship()
 
-        self.assertEqual(result, "Millennium Falcon")
-        mock_get_all.assert_called_once_with('starships')
+        self.assertIn(result, ["Millennium Falcon", "X-wing"])
+        mock_get_all.assert_called_once_with('starships', swapi.SAMPLE_MAX_ITEMS)
 
-    @patch('swapi.get_all_items_from_endpoint')
-    @patch('swapi.random.choice')
-    def test_get_random_starship_fallback(self, mock_choice, mock_get_all):
+    @patch('missions.swapi.get_all_items_from_endpoint')
+    def test_get_random_starship_fallback(self, mock_get_all):
         """Test fallback when API returns no starships."""
         mock_get_all.return_value = []
-        mock_choice.return_value = "Millennium Falcon"
 
         result = get_random_starship()
 
-        self.assertEqual(result, "Millennium Falcon")
+        self.assertIn(result, FALLBACK_NAMES['starship'])
 
 
 class TestGetRandomVehicle(TestSwapiModule):
     """Test cases for get_random_vehicle function."""
 
-    @patch('swapi.get_all_items_from_endpoint')
-    @patch('swapi.random.choice')
-    def test_get_random_vehicle_success(self, mock_choice, mock_get_all):
+    @patch('missions.swapi.get_all_items_from_endpoint')
+    def test_get_random_vehicle_success(self, mock_get_all):
         """Test successful random vehicle retrieval."""
         mock_vehicles = [
             {"properties": {"name": "Speeder Bike"}},
             {"properties": {"name": "AT-AT"}}
         ]
         mock_get_all.return_value = mock_vehicles
-        mock_choice.return_value = mock_vehicles[0]
 
         result = get_random_vehicle()
 
-        self.assertEqual(result, "Speeder Bike")
-        mock_get_all.assert_called_once_with('vehicles')
+        self.assertIn(result, ["Speeder Bike", "AT-AT"])
+        mock_get_all.assert_called_once_with('vehicles', swapi.SAMPLE_MAX_ITEMS)
 
-    @patch('swapi.get_all_items_from_endpoint')
-    @patch('swapi.random.choice')
-    def test_get_random_vehicle_fallback(self, mock_choice, mock_get_all):
+    @patch('missions.swapi.get_all_items_from_endpoint')
+    def test_get_random_vehicle_fallback(self, mock_get_all):
         """Test fallback when API returns no vehicles."""
         mock_get_all.return_value = []
-        mock_choice.return_value = "Speeder Bike"
 
         result = get_random_vehicle()
 
-        self.assertEqual(result, "Speeder Bike")
+        self.assertIn(result, FALLBACK_NAMES['vehicle'])
+
+
+class TestSample(TestSwapiModule):
+    """Test cases for the generic sample function."""
+
+    @patch('missions.swapi.get_all_items_from_endpoint')
+    def test_sample_returns_k_names(self, mock_get_all):
+        """Test drawing several names in one call."""
+        mock_get_all.return_value = [{"name": "Hoth"}, {"name": "Endor"}]
+
+        result = sample('planet', 10)
+
+        self.assertEqual(len(result), 10)
+        self.assertTrue(set(result) <= {"Hoth", "Endor"})
+
+    @patch('missions.swapi.get_all_items_from_endpoint')
+    def test_fallback_warning_logged_once(self, mock_get_all):
+        """Test that an outage logs one warning, not one per draw."""
+        mock_get_all.return_value = []
+        swapi._FALLBACK_TYPES.discard('planet')
+
+        with self.assertLogs('missions.swapi', level='WARNING') as logs:
+            for _ in range(5):
+                sample('planet')
+
+        self.assertEqual(sum('No planet names found' in line for line in logs.output), 1)
+
+        mock_get_all.return_value = [{"name": "Hoth"}]
+        with self.assertLogs('missions.swapi', level='INFO') as logs:
+            sample('planet')
+        self.assertTrue(any('Planet names available again' in line for line in logs.output))
+
+    def test_sample_unknown_entity_type(self):
+        """Test that an unknown entity type is rejected."""
+        with self.assertRaises(ValueError):
+            sample('droid')
+
+    @patch('missions.swapi.get_all_items_from_endpoint')
+    def test_slow_crawl_does_not_block_other_types(self, mock_get_all):
+        """Test that a draw is not held up by another entity type's crawl."""
+        crawling, release = threading.Event(), threading.Event()
+
+        def get_all(endpoint, max_items):
+            if endpoint == 'people':
+                crawling.set()
+                release.wait(5)
+            return [{"name": f"{endpoint} 1"}]
+
+        mock_get_all.side_effect = get_all
+        thread = threading.Thread(target=sample, args=('character',))
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(release.set)
+        crawling.wait(5)
+
+        start = time.monotonic()
+        self.assertEqual(sample('planet'), ["planets 1"])
+        self.assertLess(time.monotonic() - start, 1)
 
 
 class TestCacheUtilities(TestSwapiModule):
@@ -503,13 +669,12 @@ class TestCacheUtilities(TestSwapiModule):
         """Test cache info with empty cache."""
         result = get_cache_info()
 
-        expected = {
-            'cache_size': 0,
-            'cached_endpoints': [],
-            'total_cached_items': 0
-        }
-
-        self.assertEqual(result, expected)
+        self.assertEqual(result['cache_size'], 0)
+        self.assertEqual(result['cached_endpoints'], [])
+        self.assertEqual(result['total_cached_items'], 0)
+        self.assertEqual(result['hits'], 0)
+        self.assertEqual(result['misses'], 0)
+        self.assertEqual(result['evictions'], 0)
 
     def test_get_cache_info_with_data(self):
         """Test cache info with cached data."""
@@ -529,10 +694,107 @@ class TestCacheUtilities(TestSwapiModule):
         self.assertEqual(result['total_cached_items'], 7)
 
 
+class TestStaleWhileRevalidate(TestSwapiModule):
+    """Test cases for serving stale data while refreshing it."""
+
+    def wait_for_refresh(self, key):
+        """Wait until the given stats counter has moved."""
+        deadline = time.monotonic() + 5
+        while not swapi.REFRESH_STATS[key] and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def setUp(self):
+        """Reset the refresh counters."""
+        super().setUp()
+        for key in swapi.REFRESH_STATS:
+            swapi.REFRESH_STATS[key] = 0
+
+    @patch('missions.swapi.http_client.get')
+    def test_stale_page_served_and_refreshed(self, mock_get):
+        """Test that an expired page is returned at once and refreshed in the background."""
+        stale = {'results': [{'name': 'Old'}], 'next': None, 'previous': None, 'count': 1}
+        CACHE.set('people_page_1', stale, ttl=0.01)
+        time.sleep(0.02)
+
+        mock_get.return_value = Mock(
+            json=lambda: {'results': [{'name': 'New'}], 'next': None, 'count': 1},
+            raise_for_status=lambda: None
+        )
+
+        result = fetch_from_swapi('people', page=1)
+        self.assertEqual(result, stale)
+
+        self.wait_for_refresh('refresh_success')
+        self.assertEqual(swapi.REFRESH_STATS['refresh_success'], 1)
+        self.assertEqual(fetch_from_swapi('people', page=1)['results'], [{'name': 'New'}])
+
+    @patch('missions.swapi.http_client.get')
+    def test_failed_refresh_keeps_stale_data(self, mock_get):
+        """Test that a failed refresh is counted and the stale page is kept."""
+        stale = {'results': [{'name': 'Old'}], 'next': None, 'previous': None, 'count': 1}
+        CACHE.set('people_page_1', stale, ttl=0.01)
+        time.sleep(0.02)
+        mock_get.side_effect = requests.exceptions.RequestException("API Down")
+
+        self.assertEqual(fetch_from_swapi('people', page=1), stale)
+
+        self.wait_for_refresh('refresh_failure')
+        self.assertEqual(swapi.REFRESH_STATS['refresh_failure'], 1)
+        self.assertEqual(fetch_from_swapi('people', page=1), stale)
+
+    @patch('missions.swapi.http_client.get')
+    def test_refresh_replaces_name_pool(self, mock_get):
+        """Test that a catalog refresh swaps in a new name pool without dropping the old one first."""
+        CACHE.set('people_all_items_50', [{'name': 'Old'}], ttl=0.01)
+        self.assertEqual(swapi.get_name_pool('character'), ('Old',))
+        time.sleep(0.02)
+
+        mock_get.return_value = Mock(
+            json=lambda: {'results': [{'name': 'New'}], 'next': None, 'count': 1},
+            raise_for_status=lambda: None
+        )
+        get_all_items_from_endpoint('people', 50)
+
+        deadline = time.monotonic() + 5
+        while swapi.get_fresh_name_pool('character') == ('Old',) and time.monotonic() < deadline:
+            self.assertIn('character', swapi._NAME_POOLS)
+            time.sleep(0.01)
+        self.assertEqual(swapi.get_fresh_name_pool('character'), ('New',))
+
+
+class TestHttpClient(unittest.TestCase):
+    """Test cases for the pooled HTTP session layer."""
+
+    def tearDown(self):
+        """Drop the shared session after each test."""
+        http_client.close_session()
+
+    def test_get_session_is_shared(self):
+        """Test that every caller gets the same pooled session."""
+        self.assertIs(http_client.get_session(), http_client.get_session())
+
+    def test_configure_pool_rebuilds_session(self):
+        """Test that changing the pool size replaces the session."""
+        session = http_client.get_session()
+        http_client.configure_pool(pool_maxsize=http_client.POOL_MAXSIZE)
+
+        self.assertIsNot(http_client.get_session(), session)
+
+    def test_get_pool_stats_without_requests(self):
+        """Test pool statistics before any request was made."""
+        http_client.close_session()
+
+        result = http_client.get_pool_stats()
+
+        self.assertEqual(result['requests'], 0)
+        self.assertEqual(result['connections_opened'], 0)
+        self.assertEqual(result['connections_reused'], 0)
+
+
 class TestIntegration(TestSwapiModule):
     """Integration tests for the swapi module."""
 
-    @patch('swapi.requests.get')
+    @patch('missions.swapi.http_client.get')
     def test_full_workflow_success(self, mock_get):
         """Test complete workflow from API call to random selection."""
         # Mock API response
@@ -560,7 +822,7 @@ class TestIntegration(TestSwapiModule):
         cache_info = get_cache_info()
         self.assertGreater(cache_info['cache_size'], 0)
 
-    @patch('swapi.requests.get')
+    @patch('missions.swapi.http_client.get')
     def test_fallback_behavior_on_api_failure(self, mock_get):
         """Test that fallback works when API completely fails."""
         mock_get.side_effect = requests.exceptions.RequestException("API Down")
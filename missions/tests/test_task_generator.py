@@ -0,0 +1,102 @@
+import unittest
+from unittest.mock import patch
+
+from missions.mission_templates import CompiledTemplate, render_batch
+from missions.task_generator import (
+    generate_tasks, generate_themed_tasks, iter_task_chunks, MISSION_TEMPLATES,
+    get_task_difficulty, classify_many, add_task_metadata
+)
+
+
+class TestCompiledTemplate(unittest.TestCase):
+    """Test cases for compiled mission templates."""
+
+    def test_parse_slots(self):
+        """Test that a template is split into literal parts and typed slots."""
+        template = CompiledTemplate("Help {character} escape from {planet}.")
+
+        self.assertEqual(template.parts, ("Help ", " escape from ", "."))
+        self.assertEqual(template.slots, ("character", "planet"))
+
+    def test_unknown_placeholder(self):
+        """Test that unknown placeholders are rejected at compile time."""
+        with self.assertRaises(ValueError):
+            CompiledTemplate("Repair {droid} in the hangar.")
+
+    @patch('missions.mission_templates.sample_names')
+    def test_render_batch_draws_once_per_type(self, mock_sample):
+        """Test that a batch draws all names of a type in one call."""
+        mock_sample.side_effect = lambda entity_type, k, rng=None: [f"{entity_type}{i}" for i in range(k)]
+        templates = [
+            CompiledTemplate("Help {character} escape from {planet}."),
+            CompiledTemplate("Meet with {character} for strategic planning."),
+        ]
+
+        result = render_batch(templates)
+
+        self.assertEqual(result, [
+            "Help character0 escape from planet0.",
+            "Meet with character1 for strategic planning.",
+        ])
+        self.assertEqual(mock_sample.call_count, 2)
+
+
+class TestGenerateTasks(unittest.TestCase):
+    """Test cases for generate_tasks."""
+
+    @patch('missions.mission_templates.sample_names')
+    def test_generate_tasks_count_and_format(self, mock_sample):
+        """Test that generate_tasks returns filled, distinct missions."""
+        mock_sample.side_effect = lambda entity_type, k, rng=None: ["Yoda"] * k
+
+        tasks = generate_tasks(5)
+
+        self.assertEqual(len(tasks), 5)
+        self.assertEqual(len(set(tasks)), 5)
+        for task in tasks:
+            self.assertNotIn("{", task)
+
+    @patch('missions.swapi.get_all_items_from_endpoint', return_value=[])
+    def test_seed_makes_output_reproducible(self, mock_get_all):
+        """Test that seeded generation gives the same missions every time."""
+        self.assertEqual(generate_tasks(5, seed=7), generate_tasks(5, seed=7))
+        self.assertEqual(generate_themed_tasks('combat', 3, seed=7), generate_themed_tasks('combat', 3, seed=7))
+        self.assertEqual(list(iter_task_chunks(2500, seed=7)), list(iter_task_chunks(2500, seed=7)))
+
+    def test_templates_cover_all_missions(self):
+        """Test that every mission template was compiled."""
+        self.assertEqual(len(MISSION_TEMPLATES), 21)
+
+
+class TestTaskDifficulty(unittest.TestCase):
+    """Test cases for difficulty classification."""
+
+    def test_levels(self):
+        """Test each difficulty level and the Easy default."""
+        self.assertEqual(get_task_difficulty("Duel with Darth Maul."), 'Extreme')
+        self.assertEqual(get_task_difficulty("Rescue Leia from Imperial custody."), 'Hard')
+        self.assertEqual(get_task_difficulty("Escort C-3PO to the base."), 'Medium')
+        self.assertEqual(get_task_difficulty("Meditate on the Force."), 'Easy')
+
+    def test_highest_severity_wins(self):
+        """Test that the highest severity keyword wins regardless of position."""
+        self.assertEqual(get_task_difficulty("Repair the X-wing, then defend it."), 'Hard')
+        self.assertEqual(get_task_difficulty("ESCORT the team and SABOTAGE the base."), 'Extreme')
+
+    def test_overlapping_keywords(self):
+        """Test that keywords overlapping another keyword are still found."""
+        self.assertEqual(get_task_difficulty("Deliverescue"), 'Hard')
+        self.assertEqual(get_task_difficulty("Defenduel"), 'Extreme')
+        self.assertEqual(get_task_difficulty("investigatescape"), 'Hard')
+        self.assertEqual(get_task_difficulty("repairescue"), 'Hard')
+
+    def test_classify_many_and_metadata(self):
+        """Test batch classification and task metadata."""
+        tasks = ["Patrol the perimeter.", "Study Jedi texts."]
+
+        self.assertEqual(classify_many(tasks), ['Medium', 'Easy'])
+        self.assertEqual(add_task_metadata(tasks)[0]['estimated_time'], '1-2 hours')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, buffer=True)
@@ -0,0 +1,190 @@
+import os
+import json
+import random
+import tempfile
+import unittest
+from collections import Counter
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from missions import swapi, themes
+from missions.themes import AliasTable, Theme, ThemeRegistry, UnknownThemeError, parse_theme_spec
+from missions.task_generator import generate_themed_tasks, iter_task_chunks, THEMES, MISSION_TEMPLATES
+
+
+class TestAliasTable(unittest.TestCase):
+    """Test cases for O(1) weighted draws."""
+
+    def test_draws_follow_weights(self):
+        """Test that indices are drawn in proportion to their weights."""
+        table = AliasTable([1, 3, 0, 6])
+        counts = Counter(table.draw_many(100_000, random.Random(1)))
+
+        self.assertEqual(counts[2], 0)
+        for index, share in ((0, 0.1), (1, 0.3), (3, 0.6)):
+            self.assertAlmostEqual(counts[index] / 100_000, share, delta=0.01)
+
+    def test_draw_matches_draw_many(self):
+        """Test that single and batched draws use the random stream the same way."""
+        table = AliasTable([2, 1, 1])
+        rng = random.Random(5)
+        singles = [table.draw(rng) for _ in range(50)]
+
+        self.assertEqual(table.draw_many(50, random.Random(5)), singles)
+
+    def test_invalid_weights(self):
+        """Test that weights must be non-negative with a positive sum."""
+        for weights in ([], [0, 0], [1, -1]):
+            with self.assertRaises(ValueError):
+                AliasTable(weights)
+
+
+class TestThemeRegistry(unittest.TestCase):
+    """Test cases for registering and looking up themes."""
+
+    def setUp(self):
+        self.registry = ThemeRegistry()
+
+    def test_unknown_theme_raises(self):
+        """Test that unknown themes raise instead of falling back."""
+        with self.assertRaises(UnknownThemeError) as context:
+            THEMES.get('smuggling')
+
+        self.assertIsInstance(context.exception, ValueError)
+        self.assertIn('combat', str(context.exception))
+
+    def test_builtin_themes(self):
+        """Test that the built-in themes are registered and 'general' uses every template."""
+        self.assertEqual(THEMES.names(), ['combat', 'diplomatic', 'exploration', 'general', 'training'])
+        self.assertEqual(THEMES.get('general').templates, MISSION_TEMPLATES)
+
+    def test_parse_spec_with_weights(self):
+        """Test that entries may be plain templates or weighted objects."""
+        theme = parse_theme_spec('smuggling', [
+            "Smuggle spice to {planet}.",
+            {'template': "Outrun the Empire in the {starship}.", 'weight': 3},
+        ])
+
+        self.assertEqual(theme.weights, (1, 3))
+        self.assertEqual(theme.templates[1].slots, ('starship',))
+
+    def test_parse_spec_rejects_bad_entries(self):
+        """Test that malformed themes fail when registered."""
+        for entries in ([], [42], ["Visit {moon}."]):
+            with self.assertRaises(ValueError):
+                parse_theme_spec('broken', entries)
+
+    def test_weights_must_match_templates(self):
+        """Test that a theme needs one weight per template."""
+        with self.assertRaises(ValueError):
+            Theme('broken', ["Visit {planet}."], weights=[1, 2])
+
+    def test_load_file(self):
+        """Test that themes are registered from a JSON file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'themes.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'bounty': ["Track {character} to {planet}."]}, f)
+
+            self.assertEqual(self.registry.load_file(path), ['bounty'])
+
+        self.assertIn('bounty', self.registry)
+
+    def test_configure_from_settings(self):
+        """Test that MISSION_THEMES are registered in the process-wide registry."""
+        settings = SimpleNamespace(MISSION_THEMES={'smuggling': ["Smuggle spice to {planet}."]})
+        try:
+            themes.configure_from_settings(settings)
+            self.assertEqual(THEMES.get('smuggling').templates[0].source, "Smuggle spice to {planet}.")
+        finally:
+            THEMES.unregister('smuggling')
+
+
+@patch('missions.swapi.get_all_items_from_endpoint', return_value=[])
+class TestThemedGeneration(unittest.TestCase):
+    """Test cases for themed mission generation."""
+
+    def setUp(self):
+        swapi.clear_cache()
+
+    def tearDown(self):
+        swapi.clear_cache()
+        THEMES.unregister('weighted')
+
+    def test_generate_themed_tasks(self, mock_items):
+        """Test that themed generation returns max_tasks missions of the theme."""
+        sources = {template.parts[0] for template in THEMES.get('combat').templates}
+        tasks = generate_themed_tasks('combat', 12, seed=3)
+
+        self.assertEqual(len(tasks), 12)
+        self.assertTrue(all(any(task.startswith(prefix) for prefix in sources) for task in tasks))
+
+    def test_unknown_theme(self, mock_items):
+        """Test that generation does not silently fall back to another theme."""
+        with self.assertRaises(UnknownThemeError):
+            generate_themed_tasks('smuggling')
+
+    def test_weights_shape_bulk_output(self, mock_items):
+        """Test that template weights apply to bulk generation."""
+        THEMES.register('weighted', ["Scout {planet}.", "Repair the {starship}."], weights=[9, 1])
+        tasks = [task for chunk in iter_task_chunks(5000, seed=1, theme='weighted') for task in chunk]
+
+        scouting = sum(task.startswith("Scout") for task in tasks)
+        self.assertAlmostEqual(scouting / 5000, 0.9, delta=0.03)
+
+    def test_batched_chunks_match_themed_tasks(self, mock_items):
+        """Test that the API's chunked path draws like generate_themed_tasks."""
+        self.assertEqual(
+            generate_themed_tasks('training', 20, seed=9),
+            next(iter_task_chunks(20, seed=9, theme='training'))
+        )
+
+
+@patch('missions.swapi.fetch_from_swapi', return_value=None)
+class TestThemedAPI(SimpleTestCase):
+    """Test cases for /api/tasks/?theme=."""
+
+    def setUp(self):
+        swapi.clear_cache()
+
+    def tearDown(self):
+        swapi.clear_cache()
+
+    def test_themed_tasks(self, mock_fetch):
+        """Test that ?theme= returns missions of that theme."""
+        response = self.client.get('/api/tasks/', {'theme': 'exploration', 'count': 8})
+        sources = {template.parts[0] for template in THEMES.get('exploration').templates}
+
+        self.assertEqual(response.status_code, 200)
+        tasks = response.json()['tasks']
+        self.assertEqual(len(tasks), 8)
+        self.assertTrue(all(any(task.startswith(prefix) for prefix in sources) for task in tasks))
+
+    def test_seeded_themed_tasks(self, mock_fetch):
+        """Test that seeded themed responses are reproducible and differ per theme."""
+        combat = self.client.get('/api/tasks/', {'theme': 'combat', 'seed': 4}).json()
+        again = self.client.get('/api/tasks/', {'theme': 'combat', 'seed': 4}).json()
+        training = self.client.get('/api/tasks/', {'theme': 'training', 'seed': 4}).json()
+
+        self.assertEqual(combat, again)
+        self.assertNotEqual(combat, training)
+
+    def test_streamed_themed_tasks(self, mock_fetch):
+        """Test that themed missions can be streamed as NDJSON."""
+        response = self.client.get('/api/tasks/', {'theme': 'diplomatic', 'count': 1500})
+
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 1500)
+
+    def test_unknown_theme(self, mock_fetch):
+        """Test that unknown themes are rejected with the available ones."""
+        response = self.client.get('/api/tasks/', {'theme': 'smuggling'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('combat', response.json()['themes'])
+
+
+if __name__ == '__main__':
+    unittest.main()
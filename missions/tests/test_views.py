@@ -0,0 +1,90 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from missions import swapi
+
+
+@patch('missions.swapi.fetch_from_swapi', return_value=None)
+class TestTaskListAPI(SimpleTestCase):
+    """Test cases for the missions API views."""
+
+    def setUp(self):
+        """Clear cache before each test."""
+        swapi.clear_cache()
+
+    def tearDown(self):
+        """Clear cache after each test."""
+        swapi.clear_cache()
+
+    def test_get_tasks(self, mock_fetch):
+        """Test that the API returns five missions."""
+        response = self.client.get('/api/tasks/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['tasks']), 5)
+
+    def test_get_tasks_with_count(self, mock_fetch):
+        """Test that ?count= returns that many missions as JSON."""
+        response = self.client.get('/api/tasks/', {'count': 50})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['tasks']), 50)
+
+    def test_get_tasks_streams_large_counts(self, mock_fetch):
+        """Test that large counts are streamed as NDJSON."""
+        response = self.client.get('/api/tasks/', {'count': 2500})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 2500)
+        self.assertIsInstance(json.loads(lines[0])['task'], str)
+
+    def test_seeded_tasks_are_reproducible(self, mock_fetch):
+        """Test that the same seed gives the same missions and a cacheable response."""
+        first = self.client.get('/api/tasks/', {'seed': 42})
+        second = self.client.get('/api/tasks/', {'seed': 42})
+
+        self.assertEqual(first.json(), second.json())
+        self.assertIn('max-age', first['Cache-Control'])
+        self.assertIn('public', first['Cache-Control'])
+
+    def test_get_tasks_invalid_count(self, mock_fetch):
+        """Test that invalid counts are rejected."""
+        for count in ('abc', '0', '-3', '100000000'):
+            response = self.client.get('/api/tasks/', {'count': count})
+            self.assertEqual(response.status_code, 400)
+
+        response = self.client.get('/api/tasks/', {'seed': 'abc'})
+        self.assertEqual(response.status_code, 400)
+
+
+class TestClassifyTasksAPI(SimpleTestCase):
+    """Test cases for the mission classification API."""
+
+    def test_classify_tasks(self):
+        """Test that a list of custom missions is classified in one request."""
+        response = self.client.post(
+            '/api/tasks/classify/',
+            data=json.dumps({'tasks': ["Duel with Vader.", "Feed the porgs."]}),
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        difficulties = [task['difficulty'] for task in response.json()['tasks']]
+        self.assertEqual(difficulties, ['Extreme', 'Easy'])
+
+    def test_classify_tasks_invalid_body(self):
+        """Test that malformed bodies are rejected."""
+        for body in ('not json', json.dumps({'tasks': 'Duel'}), json.dumps({'other': []})):
+            response = self.client.post('/api/tasks/classify/', data=body, content_type='application/json')
+            self.assertEqual(response.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, buffer=True)
@@ -0,0 +1,122 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from missions import swapi, warmup
+from missions.snapshot import write_snapshot
+
+
+CATALOG = {
+    'people': [{'uid': '1', 'name': 'Luke Skywalker'}],
+    'planets': [{'uid': '1', 'name': 'Tatooine'}],
+    'starships': [{'uid': '1', 'name': 'X-wing'}],
+    'vehicles': [{'uid': '1', 'name': 'Snowspeeder'}],
+}
+
+
+def fake_items(endpoint, max_items=50, parallel=None, max_pages=None):
+    return CATALOG.get(endpoint, [])
+
+
+class TestShouldWarmUp(unittest.TestCase):
+    """Test cases for deciding which processes warm up."""
+
+    def test_servers_warm_up(self):
+        """Test that WSGI/ASGI servers warm up."""
+        self.assertTrue(warmup.should_warm_up(['/usr/bin/gunicorn', 'StarWars_ToDo.wsgi'], {}))
+        self.assertTrue(warmup.should_warm_up(['uvicorn', 'StarWars_ToDo.asgi:application'], {}))
+
+    def test_management_commands_do_not(self):
+        """Test that migrate, test and pytest skip the warm-up."""
+        self.assertFalse(warmup.should_warm_up(['manage.py', 'migrate'], {}))
+        self.assertFalse(warmup.should_warm_up(['manage.py', 'test'], {}))
+        self.assertFalse(warmup.should_warm_up(['/venv/lib/site-packages/pytest/__main__.py', '-q'], {}))
+        self.assertFalse(warmup.should_warm_up(['-c'], {}))
+
+    def test_runserver_child_only(self):
+        """Test that only the runserver process serving requests warms up."""
+        self.assertFalse(warmup.should_warm_up(['manage.py', 'runserver'], {}))
+        self.assertTrue(warmup.should_warm_up(['manage.py', 'runserver'], {'RUN_MAIN': 'true'}))
+        self.assertTrue(warmup.should_warm_up(['manage.py', 'runserver', '--noreload'], {}))
+
+
+class TestWarmUp(unittest.TestCase):
+    """Test cases for loading the name pools at startup."""
+
+    def setUp(self):
+        swapi.clear_cache()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'snapshot.jsonl')
+
+    def tearDown(self):
+        warmup.stop(timeout=5)
+        self.tmpdir.cleanup()
+        swapi.clear_cache()
+
+    @patch('missions.swapi.get_all_items_from_endpoint', side_effect=fake_items)
+    def test_warm_up_from_catalog(self, mock_items):
+        """Test that the pools are loaded from SWAPI."""
+        self.assertEqual(warmup.warm_up(), 'catalog')
+        self.assertTrue(swapi.name_pools_loaded())
+        self.assertEqual(swapi.get_fresh_name_pool('planet'), ('Tatooine',))
+
+    @patch('missions.swapi.get_all_items_from_endpoint', return_value=[])
+    def test_warm_up_from_snapshot(self, mock_items):
+        """Test that the snapshot fills in when SWAPI is unavailable."""
+        write_snapshot(self.path, CATALOG)
+
+        with patch('missions.warmup.SNAPSHOT_PATH', self.path):
+            self.assertEqual(warmup.warm_up(), 'snapshot')
+
+        self.assertEqual(swapi.get_fresh_name_pool('character'), ('Luke Skywalker',))
+
+    @patch('missions.swapi.get_all_items_from_endpoint', return_value=[])
+    def test_warm_up_without_sources(self, mock_items):
+        """Test that the warm-up reports failure without SWAPI or a snapshot."""
+        with patch('missions.warmup.SNAPSHOT_PATH', self.path):
+            self.assertIsNone(warmup.warm_up())
+        self.assertFalse(swapi.name_pools_loaded())
+
+    @patch('missions.swapi.get_all_items_from_endpoint', side_effect=fake_items)
+    def test_background_warm_up(self, mock_items):
+        """Test that start() loads the pools in a background thread."""
+        warmup.start().join(timeout=5)
+
+        self.assertTrue(swapi.name_pools_loaded())
+        self.assertEqual(warmup.status()['warmup']['status'], warmup.DONE)
+        self.assertEqual(warmup.status()['warmup']['source'], 'catalog')
+
+
+@patch('missions.warmup.WARMUP_ENABLED', True)
+class TestReadinessView(SimpleTestCase):
+    """Test cases for /healthz/ready."""
+
+    def setUp(self):
+        swapi.clear_cache()
+
+    def tearDown(self):
+        swapi.clear_cache()
+
+    def test_not_ready_until_pools_loaded(self):
+        """Test that the endpoint holds traffic until the pools are loaded."""
+        response = self.client.get('/healthz/ready')
+        self.assertEqual(response.status_code, 503)
+        self.assertFalse(response.json()['ready'])
+
+        swapi.install_name_pools({entity_type: ["Yoda"] for entity_type in swapi.ENTITY_ENDPOINTS})
+
+        response = self.client.get('/healthz/ready')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['ready'])
+
+    def test_ready_when_warm_up_disabled(self):
+        """Test that workers without warm-up are always ready."""
+        with patch('missions.warmup.WARMUP_ENABLED', False):
+            self.assertEqual(self.client.get('/healthz/ready').status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
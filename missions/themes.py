@@ -0,0 +1,287 @@
+import json
+import threading
+import logging
+
+from .mission_templates import CompiledTemplate
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class UnknownThemeError(ValueError):
+    """Raised when a theme is not registered."""
+
+
+class AliasTable:
+    """
+    Weighted random choice of an index in O(1) per draw (Vose's alias method).
+
+    Building the table takes O(n). Each draw then uses one random number:
+    its integer part picks a column, and its fraction decides between the
+    column and its alias.
+    """
+
+    __slots__ = ('size', 'probability', 'alias')
+
+    def __init__(self, weights):
+        """
+        Args:
+            weights (list): Non-negative weights, at least one positive
+
+        Raises:
+            ValueError: If the weights cannot be drawn from
+        """
+        weights = [float(weight) for weight in weights]
+        if not weights or any(weight < 0 for weight in weights) or sum(weights) <= 0:
+            raise ValueError(f"Weights must be non-negative with a positive sum: {weights}")
+
+        size = len(weights)
+        total = sum(weights)
+        scaled = [weight * size / total for weight in weights]
+        probability = [1.0] * size
+        alias = list(range(size))
+
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+
+        # Whatever is left has (up to rounding) exactly one column's worth
+        self.size = size
+        self.probability = tuple(probability)
+        self.alias = tuple(alias)
+
+    def draw(self, rng):
+        """
+        Draw one index.
+
+        Args:
+            rng (random.Random): Random generator
+
+        Returns:
+            int: Index, with probability proportional to its weight
+        """
+        value = rng.random() * self.size
+        column = int(value)
+        return column if value - column < self.probability[column] else self.alias[column]
+
+    def draw_many(self, k, rng):
+        """
+        Draw k indices, with replacement.
+
+        Args:
+            k (int): Number of draws
+            rng (random.Random): Random generator
+
+        Returns:
+            list: k indices
+        """
+        size, probability, alias, random = self.size, self.probability, self.alias, rng.random
+        indices = []
+        for _ in range(k):
+            value = random() * size
+            column = int(value)
+            indices.append(column if value - column < probability[column] else alias[column])
+        return indices
+
+
+class Theme:
+    """Named set of compiled mission templates with per-template weights."""
+
+    __slots__ = ('name', 'templates', 'weights', '_table')
+
+    def __init__(self, name, templates, weights=None):
+        """
+        Args:
+            name (str): Theme name
+            templates (list): CompiledTemplate objects or template strings
+            weights (list): Relative weight per template (default: all equal)
+
+        Raises:
+            ValueError: If a template is invalid, or the weights do not match
+        """
+        templates = tuple(
+            template if isinstance(template, CompiledTemplate) else CompiledTemplate(template)
+            for template in templates
+        )
+        weights = tuple(weights) if weights is not None else (1,) * len(templates)
+        if len(weights) != len(templates):
+            raise ValueError(f"Theme {name!r} has {len(templates)} templates but {len(weights)} weights")
+
+        self.name = name
+        self.templates = templates
+        self.weights = weights
+        self._table = AliasTable(weights)
+
+    def choose(self, k, rng):
+        """
+        Draw k templates by weight, with replacement.
+
+        Args:
+            k (int): Number of templates
+            rng (random.Random): Random generator
+
+        Returns:
+            list: CompiledTemplate objects
+        """
+        templates = self.templates
+        return [templates[index] for index in self._table.draw_many(k, rng)]
+
+    def __len__(self):
+        return len(self.templates)
+
+    def __repr__(self):
+        return f"Theme({self.name!r}, {len(self.templates)} templates)"
+
+
+def parse_theme_spec(name, entries):
+    """
+    Build a theme from settings or file data.
+
+    Args:
+        name (str): Theme name
+        entries (list): Template strings, or {"template": str, "weight": number}
+            objects
+
+    Returns:
+        Theme: Compiled theme
+
+    Raises:
+        ValueError: If the entries are malformed
+    """
+    if not isinstance(entries, (list, tuple)) or not entries:
+        raise ValueError(f"Theme {name!r} needs a non-empty list of templates")
+
+    templates, weights = [], []
+    for entry in entries:
+        if isinstance(entry, str):
+            templates.append(entry)
+            weights.append(1)
+        elif isinstance(entry, dict) and isinstance(entry.get('template'), str):
+            templates.append(entry['template'])
+            weights.append(entry.get('weight', 1))
+        else:
+            raise ValueError(f"Invalid template entry in theme {name!r}: {entry!r}")
+
+    return Theme(name, templates, weights)
+
+
+class ThemeRegistry:
+    """Themes by name, compiled once when registered."""
+
+    def __init__(self):
+        self._themes = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, templates, weights=None):
+        """
+        Compile and register a theme, replacing any theme of that name.
+
+        Args:
+            name (str): Theme name
+            templates (list): CompiledTemplate objects or template strings
+            weights (list): Relative weight per template (default: all equal)
+
+        Returns:
+            Theme: The registered theme
+        """
+        return self.add(Theme(name, templates, weights))
+
+    def add(self, theme):
+        """Register an already compiled Theme."""
+        with self._lock:
+            self._themes[theme.name] = theme
+        logger.debug(f"Registered mission theme {theme.name!r} with {len(theme)} templates")
+        return theme
+
+    def load_file(self, path):
+        """
+        Register every theme of a JSON file.
+
+        The file maps theme names to lists of entries, as accepted by
+        parse_theme_spec.
+
+        Args:
+            path (str): Theme file
+
+        Returns:
+            list: Names of the registered themes
+
+        Raises:
+            ValueError: If the file cannot be read or is malformed
+        """
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except OSError as e:
+            raise ValueError(f"Cannot read theme file {path}: {e}") from e
+
+        if not isinstance(data, dict):
+            raise ValueError(f"Theme file {path} must map theme names to templates")
+
+        themes = [parse_theme_spec(name, entries) for name, entries in data.items()]
+        for theme in themes:
+            self.add(theme)
+        return [theme.name for theme in themes]
+
+    def get(self, name):
+        """
+        Get a registered theme.
+
+        Args:
+            name (str): Theme name
+
+        Returns:
+            Theme: The theme
+
+        Raises:
+            UnknownThemeError: If no theme has that name
+        """
+        theme = self._themes.get(name)
+        if theme is None:
+            raise UnknownThemeError(f"Unknown theme {name!r}; available: {', '.join(self.names())}")
+        return theme
+
+    def unregister(self, name):
+        """Remove a theme, if registered."""
+        with self._lock:
+            self._themes.pop(name, None)
+
+    def names(self):
+        """
+        Get the registered theme names.
+
+        Returns:
+            list: Sorted names
+        """
+        return sorted(self._themes)
+
+    def __contains__(self, name):
+        return name in self._themes
+
+
+# Process-wide registry; the built-in themes are registered by task_generator
+REGISTRY = ThemeRegistry()
+
+
+def configure_from_settings(settings):
+    """
+    Register the MISSION_THEMES and MISSION_THEME_FILES of the settings.
+
+    Args:
+        settings: Django settings object
+
+    Raises:
+        ValueError: If a theme is malformed, so misconfiguration fails at startup
+    """
+    for name, entries in getattr(settings, 'MISSION_THEMES', {}).items():
+        REGISTRY.add(parse_theme_spec(name, entries))
+
+    for path in getattr(settings, 'MISSION_THEME_FILES', ()):
+        names = REGISTRY.load_file(path)
+        logger.info(f"Loaded mission themes {names} from {path}")
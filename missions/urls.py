@@ -1,9 +1,12 @@
 from django.urls import path
-from .views import MissionBoardView, TaskListAPI
+from .views import MissionBoardView, TaskListAPI, ClassifyTasksAPI, MetricsView, ReadinessView
 
 app_name = 'missions'
 
 urlpatterns = [
     path('', MissionBoardView.as_view(), name='home'),
     path('api/tasks/', TaskListAPI.as_view(), name='get_tasks'),
+    path('api/tasks/classify/', ClassifyTasksAPI.as_view(), name='classify_tasks'),
+    path('api/metrics', MetricsView.as_view(), name='metrics'),
+    path('healthz/ready', ReadinessView.as_view(), name='ready'),
 ]
\ No newline at end of file
@@ -1,12 +1,146 @@
+import json
+import asyncio
+
 from django.views import View
 from django.views.generic import TemplateView
-from django.http import JsonResponse
-from .task_generator import generate_tasks
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils.cache import patch_cache_control
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt
+from .task_generator import (
+    generate_tasks, generate_tasks_async, iter_task_chunks, add_task_metadata,
+    MISSION_TEMPLATES, THEMES
+)
+from .themes import UnknownThemeError
+from .async_swapi import load_name_pools_async
+from . import metrics, swapi, mission_buffer, serializers, warmup
+from .resilience import deadline
+
+# Default number of missions per request
+DEFAULT_TASK_COUNT = 5
+# Upper bound for ?count=
+MAX_TASK_COUNT = 10_000_000
+# Larger responses (or ?format=ndjson) are streamed as NDJSON
+STREAM_THRESHOLD = 1000
+# Upper bound for missions classified in one request
+MAX_CLASSIFY_TASKS = 10_000
+# Seeded responses are reproducible and may be cached by clients and CDNs
+SEEDED_CACHE_MAX_AGE = 3600
+
+
+def _ndjson_chunks(count, seed=None, theme=None):
+    """Encode bulk missions as NDJSON, one bytes chunk per rendered batch."""
+    for chunk in iter_task_chunks(count, seed=seed, theme=theme):
+        yield serializers.encode_ndjson(chunk)
+
+
+async def _ndjson_chunks_async(count, seed=None, theme=None):
+    """Async variant of _ndjson_chunks so ASGI servers stream without buffering."""
+    for chunk in _ndjson_chunks(count, seed, theme):
+        yield chunk
+        await asyncio.sleep(0)  # Let other requests run between batches
+
+
+def _json_response(body):
+    """Wrap pre-encoded JSON bytes in a response."""
+    return HttpResponse(body, content_type='application/json')
+
+
+def _render_tasks(count, seed=None, theme=None):
+    """Generate count missions: distinct templates when few enough, bulk otherwise."""
+    if theme is not None:
+        return [task for chunk in iter_task_chunks(count, seed=seed, theme=theme) for task in chunk]
+    if count <= len(MISSION_TEMPLATES):
+        return generate_tasks(count, seed)
+    return [task for chunk in iter_task_chunks(count, seed=seed) for task in chunk]
+
 
 class MissionBoardView(TemplateView):
     template_name = "missions/index.html"
 
 class TaskListAPI(View):
+    async def get(self, request, *args, **kwargs):
+        try:
+            count = int(request.GET.get('count', DEFAULT_TASK_COUNT))
+            seed = request.GET.get('seed')
+            seed = int(seed) if seed is not None else None
+        except ValueError:
+            return JsonResponse({'error': "count and seed must be integers"}, status=400)
+
+        if not 1 <= count <= MAX_TASK_COUNT:
+            return JsonResponse({'error': f"count must be between 1 and {MAX_TASK_COUNT}"}, status=400)
+
+        theme = request.GET.get('theme')
+        if theme is not None:
+            try:
+                THEMES.get(theme)
+            except UnknownThemeError as e:
+                return JsonResponse({'error': str(e), 'themes': THEMES.names()}, status=400)
+
+        # Streamed bodies are produced after this returns, so only setup is timed.
+        # The deadline bounds the time spent waiting for SWAPI.
+        with metrics.TASK_REQUEST_DURATION.time(), deadline(swapi.REQUEST_DEADLINE):
+            response = await self.build_response(request, count, seed, theme)
+
+        if seed is not None:
+            patch_cache_control(response, public=True, max_age=SEEDED_CACHE_MAX_AGE)
+        return response
+
+    async def build_response(self, request, count, seed, theme=None):
+        stream = count > STREAM_THRESHOLD or request.GET.get('format') == 'ndjson'
+
+        if not stream and seed is None and theme is None and count <= len(MISSION_TEMPLATES):
+            # Few enough for distinct templates, as in the default response;
+            # default responses come pre-generated when the buffer is on
+            tasks = mission_buffer.take(count)
+            if tasks is None:
+                tasks = await generate_tasks_async(count)
+            return _json_response(serializers.encode_tasks(tasks))
+
+        await load_name_pools_async()
+
+        if not stream:
+            if seed is None:
+                return _json_response(serializers.encode_tasks(_render_tasks(count, theme=theme)))
+            # Seeded responses only change with the catalog, so their bytes are kept
+            key = serializers.seeded_cache_key(count, seed, theme)
+            return _json_response(serializers.get_or_encode(
+                key, lambda: serializers.encode_tasks(_render_tasks(count, seed, theme))
+            ))
+
+        if isinstance(request, ASGIRequest):
+            content = _ndjson_chunks_async(count, seed, theme)
+        else:
+            content = _ndjson_chunks(count, seed, theme)
+
+        return StreamingHttpResponse(content, content_type='application/x-ndjson')
+
+
+# Classification has no side effects, so API clients need no CSRF token
+@method_decorator(csrf_exempt, name='dispatch')
+class ClassifyTasksAPI(View):
+    def post(self, request, *args, **kwargs):
+        try:
+            tasks = json.loads(request.body)['tasks']
+        except (ValueError, KeyError, TypeError):
+            return JsonResponse({'error': 'Expected a JSON body like {"tasks": ["..."]}'}, status=400)
+
+        if not isinstance(tasks, list) or not all(isinstance(task, str) for task in tasks):
+            return JsonResponse({'error': "tasks must be a list of strings"}, status=400)
+
+        if len(tasks) > MAX_CLASSIFY_TASKS:
+            return JsonResponse({'error': f"At most {MAX_CLASSIFY_TASKS} tasks per request"}, status=400)
+
+        return _json_response(serializers.dumps({'tasks': add_task_metadata(tasks)}))
+
+
+class MetricsView(View):
+    def get(self, request, *args, **kwargs):
+        return HttpResponse(metrics.render(), content_type=metrics.CONTENT_TYPE)
+
+
+class ReadinessView(View):
     def get(self, request, *args, **kwargs):
-        tasks = generate_tasks()
-        return JsonResponse({'tasks': tasks})
\ No newline at end of file
+        report = warmup.status()
+        return JsonResponse(report, status=200 if report['ready'] else 503)
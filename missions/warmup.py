@@ -0,0 +1,225 @@
+import os
+import time
+import threading
+import logging
+
+from . import swapi, metrics, mission_buffer
+from .snapshot import load_snapshot, SnapshotError
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Load the name pools in the background when the app starts
+WARMUP_ENABLED = False
+# Seconds between attempts while SWAPI (and the snapshot) are unavailable
+WARMUP_RETRY_INTERVAL = 30
+# Snapshot used when upstream cannot be crawled (see `manage.py swapi_sync`)
+SNAPSHOT_PATH = None
+
+# Management commands that serve requests, and so should be warm
+SERVING_COMMANDS = ('runserver',)
+
+# Warm-up states
+DISABLED = 'disabled'
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+
+_STATE = {'status': DISABLED, 'attempts': 0, 'source': None, 'seconds': None}
+_STATE_LOCK = threading.Lock()
+_THREAD = None
+_STOP = threading.Event()
+
+
+def should_warm_up(argv, environ=os.environ):
+    """
+    Check whether this process serves requests and should warm up.
+
+    Management commands other than runserver (migrate, test, swapi_sync, ...)
+    skip the warm-up, as do the runserver autoreloader parent process,
+    `python -c` one-offs and pytest.
+
+    Args:
+        argv (list): Command line of the process (sys.argv)
+        environ (dict): Environment variables
+
+    Returns:
+        bool: True for WSGI/ASGI servers and the runserver child process
+    """
+    if not argv or argv[0] == '-c':
+        return False
+
+    program = os.path.basename(argv[0])
+    if program not in ('manage.py', 'django-admin', 'django-admin.py'):
+        return 'pytest' not in argv[0]
+
+    command = argv[1] if len(argv) > 1 else None
+    if command not in SERVING_COMMANDS:
+        return False
+    return environ.get('RUN_MAIN') == 'true' or '--noreload' in argv
+
+
+def snapshot_pools(path):
+    """
+    Build name pools from a catalog snapshot.
+
+    Args:
+        path (str): Snapshot file written by `manage.py swapi_sync`
+
+    Returns:
+        dict: Mapping of entity type to names (empty if unreadable)
+    """
+    try:
+        catalog = load_snapshot(path)
+    except SnapshotError as e:
+        logger.warning(f"Warm-up cannot use snapshot: {e}")
+        return {}
+
+    pools = {}
+    for entity_type, endpoint in swapi.ENTITY_ENDPOINTS.items():
+        pool = swapi.build_name_pool(catalog.get(endpoint, []))
+        if pool:
+            pools[entity_type] = pool
+    return pools
+
+
+def warm_up():
+    """
+    Load every name pool once, from the catalog or else from the snapshot.
+
+    The catalog is the offline snapshot in offline mode and SWAPI otherwise.
+    Pools installed from the snapshot go stale after CACHE_TTL, so they are
+    replaced by upstream data once SWAPI is back.
+
+    Returns:
+        str: Where the pools came from ('catalog' or 'snapshot'), or None
+            if some are still missing
+    """
+    for entity_type in swapi.ENTITY_ENDPOINTS:
+        try:
+            swapi.get_name_pool(entity_type)
+        except Exception as e:
+            logger.error(f"Warm-up failed to load {entity_type} names: {e}")
+
+    if swapi.name_pools_loaded():
+        return 'catalog'
+
+    if SNAPSHOT_PATH and os.path.exists(SNAPSHOT_PATH):
+        missing = {
+            entity_type: names for entity_type, names in snapshot_pools(SNAPSHOT_PATH).items()
+            if swapi.get_fresh_name_pool(entity_type) is None
+        }
+        swapi.install_name_pools(missing, ttl=swapi.CACHE_TTL or None)
+        if swapi.name_pools_loaded():
+            return 'snapshot'
+
+    return None
+
+
+def _run():
+    started = time.monotonic()
+
+    while not _STOP.is_set():
+        with _STATE_LOCK:
+            _STATE['attempts'] += 1
+
+        source = warm_up()
+        if source is not None:
+            seconds = round(time.monotonic() - started, 3)
+            with _STATE_LOCK:
+                _STATE.update(status=DONE, source=source, seconds=seconds)
+            logger.info(f"Warm-up loaded the name pools from the {source} in {seconds}s")
+
+            # Fill the mission buffer now rather than on the first request
+            buffer = mission_buffer.get_buffer()
+            if buffer is not None:
+                buffer.start()
+            return
+
+        logger.warning(f"Warm-up incomplete, retrying in {WARMUP_RETRY_INTERVAL}s")
+        _STOP.wait(WARMUP_RETRY_INTERVAL)
+
+
+def start():
+    """
+    Start warming up in a daemon thread, if not already started.
+
+    Returns:
+        threading.Thread: The warm-up thread
+    """
+    global _THREAD
+
+    with _STATE_LOCK:
+        if _THREAD is not None and _THREAD.is_alive():
+            return _THREAD
+        _STOP.clear()
+        _STATE.update(status=RUNNING, attempts=0, source=None, seconds=None)
+        _THREAD = threading.Thread(target=_run, name='swapi-warmup', daemon=True)
+        _THREAD.start()
+
+    logger.info("Warming up the name pools in the background")
+    return _THREAD
+
+
+def stop(timeout=None):
+    """Stop retrying and wait for the warm-up thread."""
+    _STOP.set()
+    thread = _THREAD
+    if thread is not None:
+        thread.join(timeout)
+
+
+def is_ready():
+    """
+    Check whether this worker can serve missions without a cold crawl.
+
+    Returns:
+        bool: True once every name pool is loaded, or always when the
+            warm-up is disabled (nothing to wait for)
+    """
+    if not WARMUP_ENABLED:
+        return True
+    return swapi.name_pools_loaded()
+
+
+def status():
+    """
+    Get the readiness and warm-up progress.
+
+    Returns:
+        dict: Readiness report
+    """
+    with _STATE_LOCK:
+        state = dict(_STATE)
+    return {
+        'ready': is_ready(),
+        'warmup': state,
+        'name_pools': {
+            entity_type: len(swapi.get_fresh_name_pool(entity_type) or ())
+            for entity_type in swapi.ENTITY_ENDPOINTS
+        }
+    }
+
+
+def configure_from_settings(settings):
+    """
+    Apply SWAPI_WARMUP* settings; the warm-up itself is started by the app.
+
+    Args:
+        settings: Django settings object
+    """
+    global WARMUP_ENABLED, WARMUP_RETRY_INTERVAL, SNAPSHOT_PATH
+
+    WARMUP_ENABLED = getattr(settings, 'SWAPI_WARMUP', WARMUP_ENABLED)
+    WARMUP_RETRY_INTERVAL = getattr(settings, 'SWAPI_WARMUP_RETRY_INTERVAL', WARMUP_RETRY_INTERVAL)
+    SNAPSHOT_PATH = getattr(settings, 'SWAPI_SNAPSHOT_PATH', SNAPSHOT_PATH)
+
+    with _STATE_LOCK:
+        if _STATE['status'] == DISABLED and WARMUP_ENABLED:
+            _STATE['status'] = PENDING
+
+
+@metrics.REGISTRY.register_collector
+def _collect_readiness_metrics():
+    """Report whether this worker is ready."""
+    yield 'missions_ready', 'gauge', "1 once the name pools are loaded and the worker is ready.", int(is_ready())